@@ -12,6 +12,9 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         USB enumerator backend setting
+#
 ##############################################################################
 
 config_data = {
@@ -55,5 +58,6 @@ config_data = {
        "screen": {"pos": [], "size": []},
        "wdialog": False,
        "msudp": {"uname": None, "pwd": None},
+       "usbenum": {"backend": "default"},
        "rpanel": {"dut1": True, "dut2": True, "u4tree": True}
 }
@@ -0,0 +1,451 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+# Module: devAsync.py
+#
+# Description:
+#     asyncio client for the Control Computer server
+#     Connect once, then await switch commands, e.g. from a headless
+#     script driving many remote switches with asyncio.gather
+#     No wx dependency, requests are built by devClient
+#
+# Author:
+#     Vinay N, MCCI Corporation Feb 2026
+#
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+# Built-in imports
+import asyncio
+
+# Lib imports
+# (None)
+
+# Own modules
+import devClient
+import nwFrame
+
+class CcAsyncClient:
+    """
+    A pipelined asyncio connection to one Control Computer server.
+
+    Requests are tagged with an id like devClient.CcSession, so any
+    number of commands can be awaited on the same connection at once.
+    The server runs the commands of one connection in order, to drive
+    many Control Computers concurrently open one client per server
+    and gather across them.
+    Command methods return the "data" of the server reply, e.g.
+    [0, "5.0"] for volts. Errors of the switch itself come back in
+    the data as with devControl, a lost connection raises
+    ConnectionError.
+
+    Usage:
+        async with CcAsyncClient(host, port) as cc:
+            await cc.port_on("COM5", 1)
+            volts = await cc.volts("COM5")
+    """
+    def __init__(self, host, port, timeout=devClient.REQUEST_TIMEOUT):
+        """
+        Args:
+            host: host ipaddress.
+            port: server port number.
+            timeout: seconds to wait for a connection or a reply
+        Returns:
+            None
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+        self.reader_task = None
+        self.enc = nwFrame.ENC_JSON
+        self.next_id = 0
+        self.pending = {}
+        self.streams = {}
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def connect(self):
+        """
+        Open the connection, agree on the message encoding
+        and start reading replies.
+
+        Args:
+            None
+        Returns:
+            None
+        """
+        self.reader, self.writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout)
+        msg = nwFrame.hello_request()
+        msg["id"] = 0
+        try:
+            self.writer.write(nwFrame.encode_frame(msg))
+            await self.writer.drain()
+            rcvdict = await asyncio.wait_for(self.read_frame(), self.timeout)
+        except BaseException:
+            self.writer.close()
+            self.writer = None
+            raise
+        self.enc = nwFrame.get_reply_encoding(rcvdict)
+        self.reader_task = asyncio.ensure_future(self.read_replies())
+
+    async def read_frame(self):
+        """
+        Read one framed message.
+
+        Args:
+            None
+        Returns:
+            dict: message, None if the server closed the connection
+        """
+        try:
+            header = await self.reader.readexactly(nwFrame.FRAME_HEADER.size)
+            size, packed = nwFrame.decode_header(header)
+            payload = await self.reader.readexactly(size)
+        except asyncio.IncompleteReadError:
+            return None
+        return nwFrame.decode_payload(payload, packed)
+
+    async def read_replies(self):
+        """
+        Reader task, hands every reply to the Future with its id
+        and every pushed stream frame to its callback.
+
+        Args:
+            None
+        Returns:
+            None
+        """
+        try:
+            while True:
+                rcvdict = await self.read_frame()
+                if rcvdict is None:
+                    break
+                if "stream" in rcvdict and "id" not in rcvdict:
+                    stream_cb = self.streams.get(rcvdict["stream"])
+                    if stream_cb is not None:
+                        stream_cb(rcvdict)
+                    continue
+                fut = self.pending.pop(rcvdict.pop("id", None), None)
+                if fut is not None and not fut.done():
+                    fut.set_result(rcvdict)
+        except (OSError, ValueError):
+            pass
+        self.fail_pending()
+
+    def fail_pending(self):
+        """
+        Fail every outstanding request, every stream callback
+        gets a final frame with an error.
+
+        Args:
+            None
+        Returns:
+            None
+        """
+        pending = list(self.pending.values())
+        self.pending.clear()
+        streams = list(self.streams.items())
+        self.streams.clear()
+        for fut in pending:
+            if not fut.done():
+                fut.set_exception(ConnectionError("CC session closed"))
+        for sid, stream_cb in streams:
+            stream_cb({"stream": sid, "error": "CC session closed"})
+
+    async def close(self):
+        """
+        Close the connection.
+
+        Args:
+            None
+        Returns:
+            None
+        """
+        if self.writer is None:
+            return
+        self.writer.close()
+        if self.reader_task is not None:
+            self.reader_task.cancel()
+            try:
+                await self.reader_task
+            except asyncio.CancelledError:
+                pass
+        self.fail_pending()
+        self.writer = None
+
+    async def request(self, reqdict, stream_cb=None):
+        """
+        Send a request and wait for its reply.
+
+        Args:
+            reqdict: request with dict
+            stream_cb: called with every frame the server
+                pushes for this request
+        Returns:
+            dict: reply from the server
+        """
+        if self.writer is None or self.reader_task.done():
+            raise ConnectionError("CC session closed")
+        self.next_id += 1
+        rid = self.next_id
+        fut = asyncio.get_running_loop().create_future()
+        self.pending[rid] = fut
+        if stream_cb is not None:
+            self.streams[rid] = stream_cb
+        msg = dict(reqdict)
+        msg["id"] = rid
+        try:
+            self.writer.write(nwFrame.encode_frame(msg, self.enc))
+            await self.writer.drain()
+            return await asyncio.wait_for(fut, self.timeout)
+        except Exception:
+            self.pending.pop(rid, None)
+            self.streams.pop(rid, None)
+            raise
+
+    async def command(self, reqdict):
+        """
+        Send a request and return the data of its reply.
+
+        Args:
+            reqdict: request with dict
+        Returns:
+            data of the reply
+        """
+        rcvdict = await self.request(reqdict)
+        return rcvdict.get("data")
+
+    async def search(self):
+        """
+        Search the switches attached to the Control Computer.
+
+        Args:
+            None
+        Returns:
+            dict: device list reply
+        """
+        reqdict = {}
+        reqdict["ctype"] = "device"
+        reqdict["cmd"] = "search"
+        return await self.request(reqdict)
+
+    async def open_serial(self, swname, sport, baud):
+        """
+        Open a serial switch on the Control Computer.
+
+        Args:
+            swname: switch model name, e.g. "3201"
+            sport: serial port of the switch
+            baud: baudrate of serial device
+        Returns:
+            str: "success" or "fail"
+        """
+        reqdict = {}
+        reqdict["ctype"] = "device"
+        reqdict["cmd"] = "open"
+        reqdict["itype"] = "serial"
+        reqdict["swname"] = swname
+        reqdict["port"] = sport
+        reqdict["baud"] = str(baud)
+        return await self.command(reqdict)
+
+    async def open_usb(self, sport):
+        """
+        Open a USB (2101) switch on the Control Computer.
+
+        Args:
+            sport: port of the switch
+        Returns:
+            str: "success" or "fail"
+        """
+        reqdict = {}
+        reqdict["ctype"] = "device"
+        reqdict["itype"] = "usb"
+        reqdict["cmd"] = "open"
+        reqdict["port"] = sport
+        return await self.command(reqdict)
+
+    async def close_device(self, sport):
+        """
+        Close a switch on the Control Computer.
+
+        Args:
+            sport: port of the switch
+        Returns:
+            str: "success" or "fail"
+        """
+        reqdict = {}
+        reqdict["ctype"] = "device"
+        reqdict["cmd"] = "close"
+        reqdict["port"] = sport
+        return await self.command(reqdict)
+
+    async def port_on(self, swid, pno):
+        """
+        Switch a port on.
+
+        Args:
+            swid: switch port
+            pno: port number
+        Returns:
+            switch reply
+        """
+        return await self.command(
+            devClient.port_cmd_req(swid + ",ON," + str(pno)))
+
+    async def port_off(self, swid, pno=0):
+        """
+        Switch the port off.
+
+        Args:
+            swid: switch port
+            pno: port number
+        Returns:
+            switch reply
+        """
+        return await self.command(
+            devClient.port_cmd_req(swid + ",OFF," + str(pno)))
+
+    async def control_port(self, swid, opr):
+        """
+        Control the port of a USB (2101) switch.
+
+        Args:
+            swid: switch port
+            opr: "off" or the port to switch on
+        Returns:
+            str: switch reply
+        """
+        return await self.command(
+            devClient.control_port_req(swid + "," + str(opr)))
+
+    async def read_port(self, swid):
+        """
+        Read the port status of a switch.
+
+        Args:
+            swid: switch port
+        Returns:
+            switch reply
+        """
+        return await self.command(devClient.read_port_req(swid))
+
+    async def status(self, swid):
+        """
+        Read the status of a switch.
+
+        Args:
+            swid: switch port
+        Returns:
+            switch reply
+        """
+        return await self.command(devClient.status_req(swid))
+
+    async def speed(self, swid, speed):
+        """
+        Set the speed of a switch.
+
+        Args:
+            swid: switch port
+            speed: speed setting
+        Returns:
+            switch reply
+        """
+        return await self.command(
+            devClient.speed_req(swid + "," + str(speed)))
+
+    async def volts(self, swid):
+        """
+        Read the VBUS voltage of a switch.
+
+        Args:
+            swid: switch port
+        Returns:
+            switch reply
+        """
+        return await self.command(devClient.volts_req(swid))
+
+    async def amps(self, swid):
+        """
+        Read the VBUS current of a switch.
+
+        Args:
+            swid: switch port
+        Returns:
+            switch reply
+        """
+        return await self.command(devClient.amps_req(swid))
+
+    async def batch(self, cmds):
+        """
+        Run several commands in one round trip. A server
+        without batch support is sent the commands pipelined
+        instead.
+
+        Args:
+            cmds: list of (name, arg) tuples, name is a
+                devClient.BATCH_REQS key
+        Returns:
+            list: data of each command, in order
+        """
+        reqlist = [devClient.BATCH_REQS[name](arg) for name, arg in cmds]
+        reqdict = {}
+        reqdict["ctype"] = "batch"
+        reqdict["cmd"] = "run"
+        reqdict["cmds"] = reqlist
+        results = await self.command(reqdict)
+        if (not isinstance(results, list) or len(results) != len(reqlist) or
+                not all(isinstance(rcvdict, dict) for rcvdict in results)):
+            return list(await asyncio.gather(
+                *[self.command(req) for req in reqlist]))
+        return [rcvdict.get("data") for rcvdict in results]
+
+    async def subscribe_va(self, swid, rate, callback):
+        """
+        Subscribe to the volts/amps stream of a switch. The
+        callback runs in the event loop with every pushed frame,
+        see devClient.subscribe_va for the frame contents.
+
+        Args:
+            swid: switch port
+            rate: sampling rate in Hz
+            callback: called with every frame
+        Returns:
+            sid: stream id, None if the subscription failed
+        """
+        reqdict = {}
+        reqdict["ctype"] = "stream"
+        reqdict["cmd"] = "subscribe"
+        reqdict["port"] = swid
+        reqdict["rate"] = rate
+        rid = self.next_id + 1
+        rcvdict = await self.request(reqdict, callback)
+        if rcvdict.get("data") != "success":
+            self.streams.pop(rid, None)
+            return None
+        return rcvdict["stream"]
+
+    async def unsubscribe_va(self, sid):
+        """
+        Stop a volts/amps stream.
+
+        Args:
+            sid: stream id
+        Returns:
+            str: "success"
+        """
+        self.streams.pop(sid, None)
+        reqdict = {}
+        reqdict["ctype"] = "stream"
+        reqdict["cmd"] = "unsubscribe"
+        reqdict["stream"] = sid
+        return await self.command(reqdict)
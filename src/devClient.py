@@ -14,48 +14,353 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Persistent pipelined session, batch and stream requests
+#         Negotiated msgpack/JSON message encoding
+#
 ##############################################################################
 # Built-in imports
 import socket
-import json
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
 
 # Lib imports
 # (None)
 
 # Own modules
-# (None)
+import nwFrame
 
-def send_request(host, port, reqdict):
+# Seconds to wait for a reply before giving up on the request
+REQUEST_TIMEOUT = 20
+
+class CcSession:
+    """
+    A long-lived, pipelined connection to one Control Computer server.
+
+    Every request is tagged with an id. A reader thread matches the
+    replies back to the waiting callers by that id, so several requests
+    can be outstanding on the same socket at once. Frames pushed by a
+    stream subscription are handed to the callback of that stream.
     """
-    sending the request with same port number
+    def __init__(self, host, port):
+        """
+        Open the connection and start the reader thread.
+
+        Args:
+            host: host ipaddress.
+            port: server port number.
+        Returns:
+            None
+        """
+        self.host = host
+        self.port = port
+        self.sock = socket.create_connection((host, port), REQUEST_TIMEOUT)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self.enc = self.negotiate()
+        self.sock.settimeout(None)
+        self.alive = True
+        self.next_id = 0
+        self.pending = {}
+        self.streams = {}
+        self.lock = threading.Lock()
+        self.send_lock = threading.Lock()
+        self.reader = threading.Thread(target=self.read_replies,
+                                       name="CcSessionReader", daemon=True)
+        self.reader.start()
+
+    def negotiate(self):
+        """
+        Agree on the message encoding before the reader starts.
+        An older server answers the hello as an invalid command
+        and the session stays on JSON.
+
+        Args:
+            None
+        Returns:
+            str: encoding of the session
+        """
+        msg = nwFrame.hello_request()
+        msg["id"] = 0
+        try:
+            nwFrame.send_frame(self.sock, msg)
+            rcvdict = nwFrame.recv_frame(self.sock)
+        except (OSError, ValueError):
+            self.sock.close()
+            raise
+        return nwFrame.get_reply_encoding(rcvdict)
+
+    def submit(self, reqdict, stream_cb=None):
+        """
+        Send a request without waiting for its reply.
+
+        Args:
+            reqdict: request with dict
+            stream_cb: called from the reader thread with every
+                frame the server pushes for this request
+        Returns:
+            Future: resolved with the reply dict
+        """
+        fut = Future()
+        with self.lock:
+            if not self.alive:
+                raise ConnectionError("CC session closed")
+            self.next_id += 1
+            rid = self.next_id
+            self.pending[rid] = fut
+            if stream_cb is not None:
+                self.streams[rid] = stream_cb
+        fut.rid = rid
+        msg = dict(reqdict)
+        msg["id"] = rid
+        try:
+            with self.send_lock:
+                nwFrame.send_frame(self.sock, msg, self.enc)
+        except OSError:
+            self.close()
+            raise
+        return fut
+
+    def request(self, reqdict):
+        """
+        Send a request and wait for its reply.
+
+        Args:
+            reqdict: request with dict
+        Returns:
+            dict: reply from the server
+        """
+        return self.wait(self.submit(reqdict))
+
+    def wait(self, fut):
+        """
+        Wait for the reply of a submitted request. A request that
+        times out is dropped, the session and the other requests
+        on it stay.
+
+        Args:
+            fut: Future returned by submit()
+        Returns:
+            dict: reply from the server
+        """
+        try:
+            return fut.result(REQUEST_TIMEOUT)
+        except FutureTimeout:
+            self.drop(fut)
+            raise
+
+    def drop(self, fut):
+        """
+        Forget a request, a late reply to it is ignored.
+
+        Args:
+            fut: Future returned by submit()
+        Returns:
+            None
+        """
+        with self.lock:
+            self.pending.pop(fut.rid, None)
+            self.streams.pop(fut.rid, None)
+
+    def read_replies(self):
+        """
+        Reader thread, hands every reply to the Future with its id.
+
+        Args:
+            None
+        Returns:
+            None
+        """
+        try:
+            while True:
+                rcvdict = nwFrame.recv_frame(self.sock)
+                if rcvdict is None:
+                    break
+                if "stream" in rcvdict and "id" not in rcvdict:
+                    stream_cb = self.streams.get(rcvdict["stream"])
+                    if stream_cb is not None:
+                        stream_cb(rcvdict)
+                    continue
+                rid = rcvdict.pop("id", None)
+                with self.lock:
+                    fut = self.pending.pop(rid, None)
+                if fut is not None:
+                    fut.set_result(rcvdict)
+        except (OSError, ValueError):
+            pass
+        self.close()
+
+    def drop_stream(self, sid):
+        """
+        Stop handing pushed frames of a stream to its callback.
+
+        Args:
+            sid: stream id
+        Returns:
+            None
+        """
+        with self.lock:
+            self.streams.pop(sid, None)
+
+    def close(self):
+        """
+        Close the connection and fail every outstanding request.
+        Every stream callback gets a final frame with an error.
+
+        Args:
+            None
+        Returns:
+            None
+        """
+        with self.lock:
+            if not self.alive:
+                return
+            self.alive = False
+            pending = list(self.pending.values())
+            self.pending.clear()
+            streams = list(self.streams.items())
+            self.streams.clear()
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        for fut in pending:
+            if not fut.done():
+                fut.set_exception(ConnectionError("CC session closed"))
+        for sid, stream_cb in streams:
+            stream_cb({"stream": sid, "error": "CC session closed"})
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+# One lock per host/port, held while its session connects
+_connect_locks = {}
+
+def get_session(host, port):
+    """
+    Return the open session for host/port, connecting if needed.
+    Only one thread connects to a host/port at a time.
 
     Args:
         host: host ipaddress.
-        port: send with port number
-        reqdict: request with dict
+        port: server port number.
+    Returns:
+        tuple: (session, True if the session was reused)
+    """
+    key = (host, port)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is not None and session.alive:
+            return session, True
+        connect_lock = _connect_locks.setdefault(key, threading.Lock())
+    # Connect outside _sessions_lock, other hosts are not held up
+    with connect_lock:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is not None and session.alive:
+                return session, True
+        session = CcSession(host, port)
+        with _sessions_lock:
+            _sessions[key] = session
+        return session, False
+
+def close_sessions():
+    """
+    Close every open CC session.
+
+    Args:
+        None
+    Returns:
+        None
+    """
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+def make_result(rcvdict):
+    """
+    Wrap a server reply into the result dict used by devControl.
+
+    Args:
+        rcvdict: reply dict, None if the request failed
     Returns:
         rdict: its shows the status fail and Ok
     """
-    cs =  socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    cs.settimeout(20)
     rdict = {}
     rlist = []
     sdict = {}
-    try:
-        result = cs.connect((host, port))
-        data= json.dumps(reqdict)
-        cs.send(data.encode('utf-8'))
-        rcvdata = cs.recv(1024)
-        rcvdict = json.loads(rcvdata.decode())
+    if rcvdict is None:
+        sdict["status"] = "fail"
+        rlist.append(sdict)
+    else:
         sdict["status"] = "OK"
         rlist.append(sdict)
         rlist.append(rcvdict)
-    except:
-        sdict["status"] = "fail"
-        rlist.append(sdict)
     rdict["result"] = rlist
     return rdict
 
+def send_request(host, port, reqdict):
+    """
+    sending the request over the persistent session for host/port.
+    A reused session found dead before the request was written is
+    reopened once. A request that was written is never sent again,
+    the switch may have run it already.
+
+    Args:
+        host: host ipaddress.
+        port: send with port number
+        reqdict: request with dict
+    Returns:
+        rdict: its shows the status fail and Ok
+    """
+    rcvdict = None
+    for _ in range(2):
+        try:
+            session, reused = get_session(host, port)
+        except OSError:
+            break
+        try:
+            fut = session.submit(reqdict)
+        except OSError:
+            # ConnectionError included, nothing was sent
+            if not reused:
+                break
+            continue
+        try:
+            rcvdict = session.wait(fut)
+        except Exception:
+            pass
+        break
+    return make_result(rcvdict)
+
+def send_requests(host, port, reqlist):
+    """
+    Pipeline several requests over one session and
+    collect the replies in request order.
+
+    Args:
+        host: host ipaddress.
+        port: send with port number
+        reqlist: list of request dicts
+    Returns:
+        list: one rdict per request
+    """
+    try:
+        session, reused = get_session(host, port)
+        futs = [session.submit(reqdict) for reqdict in reqlist]
+    except Exception:
+        return [make_result(None) for reqdict in reqlist]
+    results = []
+    for fut in futs:
+        try:
+            results.append(make_result(session.wait(fut)))
+        except Exception:
+            results.append(make_result(None))
+    return results
+
 def get_device_list(host, port):
     """
     get the device list with connecting server 
@@ -127,6 +432,21 @@ def close_serial_device(host, port, sport):
     reqdict["port"] = sport
     return send_request(host, port, reqdict)
 
+def port_cmd_req(cmd):
+    """
+    build the port command request
+    Args:
+        cmd: cmd with send control , serial, switching.
+    Returns:
+        reqdict: request with dict
+    """
+    reqdict = {}
+    reqdict["ctype"] = "control"
+    reqdict["itype"] = "serial"
+    reqdict["cmd"] = "switch"
+    reqdict["stat"] = cmd
+    return reqdict
+
 def send_port_cmd(host, port, cmd):
     """
     sending the port command
@@ -138,12 +458,22 @@ def send_port_cmd(host, port, cmd):
     Returns:
         send_request(host, port, reqdict)
     """
+    return send_request(host, port, port_cmd_req(cmd))
+
+def read_port_req(swid):
+    """
+    build the read port request
+    Args:
+        swid: switch port
+    Returns:
+        reqdict: request with dict
+    """
     reqdict = {}
     reqdict["ctype"] = "control"
     reqdict["itype"] = "serial"
-    reqdict["cmd"] = "switch"
-    reqdict["stat"] = cmd
-    return send_request(host, port, reqdict)
+    reqdict["port"] = swid
+    reqdict["cmd"] = "read"
+    return reqdict
 
 def read_port_cmd(host, port, swid):
     """
@@ -154,13 +484,22 @@ def read_port_cmd(host, port, swid):
     Returns:
         send_request(host, port, reqdict)
     """
+    return send_request(host, port, read_port_req(swid))
+
+def status_req(swid):
+    """
+    build the serial status request
+    Args:
+        swid: switch port
+    Returns:
+        reqdict: request with dict
+    """
     reqdict = {}
     reqdict["ctype"] = "control"
     reqdict["itype"] = "serial"
+    reqdict["cmd"] = "status"
     reqdict["port"] = swid
-    reqdict["cmd"] = "read"
-    
-    return send_request(host, port, reqdict)
+    return reqdict
 
 def send_status_cmd(host, port, swid):
     """
@@ -171,12 +510,24 @@ def send_status_cmd(host, port, swid):
     Returns:
         send_request(host, port, reqdict)
     """
+    return send_request(host, port, status_req(swid))
+
+def speed_req(cmd):
+    """
+    build the speed request
+    Args:
+        cmd: "swid,speed"
+    Returns:
+        reqdict: request with dict
+    """
+    swid, speed = cmd.split(',')
     reqdict = {}
     reqdict["ctype"] = "control"
     reqdict["itype"] = "serial"
-    reqdict["cmd"] = "status"
+    reqdict["cmd"] = "speed"
     reqdict["port"] = swid
-    return send_request(host, port, reqdict)
+    reqdict["speed"] = speed
+    return reqdict
 
 def send_speed_cmd(host, port, cmd):
     """
@@ -187,14 +538,22 @@ def send_speed_cmd(host, port, cmd):
     Returns:
         send_request(host, port, reqdict)
     """
-    swid, speed = cmd.split(',')
+    return send_request(host, port, speed_req(cmd))
+
+def volts_req(swid):
+    """
+    build the volts request
+    Args:
+        swid: switch port
+    Returns:
+        reqdict: request with dict
+    """
     reqdict = {}
     reqdict["ctype"] = "control"
     reqdict["itype"] = "serial"
-    reqdict["cmd"] = "speed"
+    reqdict["cmd"] = "volts"
     reqdict["port"] = swid
-    reqdict["speed"] = speed
-    return send_request(host, port, reqdict)
+    return reqdict
 
 def send_volts_cmd(host, port, swid):
     """
@@ -206,12 +565,22 @@ def send_volts_cmd(host, port, swid):
     Returns:
         send_request(host, port, reqdict)
     """
+    return send_request(host, port, volts_req(swid))
+
+def amps_req(swid):
+    """
+    build the amps request
+    Args:
+        swid: switch port
+    Returns:
+        reqdict: request with dict
+    """
     reqdict = {}
     reqdict["ctype"] = "control"
     reqdict["itype"] = "serial"
-    reqdict["cmd"] = "volts"
+    reqdict["cmd"] = "amps"
     reqdict["port"] = swid
-    return send_request(host, port, reqdict)
+    return reqdict
 
 def send_amps_cmd(host, port, swid):
     """
@@ -223,12 +592,21 @@ def send_amps_cmd(host, port, swid):
     Returns:
         send_request(host, port, reqdict)
     """
+    return send_request(host, port, amps_req(swid))
+
+def control_port_req(cmd):
+    """
+    build the usb port control request
+    Args:
+        cmd: "swid,opr"
+    Returns:
+        reqdict: request with dict
+    """
     reqdict = {}
     reqdict["ctype"] = "control"
-    reqdict["itype"] = "serial"
-    reqdict["cmd"] = "amps"
-    reqdict["port"] = swid
-    return send_request(host, port, reqdict)
+    reqdict["itype"] = "usb"
+    reqdict["cmd"] = cmd
+    return reqdict
 
 def control_port(host, port, cmd):
     """
@@ -240,8 +618,89 @@ def control_port(host, port, cmd):
     Returns:
         send_request(host, port, reqdict)
     """
+    return send_request(host, port, control_port_req(cmd))
+
+# Request builders usable inside a batch, by command name
+BATCH_REQS = {"port": port_cmd_req,
+              "read": read_port_req,
+              "status": status_req,
+              "speed": speed_req,
+              "volts": volts_req,
+              "amps": amps_req}
+
+def send_batch_cmd(host, port, cmds):
+    """
+    send several commands in one request, the server runs them
+    in order and returns all results in one reply. A server
+    without batch support is sent the commands pipelined instead.
+    Args:
+        host: host ipaddress.
+        port: send with port number
+        cmds: list of (name, arg) tuples, name is a BATCH_REQS key
+    Returns:
+        list: one rdict per command
+    """
+    reqlist = [BATCH_REQS[name](arg) for name, arg in cmds]
     reqdict = {}
-    reqdict["ctype"] = "control"
-    reqdict["itype"] = "usb"
-    reqdict["cmd"] = cmd
-    return send_request(host, port, reqdict)
\ No newline at end of file
+    reqdict["ctype"] = "batch"
+    reqdict["cmd"] = "run"
+    reqdict["cmds"] = reqlist
+    resdict = send_request(host, port, reqdict)
+    if resdict["result"][0]["status"] != "OK":
+        return [resdict for req in reqlist]
+    results = resdict["result"][1]["data"]
+    if (not isinstance(results, list) or len(results) != len(reqlist) or
+            not all(isinstance(rcvdict, dict) for rcvdict in results)):
+        return send_requests(host, port, reqlist)
+    return [make_result(rcvdict) for rcvdict in results]
+
+def subscribe_va(host, port, swid, rate, callback):
+    """
+    subscribe to the volts/amps stream of a switch. The server
+    samples at rate Hz and pushes frames holding a "samples" list
+    of [seconds, volts reply, amps reply], or an "error" once the
+    stream has ended.
+    Args:
+        host: host ipaddress.
+        port: send with port number
+        swid: switch port
+        rate: sampling rate in Hz
+        callback: called from the reader thread with every frame
+    Returns:
+        sid: stream id, None if the subscription failed
+    """
+    reqdict = {}
+    reqdict["ctype"] = "stream"
+    reqdict["cmd"] = "subscribe"
+    reqdict["port"] = swid
+    reqdict["rate"] = rate
+    try:
+        session, reused = get_session(host, port)
+        fut = session.submit(reqdict, callback)
+        rcvdict = session.wait(fut)
+    except Exception:
+        return None
+    if rcvdict.get("data") != "success":
+        session.drop_stream(fut.rid)
+        return None
+    return rcvdict["stream"]
+
+def unsubscribe_va(host, port, sid):
+    """
+    stop a volts/amps stream
+    Args:
+        host: host ipaddress.
+        port: send with port number
+        sid: stream id
+    Returns:
+        send_request(host, port, reqdict)
+    """
+    with _sessions_lock:
+        session = _sessions.get((host, port))
+    if session is not None:
+        session.drop_stream(sid)
+    reqdict = {}
+    reqdict["ctype"] = "stream"
+    reqdict["cmd"] = "unsubscribe"
+    reqdict["stream"] = sid
+    return send_request(host, port, reqdict)
@@ -14,9 +14,12 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Commands to a local switch serialized by a lock per switch
+#
 ##############################################################################
 # Built-in imports
-# (None)
+import threading
 
 # Lib imports
 # (None)
@@ -27,6 +30,28 @@ from cricketlib import searchswitch
 from uiGlobals import *
 import configdata
 
+# Lock per local switch, the VBUS sampler threads share the serial port
+# with the UI thread
+_swlocks = {}
+_swlocks_guard = threading.Lock()
+
+def switch_lock(swid):
+    """
+    Lock serializing all commands sent to one local switch.
+
+    Args:
+        swid: Switch ID (serial port) of the switch.
+
+    Returns:
+        threading.Lock: lock of the switch
+    """
+    with _swlocks_guard:
+        lock = _swlocks.get(swid)
+        if lock is None:
+            lock = threading.Lock()
+            _swlocks[swid] = lock
+        return lock
+
 def SetDeviceControl(top):
     """
     set the serial device control
@@ -53,6 +78,7 @@ def ResetDeviceControl(top):
     Returns:
         None
     """
+    devnw.close_sessions()
     if top.ccclient != None:
         top.thread.close()
         top.ccclient.close()
@@ -179,8 +205,9 @@ def disconnect_device(top, swport):
             # Persistent Save
             configdata.save_firmware_version(swname, swport, version, "Disconnect")
             
-            top.handlers[swport].disconnect()
-            top.handlers.pop(swport)
+            with switch_lock(swport):
+                top.handlers[swport].disconnect()
+                top.handlers.pop(swport)
             # top.sw_versions.pop(swport, None) # Keep it in memory if user wants to see it later? 
             # The user said "save it once it get disconnected", 
             # usually that means recording it somewhere permanent.
@@ -211,10 +238,11 @@ def send_port_cmd(top, cmd):
     
     if top.devCtrl == "local":
         swid, opr, pno = cmd.split(',')
-        if(opr == "OFF"):
-            return top.handlers[swid].port_off()
-        else:
-            return top.handlers[swid].port_on(pno)
+        with switch_lock(swid):
+            if(opr == "OFF"):
+                return top.handlers[swid].port_off()
+            else:
+                return top.handlers[swid].port_on(pno)
     elif top.devCtrl == "tcp":
         nwip = top.ucConfig['mynodes']["mycc"]["tcp"]["ip"]
         nwport = top.ucConfig['mynodes']["mycc"]["tcp"]["port"]
@@ -250,10 +278,11 @@ def control_port(top, cmd):
     """
     if top.devCtrl == "local":
         swid, opr = cmd.split(',')
-        if(opr == "off"):
-            return top.handlers[swid].port_off()
-        else:
-            return top.handlers[swid].port_on(opr)
+        with switch_lock(swid):
+            if(opr == "off"):
+                return top.handlers[swid].port_off()
+            else:
+                return top.handlers[swid].port_on(opr)
     elif top.devCtrl == "tcp":
         nwip = top.ucConfig['mynodes']["mycc"]["tcp"]["ip"]
         nwport = top.ucConfig['mynodes']["mycc"]["tcp"]["port"]
@@ -286,7 +315,8 @@ def read_port(top, swid):
         depends on the read operation performed by the device handler.
     """
     if top.devCtrl == "local":
-        return top.handlers[swid].read_port()
+        with switch_lock(swid):
+            return top.handlers[swid].read_port()
     elif top.devCtrl == "tcp":
         nwip = top.ucConfig['mynodes']["mycc"]["tcp"]["ip"]
         nwport = top.ucConfig['mynodes']["mycc"]["tcp"]["port"]
@@ -324,7 +354,8 @@ def send_speed_cmd(top, cmd):
    
     if top.devCtrl == "local":
         # swid, speed = cmd.split(',')
-        return top.handlers[swid].set_speed(speed)
+        with switch_lock(swid):
+            return top.handlers[swid].set_speed(speed)
     elif top.devCtrl == "tcp":
         nwip = top.ucConfig['mynodes']["mycc"]["tcp"]["ip"]
         nwport = top.ucConfig['mynodes']["mycc"]["tcp"]["port"]
@@ -355,7 +386,8 @@ def send_volts_cmd(top, swid):
         depends on the get_volts operation performed by the device handler.
     """
     if top.devCtrl == "local":
-        return top.handlers[swid].get_volts()
+        with switch_lock(swid):
+            return top.handlers[swid].get_volts()
     elif top.devCtrl == "tcp":
         nwip = top.ucConfig['mynodes']["mycc"]["tcp"]["ip"]
         nwport = top.ucConfig['mynodes']["mycc"]["tcp"]["port"]
@@ -385,7 +417,8 @@ def send_amps_cmd(top, swid):
         depends on the get_amps operation performed by the device handler.
     """
     if top.devCtrl == "local":
-        return top.handlers[swid].get_amps()
+        with switch_lock(swid):
+            return top.handlers[swid].get_amps()
     elif top.devCtrl == "tcp":
         nwip = top.ucConfig['mynodes']["mycc"]["tcp"]["ip"]
         nwport = top.ucConfig['mynodes']["mycc"]["tcp"]["port"]
@@ -412,7 +445,8 @@ def send_status_cmd(top, swid):
         return findict: status in dict
     """
     if top.devCtrl == "local":
-        return top.handlers[swid].get_status()
+        with switch_lock(swid):
+            return top.handlers[swid].get_status()
     elif top.devCtrl == "tcp":
         nwip = top.ucConfig['mynodes']["mycc"]["tcp"]["ip"]
         nwport = top.ucConfig['mynodes']["mycc"]["tcp"]["port"]
@@ -440,7 +474,8 @@ def read_port_status(top, swid):
         return findict: status in dict
     """
     if top.devCtrl == "local":
-        return top.handlers[swid].get_port_status()
+        with switch_lock(swid):
+            return top.handlers[swid].get_port_status()
     elif top.devCtrl == "tcp":
         nwip = top.ucConfig['mynodes']["mycc"]["tcp"]["ip"]
         nwport = top.ucConfig['mynodes']["mycc"]["tcp"]["port"]
@@ -457,6 +492,82 @@ def read_port_status(top, swid):
             top.ccflag = False
             return-1, "No CC"
 
+def send_batch_cmd(top, cmds):
+    """
+    Run several switch commands as one batch. Over TCP the whole
+    batch is a single round trip to the Control Computer.
+
+    Args:
+        top: The object managing the devices.
+        cmds (list): (name, arg) tuples in the order to run, where
+            name is one of "port", "read", "status", "speed", "volts"
+            or "amps" and arg is what the matching single command
+            function takes.
+
+    Returns:
+        list: one result per command, same as the single command
+        functions return.
+    """
+    stop = top.fault_flg == True and any(name == "port" for name, arg in cmds)
+    if top.devCtrl == "local" or stop:
+        return [BATCH_CMDS[name](top, arg) for name, arg in cmds]
+    elif top.devCtrl == "tcp":
+        nwip = top.ucConfig['mynodes']["mycc"]["tcp"]["ip"]
+        nwport = top.ucConfig['mynodes']["mycc"]["tcp"]["port"]
+        reslist = devnw.send_batch_cmd(nwip, int(nwport), cmds)
+        findlist = []
+        for resdict in reslist:
+            if resdict["result"][0]["status"] == "OK":
+                top.ccflag = True
+                findict = resdict["result"][1]["data"]
+                if findict[0] == -1:
+                    top.device_no_response()
+                findlist.append(findict)
+            else:
+                top.print_on_log("Control Computer Connection Fail!\n")
+                top.device_no_response()
+                top.ccflag = False
+                return [(-1, "No CC") for cmd in cmds]
+        return findlist
+
+def start_va_stream(top, swid, rate, callback):
+    """
+    Subscribe to the volts/amps stream of a switch on the
+    Control Computer.
+
+    Args:
+        top: The object managing the devices.
+        swid: Switch ID to sample.
+        rate: Sampling rate in Hz.
+        callback: Called from the client reader thread with every
+            pushed frame, see devClient.subscribe_va.
+
+    Returns:
+        The stream id, or None when the switch is local or the
+        subscription failed; the caller then polls as before.
+    """
+    if top.devCtrl == "tcp":
+        nwip = top.ucConfig['mynodes']["mycc"]["tcp"]["ip"]
+        nwport = top.ucConfig['mynodes']["mycc"]["tcp"]["port"]
+        return devnw.subscribe_va(nwip, int(nwport), swid, rate, callback)
+    return None
+
+def stop_va_stream(top, sid):
+    """
+    Stop a volts/amps stream started with start_va_stream.
+
+    Args:
+        top: The object managing the devices.
+        sid: Stream id.
+
+    Returns:
+        None
+    """
+    if top.devCtrl == "tcp":
+        nwip = top.ucConfig['mynodes']["mycc"]["tcp"]["ip"]
+        nwport = top.ucConfig['mynodes']["mycc"]["tcp"]["port"]
+        devnw.unsubscribe_va(nwip, int(nwport), sid)
+
 def device_connected(top):
     """
     Connect the selected device
@@ -474,4 +585,12 @@ def device_connected(top):
     top.UpdateSingle("Connected", 3)
     top.print_on_log("MCCI USB Switch "+DEVICES[top.selDevice]
                                         +" Connected!\n")
-    top.device_connected()
\ No newline at end of file
+    top.device_connected()
+
+# Single command functions runnable in a batch, by command name
+BATCH_CMDS = {"port": send_port_cmd,
+              "read": read_port_status,
+              "status": send_status_cmd,
+              "speed": send_speed_cmd,
+              "volts": send_volts_cmd,
+              "amps": send_amps_cmd}
@@ -14,6 +14,16 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Persistent framed connection per client
+#         Bounded client pool with per-switch serialization
+#         Event driven device search with a short result cache
+#         Batched multi-command requests
+#         Server-push VBUS volts/amps telemetry stream
+#         Negotiated msgpack/JSON message encoding
+#         Answer UDP discovery probes
+#         Switch locks shared with the local UI and VBUS samplers
+#
 ##############################################################################
 # Built-in imports
 
@@ -21,13 +31,37 @@
 import socket
 import threading
 import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # Lib imports
 import wx
 
 # Own modules
+import devControl as model
+import nwDiscover
+import nwFrame
 from uiGlobals import *
 
+# Maximum number of User Computers served at the same time
+MAX_CC_CLIENTS = 16
+
+# Seconds a device search result is reused for repeated searches
+SEARCH_CACHE_TTL = 2.0
+
+# Seconds to wait for the UI thread to finish a device search
+SEARCH_TIMEOUT = 20
+
+# Highest volts/amps sampling rate a client can subscribe to, in Hz
+MAX_STREAM_RATE = 100
+
+# Seconds between two pushes of buffered stream samples
+STREAM_FLUSH = 0.1
+
+# Seconds a new client has to send its first request or hello,
+# an idle connection would hold a pool worker
+FIRST_REQUEST_TIMEOUT = 10
+
 keywords = {'Python',
             'wxpython',
             'SocketProgramming'
@@ -36,11 +70,28 @@ keywords = {'Python',
 class ServerEvent(wx.PyEvent):
     """A class ServerEvent with init method"""
 
-    def __init__(self, data):
-        """Init Result Event."""
+    def __init__(self, data, future=None):
+        """Init Result Event, future is resolved by the event handler."""
         wx.PyEvent.__init__(self)
         self.SetEventType(EVT_RESULT_ID)
         self.data = data
+        self.future = future
+
+def get_swport(reqdict):
+    """
+    Find the switch a request is addressed to
+    Args:
+        reqdict : request as dict
+    Returns:
+        swport: port of the switch, None if the request
+        is not bound to one switch
+    """
+    if reqdict.get("ctype") == "control":
+        if reqdict.get("itype") == "usb":
+            return reqdict["cmd"].split(',')[0]
+        if reqdict.get("cmd") == "switch":
+            return reqdict["stat"].split(',')[0]
+    return reqdict.get("port")
 
 class ServerCc:
     """A class ServerCC with init method"""
@@ -61,6 +112,7 @@ class ServerCc:
         self.PORT = port
         self.ADDR = ((self.IP, self.PORT))
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         try:
             self.socket.bind((host, port))
             self.socket.listen(5)
@@ -68,8 +120,76 @@ class ServerCc:
             print("Server Init failed")
             
         self.bind_addr = host + ':' + str(port)
-        self.conn_socket = None
-        self.addr = None
+        self.search_lock = threading.Lock()
+        self.search_future = None
+        self.search_time = 0
+
+    def switch_lock(self, swport):
+        """
+        Lock serializing all commands sent to one switch, the same
+        lock the UI and VBUS samplers of this computer take
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            swport: port of the switch
+        Returns:
+            threading.Lock: lock of the switch
+        """
+        return model.switch_lock(swport)
+
+    def search_devices(self, window):
+        """
+        Search the switches attached to this computer. The search runs
+        on the UI thread, concurrent callers share one search and a
+        result younger than SEARCH_CACHE_TTL is reused.
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            window: main window handling the ServerEvent
+        Returns:
+            dict: device list
+        """
+        with self.search_lock:
+            fut = self.search_future
+            if fut is None or (fut.done() and (fut.exception() is not None or
+                    time.monotonic() - self.search_time > SEARCH_CACHE_TTL)):
+                fut = Future()
+                fut.add_done_callback(self.search_done)
+                self.search_future = fut
+                try:
+                    wx.PostEvent(window, ServerEvent("search", fut))
+                except Exception as err:
+                    fut.set_exception(err)
+        return fut.result(SEARCH_TIMEOUT)
+
+    def search_done(self, fut):
+        """
+        Stamp the completion time of a device search
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            fut: finished search Future
+        Returns:
+            None
+        """
+        self.search_time = time.monotonic()
+
+    def clear_search(self):
+        """
+        Drop the cached device search result
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+        Returns:
+            None
+        """
+        with self.search_lock:
+            if self.search_future is not None and self.search_future.done():
+                self.search_future = None
 
     def close(self):
         """
@@ -81,6 +201,10 @@ class ServerCc:
         Returns:
             None
         """  
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
         self.socket.close()
         
         
@@ -96,14 +220,35 @@ class StayAccept(threading.Thread):
         Returns:
             None
         """
-        super(StayAccept, self).__init__()
+        super(StayAccept, self).__init__(daemon=True)
         self.window = parent
+        self.server = parent.ccserver
         self.wait = True
-        self.rs = None
+        self.pool = ThreadPoolExecutor(max_workers=MAX_CC_CLIENTS,
+                                       thread_name_prefix="CcClient")
+        self.sessions = []
+        self.sessions_lock = threading.Lock()
+        self.beacon = None
     
+    def beacon_info(self):
+        """
+        Switches opened on this server, sent in discovery beacons
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+        Returns:
+            dict: beacon fields
+        """
+        swuidict = dict(self.window.swuidict)
+        return {"switches": [{"port": swport, "model": swname}
+                             for swport, swname in swuidict.items()]}
+
     def run(self) -> None:
         """
-        Server is run
+        Server is run, every accepted client gets its own
+        RequestSync state served from the bounded pool, a client
+        beyond MAX_CC_CLIENTS is disconnected
         Args:
             self:The self parameter is a reference to the current 
             instance of the class,and is used to access variables
@@ -111,14 +256,52 @@ class StayAccept(threading.Thread):
         Returns:
             None
         """
+        self.beacon = nwDiscover.start_responder(nwDiscover.ROLE_CC,
+                                                 self.server.PORT,
+                                                 self.beacon_info)
         while self.wait:
             try:
-                self.window.ccserver.conn_socket, self.window.ccserver.addr = self.window.ccserver.socket.accept()
-                new_conn_info = '\nnew connection: ' + str(self.window.ccserver.addr)
-                self.rs = RequestSync(self.window)
-                self.rs.start()
-            except:
-                pass
+                conn, addr = self.server.socket.accept()
+            except OSError:
+                if not self.wait:
+                    break
+                continue
+            rs = RequestSync(self.window, self.server, conn, addr)
+            with self.sessions_lock:
+                busy = len(self.sessions) >= MAX_CC_CLIENTS
+                if not busy:
+                    self.sessions.append(rs)
+            if busy:
+                # All workers serve a client, a queued one would hang
+                conn.close()
+                wx.CallAfter(self.window.panel.PrintLog,
+                             "\n P2: " + str(addr) + " rejected, "
+                             "too many clients\n")
+                continue
+            try:
+                self.pool.submit(self.serve, rs)
+            except RuntimeError:
+                # Pool shut down by close_connection
+                with self.sessions_lock:
+                    self.sessions.remove(rs)
+                conn.close()
+
+    def serve(self, rs):
+        """
+        Pool worker, serves one client until it disconnects
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            rs: RequestSync of the client
+        Returns:
+            None
+        """
+        try:
+            rs.run()
+        finally:
+            with self.sessions_lock:
+                self.sessions.remove(rs)
 
     def close_connection(self):
         """
@@ -131,10 +314,17 @@ class StayAccept(threading.Thread):
             None
         """
         self.wait = False
+        if self.beacon is not None:
+            self.beacon.close()
+        with self.sessions_lock:
+            sessions = list(self.sessions)
+        for rs in sessions:
+            rs.terminate()
+        self.pool.shutdown(wait=False)
         
-class RequestSync(threading.Thread):
-    """A class RequestSync with init method"""
-    def __init__(self, parent):
+class RequestSync:
+    """State of one client connection, served by a StayAccept worker"""
+    def __init__(self, parent, server, conn, addr):
         """
         ServerCC having connetion control computer server
         Args:
@@ -142,12 +332,20 @@ class RequestSync(threading.Thread):
             instance of the class,and is used to access variables
             that belongs to the class.
             parent:parent abject
+            server: ServerCc owning the switch locks
+            conn: accepted client socket
+            addr: client address
         Returns:
             None
         """
-        super(RequestSync, self).__init__()
         self.window = parent
+        self.server = server
+        self.conn = conn
+        self.addr = addr
         self._running = True
+        self.send_lock = threading.Lock()
+        self.streams = {}
+        self.enc = nwFrame.ENC_JSON
     
     def terminate(self):
         """
@@ -160,10 +358,41 @@ class RequestSync(threading.Thread):
             None
         """
         self._running = False
+        try:
+            self.conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
 
     def run(self) -> None:
         """
-        This message sent to client, when it gets connected with this server
+        Serve the client until it disconnects. Each framed request
+        carries an id which is echoed back in its reply. A client
+        that sends nothing within FIRST_REQUEST_TIMEOUT is dropped.
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+        Returns:
+            None
+        """
+        try:
+            self.conn.settimeout(FIRST_REQUEST_TIMEOUT)
+            if nwFrame.is_framed(self.conn):
+                self.serve_session()
+            else:
+                self.serve_legacy()
+        except (OSError, ValueError):
+            disconnect_info = str(self.addr) + ' socket\n'
+            wx.CallAfter(self.window.panel.PrintLog, "\n P2: "+disconnect_info)
+        finally:
+            self._running = False
+            for stream in list(self.streams.values()):
+                stream.stop()
+            self.conn.close()
+
+    def serve_session(self):
+        """
+        Handle framed requests on the persistent connection.
         Args:
             self:The self parameter is a reference to the current 
             instance of the class,and is used to access variables
@@ -171,22 +400,119 @@ class RequestSync(threading.Thread):
         Returns:
             None
         """
-        
-        # This message sent to client, when it gets connected with this server
         while self._running:
-            try:
-                creq = self.window.ccserver.conn_socket.recv(1024)
-                data = json.loads(creq.decode())
-            except ConnectionResetError:
-                self.window.ccserver.conn_socket.close()
-                disconnect_info = str(self.window.ccserver.addr) + ' socket\n'
-                wx.CallAfter(self.window.panel.PrintLog, "\n P2: "+disconnect_info)
+            reqdict = nwFrame.recv_frame(self.conn)
+            if reqdict is None:
                 break
-            if data:
-                result = self.verify_command(data)
-                data= json.dumps(result)
-                self.window.ccserver.conn_socket.sendall(data.encode('utf-8'))
-                self.terminate()
+            # Session established, it may stay idle between requests
+            self.conn.settimeout(None)
+            rid = reqdict.pop("id", None)
+            if reqdict.get("ctype") == "session" and reqdict.get("cmd") == "hello":
+                # Reply in the old encoding, then switch
+                rdict = nwFrame.hello_reply(reqdict)
+                rdict["id"] = rid
+                with self.send_lock:
+                    nwFrame.send_frame(self.conn, rdict, self.enc)
+                    self.enc = rdict["enc"]
+                continue
+            if reqdict.get("ctype") == "stream":
+                rdict = self.stream_command(rid, reqdict)
+            else:
+                rdict = dict(self.run_command(reqdict))
+            rdict["id"] = rid
+            self.push(rdict)
+
+    def push(self, msgdict):
+        """
+        Send one frame to the client, replies and stream
+        samples come from different threads.
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            msgdict: message as dict
+        Returns:
+            None
+        """
+        with self.send_lock:
+            nwFrame.send_frame(self.conn, msgdict, self.enc)
+
+    def stream_command(self, rid, reqdict):
+        """
+        Start or stop a volts/amps telemetry stream. The stream
+        is identified by the id of its subscribe request.
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            rid: id of the request
+            reqdict : request as dict
+        Returns:
+            rdict: reply dict
+        """
+        rdict = {}
+        cmd = reqdict["cmd"]
+        if cmd == "subscribe":
+            swport = reqdict["port"]
+            if swport not in self.window.handlers:
+                rdict["data"] = [-1, "Switch not open"]
+                return rdict
+            rate = min(max(float(reqdict.get("rate", 10)), 1), MAX_STREAM_RATE)
+            stream = VaStream(self, rid, swport, rate)
+            self.streams[rid] = stream
+            stream.start()
+            rdict["data"] = "success"
+            rdict["stream"] = rid
+        elif cmd == "unsubscribe":
+            stream = self.streams.pop(reqdict["stream"], None)
+            if stream is not None:
+                stream.stop()
+            rdict["data"] = "success"
+        else:
+            rdict["data"] = "Invalid command"
+        return rdict
+
+    def serve_legacy(self):
+        """
+        Handle a single bare JSON request from an older client.
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+        Returns:
+            None
+        """
+        creq = self.conn.recv(1024)
+        if creq:
+            result = self.run_command(json.loads(creq.decode()))
+            self.conn.sendall(json.dumps(result).encode('utf-8'))
+
+    def run_command(self, reqdict):
+        """
+        Run one request, a failing handler is reported back
+        to the client instead of dropping the connection.
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            reqdict : request as dict
+        Returns:
+            rdict: reply dict
+        """
+        try:
+            swport = get_swport(reqdict)
+            if swport is None:
+                rdict = self.verify_command(reqdict)
+            else:
+                with self.server.switch_lock(swport):
+                    rdict = self.verify_command(reqdict)
+        except Exception as err:
+            rdict = {}
+            rdict["data"] = [-1, str(err)]
+        if rdict is None:
+            rdict = {}
+            rdict["data"] = "Invalid command"
+        return rdict
     
     def verify_command(self, reqdict):
         """
@@ -203,19 +529,11 @@ class RequestSync(threading.Thread):
         cmd = reqdict["cmd"]
         if(ctype == "device"):
             if(cmd == "search"):
-                
-                self.window.ucbusy = True
-                wx.PostEvent(self.window, ServerEvent("search"))
-                
-                result = None
-                while(1):
-                    if not self.window.ucbusy:
-                        break
-                self.window.ucbusy = False
-                result = self.window.dev_list
+                result = self.server.search_devices(self.window)
                 wx.CallAfter(self.window.panel.PrintLog, "\nDevice Search...")
                 return result
             elif(cmd == "open"):
+                self.server.clear_search()
                 itype = reqdict["itype"]
                 result = False
                 if(itype == "serial"):
@@ -250,6 +568,7 @@ class RequestSync(threading.Thread):
                 # result = self.window.devHand.close()
                 # swname = reqdict["swname"]
                 swport = reqdict["port"]
+                self.server.clear_search()
                 # result = self.window.handlers[swport].close()
                 result = self.window.handlers[swport].disconnect()
                 rdict = {}
@@ -322,7 +641,97 @@ class RequestSync(threading.Thread):
                 rdict["data"] = str(result)
                 wx.CallAfter(self.window.panel.PrintLog, "\n2101 Port: "+rdict["data"]+"\n")
                 return rdict
+        elif(ctype == "batch"):
+            # Sub-commands run in order, each under its own switch lock
+            rdict = {}
+            rdict["data"] = [self.run_command(subdict)
+                             for subdict in reqdict["cmds"]]
+            return rdict
         else:
             rdict = {}
             rdict["data"] = "Invalid command"
-            return rdict
\ No newline at end of file
+            return rdict
+
+class VaStream(threading.Thread):
+    """Samples volts and amps of one switch and pushes them to the client"""
+    def __init__(self, rs, sid, swport, rate):
+        """
+        VaStream with init method
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            rs: RequestSync of the subscribed client
+            sid: stream id
+            swport: port of the switch
+            rate: sampling rate in Hz
+        Returns:
+            None
+        """
+        super(VaStream, self).__init__(daemon=True)
+        self.rs = rs
+        self.sid = sid
+        self.swport = swport
+        self.period = 1.0 / rate
+        self._running = True
+
+    def stop(self):
+        """
+        stop the stream
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+        Returns:
+            None
+        """
+        self._running = False
+
+    def run(self) -> None:
+        """
+        Sample back to back at the requested rate, every sample is
+        [seconds since subscribe, volts reply, amps reply]. Samples
+        are pushed in groups every STREAM_FLUSH seconds, the last
+        group when the stream stops.
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+        Returns:
+            None
+        """
+        t0 = time.monotonic()
+        tnext = t0
+        tflush = t0
+        samples = []
+        error = None
+        try:
+            while self._running and self.rs._running:
+                try:
+                    with self.rs.server.switch_lock(self.swport):
+                        handler = self.rs.window.handlers[self.swport]
+                        tsamp = time.monotonic()
+                        volts = handler.get_volts()
+                        amps = handler.get_amps()
+                except Exception as err:
+                    error = str(err)
+                    break
+                samples.append([round(tsamp - t0, 4), volts, amps])
+                now = time.monotonic()
+                if now - tflush >= STREAM_FLUSH:
+                    self.rs.push({"stream": self.sid, "samples": samples})
+                    samples = []
+                    tflush = now
+                tnext += self.period
+                if tnext > now:
+                    time.sleep(tnext - now)
+                else:
+                    tnext = now
+            # Samples taken since the last push, then the final frame
+            if samples:
+                self.rs.push({"stream": self.sid, "samples": samples})
+            if error is not None:
+                self.rs.push({"stream": self.sid, "error": error})
+        except OSError:
+            pass
+        self.rs.streams.pop(self.sid, None)
@@ -22,6 +22,9 @@
 # Revision history:
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
+#
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         USB tree scan on the background worker
 ##############################################################################
 # Lib imports
 import wx
@@ -507,6 +510,21 @@ class AutoWindow(wx.Window):
         """ 
         self.usb_flg = True
         self.timer_usb.Start(int(self.top.get_enum_delay()))
+        self.top.watch_usb_change(self.UsbChangeSeen)
+
+    def UsbChangeSeen(self):
+        """
+        USB devices settled before the delay timer ran out,
+        read the USB tree right away
+        Args:
+            self: The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+        Returns:
+            None
+        """
+        if self and self.timer_usb.IsRunning():
+            self.UsbTimer(None)
     
     def Auto_strat_msg(self):
         """
@@ -649,13 +667,27 @@ class AutoWindow(wx.Window):
             None
         """
         self.timer_usb.Stop()
-        self.usb_flg = False
-        try:
-            thControl.get_tree_change(self.top)
-        except:
+        thControl.request_tree_change(self.top, self.UsbScanDone)
+
+    def UsbScanDone(self, err):
+        """
+        Called on the UI thread when the USB tree scan started
+        by UsbTimer is done
+
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            err: error of the scan, None on success
+        Returns:
+            None
+        """
+        if not self:
+            return
+        if err is not None:
             self.top.print_on_log("USB Read Error!")
         self.usb_flg = False
-        
+
         if(self.auto_flg == True & self.pulse_flg == True):
             self.timer.Start(1)
     
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+# Module: captureFile.py
+#
+# Description:
+#     Continuous recording of VBUS samples to disk.
+#
+#     A capture is a NumPy .npy file of float64 rows (time, volts,
+#     amps). Samples are collected in a fixed size chunk that is
+#     appended to the file when full and at every flush; the row
+#     count in the header is written after the data, so the file is
+#     a valid array up to the last flush at any time. A capture is
+#     loaded back by memory mapping, not read row by row.
+#
+# Author:
+#     Vinay N, MCCI Corporation Feb 2026
+#
+# Revision history:
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+# Built-in imports
+import struct
+import time
+
+# Lib imports
+import numpy as np
+
+# Values per sample: time, volts, amps
+COLUMNS = 3
+
+# Samples held in memory before they are written
+CHUNK_ROWS = 4096
+
+# Seconds between flushes of a chunk that is not full
+FLUSH_INTERVAL = 1.0
+
+# Fixed .npy header size, the header is rewritten in place as the
+# capture grows
+HEADER_SIZE = 128
+
+##############################################################################
+# Utilities
+##############################################################################
+def npy_header(rows):
+    """
+    Build the .npy version 1.0 header of a capture.
+
+    Args:
+        rows (int): Number of samples in the file.
+
+    Returns:
+        bytes: HEADER_SIZE bytes of header.
+    """
+    desc = ("{'descr': '<f8', 'fortran_order': False, 'shape': (%d, %d), }"
+            % (rows, COLUMNS))
+    hlen = HEADER_SIZE - 10
+    return (b"\x93NUMPY\x01\x00" + struct.pack("<H", hlen) +
+            desc.ljust(hlen - 1).encode("latin1") + b"\n")
+
+def load_capture(path):
+    """
+    Map a capture file into memory.
+
+    Args:
+        path (str): Capture file.
+
+    Returns:
+        numpy.memmap:
+            Read-only samples x COLUMNS array, pages are read from
+            the file as they are used.
+    """
+    return np.load(path, mmap_mode='r')
+
+class CaptureWriter():
+    """
+    Append-only writer of a capture file.
+
+    Description:
+        Memory use is one chunk whatever the length of the capture.
+
+    Attributes:
+        path (str):
+            Capture file.
+
+        rows (int):
+            Samples written to the file.
+
+        chunk (numpy.ndarray):
+            Samples not yet written.
+
+        count (int):
+            Samples in chunk.
+
+        tflush (float):
+            Monotonic time of the last flush.
+    """
+    def __init__(self, path):
+        """
+        Create the capture file, an existing file is replaced.
+
+        Args:
+            path (str): Capture file.
+
+        Returns:
+            None
+        """
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(npy_header(0))
+        self.rows = 0
+        self.chunk = np.empty((CHUNK_ROWS, COLUMNS), dtype='<f8')
+        self.count = 0
+        self.tflush = time.monotonic()
+
+    def append(self, *values):
+        """
+        Record one sample.
+
+        Args:
+            values: time, volts and amps.
+
+        Returns:
+            None
+        """
+        self.chunk[self.count] = values
+        self.count += 1
+        if (self.count == CHUNK_ROWS or
+                time.monotonic() - self.tflush >= FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self):
+        """
+        Write the samples of the chunk and update the header.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.count:
+            self.file.seek(HEADER_SIZE + self.rows * COLUMNS * 8)
+            self.file.write(self.chunk[:self.count].tobytes())
+            self.rows += self.count
+            self.count = 0
+            self.file.seek(0)
+            self.file.write(npy_header(self.rows))
+            self.file.flush()
+        self.tflush = time.monotonic()
+
+    def close(self):
+        """
+        Write the remaining samples and close the file.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        try:
+            self.flush()
+        finally:
+            self.file.close()
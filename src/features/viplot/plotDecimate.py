@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+# Module: plotDecimate.py
+#
+# Description:
+#     Min/max decimation of long VBUS captures for plotting.
+#
+#     A capture of a million samples has far more points than the
+#     chart has pixel columns. Each level of the pyramid halves the
+#     previous one, keeping the minimum and maximum of every pair, so
+#     a view of any zoom is drawn from about two points per pixel
+#     column and spikes stay visible.
+#
+# Author:
+#     Vinay N, MCCI Corporation Feb 2026
+#
+# Revision history:
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+# Lib imports
+import numpy as np
+
+# Coarsest level size, smaller views are not worth another level
+MIN_LEVEL_SIZE = 256
+
+##############################################################################
+# Utilities
+##############################################################################
+def reduce_level(x, lo, hi):
+    """
+    Halve one level of the pyramid.
+
+    Args:
+        x (numpy.ndarray): Time of the first sample of each bin.
+        lo (numpy.ndarray): Minimum of each bin.
+        hi (numpy.ndarray): Maximum of each bin.
+
+    Returns:
+        tuple:
+            x, lo and hi of the next level, an odd last bin is
+            kept as it is.
+    """
+    pairs = len(x) // 2 * 2
+    nx = x[0:pairs:2]
+    nlo = np.minimum(lo[0:pairs:2], lo[1:pairs:2])
+    nhi = np.maximum(hi[0:pairs:2], hi[1:pairs:2])
+    if pairs < len(x):
+        nx = np.append(nx, x[-1])
+        nlo = np.append(nlo, lo[-1])
+        nhi = np.append(nhi, hi[-1])
+    return nx, nlo, nhi
+
+class MinMaxPyramid():
+    """
+    Multi-resolution min/max envelope of one sampled signal.
+
+    Description:
+        Level 0 holds the samples, every further level half as
+        many bins. Building takes O(n) time and memory, a query
+        takes O(log n) plus the points returned.
+
+    Attributes:
+        levels (list):
+            (x, lo, hi) arrays per level, finest first.
+
+        ymin (float):
+            Minimum of all samples.
+
+        ymax (float):
+            Maximum of all samples.
+    """
+    def __init__(self, x, y):
+        """
+        Build the pyramid.
+
+        Args:
+            x (array_like): Sample times, ascending.
+            y (array_like): Sample values.
+
+        Returns:
+            None
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        self.levels = [(x, y, y)]
+        while len(self.levels[-1][0]) > MIN_LEVEL_SIZE:
+            self.levels.append(reduce_level(*self.levels[-1]))
+        top = self.levels[-1]
+        self.ymin = top[1].min() if len(y) else 0
+        self.ymax = top[2].max() if len(y) else 0
+
+    def query(self, xlo, xhi, npix):
+        """
+        Get the points to draw for an X range.
+
+        Description:
+            Uses the finest level with at most npix bins in the
+            range. Each bin is drawn as a vertical stroke from its
+            minimum to its maximum, raw samples are returned when
+            they fit. One point beyond each end of the range is
+            included so the line reaches the chart border.
+
+        Args:
+            xlo (float): Lower X limit of the view.
+            xhi (float): Upper X limit of the view.
+            npix (int): Pixel columns of the view.
+
+        Returns:
+            tuple: X and Y arrays.
+        """
+        for lidx, (x, lo, hi) in enumerate(self.levels):
+            start = max(np.searchsorted(x, xlo, side='left') - 1, 0)
+            end = np.searchsorted(x, xhi, side='right') + 1
+            if end - start <= npix or lidx == len(self.levels) - 1:
+                break
+        if lidx == 0:
+            return x[start:end], lo[start:end]
+        xs = np.repeat(x[start:end], 2)
+        ys = np.empty(len(xs))
+        ys[0::2] = lo[start:end]
+        ys[1::2] = hi[start:end]
+        return xs, ys
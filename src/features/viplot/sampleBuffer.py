@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+# Module: sampleBuffer.py
+#
+# Description:
+#     Fixed capacity sample store of the VBUS chart.
+#
+#     Samples are kept in a NumPy ring. Every sample is written twice,
+#     at its slot and one capacity further, so the last samples are
+#     always one contiguous slice of the array and can be handed to
+#     matplotlib without a copy.
+#
+# Author:
+#     Vinay N, MCCI Corporation Feb 2026
+#
+# Revision history:
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+# Lib imports
+import numpy as np
+
+##############################################################################
+# Utilities
+##############################################################################
+class SampleRing():
+    """
+    Ring buffer of chart samples.
+
+    Description:
+        Holds the last capacity samples, a sample being one value
+        per column, e.g. time, volts and amps. Appending is O(1),
+        the oldest sample is dropped when the ring is full.
+
+    Attributes:
+        capacity (int):
+            Maximum number of samples kept.
+
+        data (numpy.ndarray):
+            Column by slot array, two capacities wide.
+
+        start (int):
+            Slot of the oldest sample.
+
+        count (int):
+            Number of samples kept.
+    """
+    def __init__(self, capacity, columns=3, dtype=np.float64):
+        """
+        Create an empty ring.
+
+        Args:
+            capacity (int): Maximum number of samples kept.
+            columns (int): Values per sample.
+            dtype: NumPy type of the values.
+
+        Returns:
+            None
+        """
+        self.capacity = max(int(capacity), 1)
+        self.data = np.zeros((columns, 2 * self.capacity), dtype=dtype)
+        self.start = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, *values):
+        """
+        Add one sample.
+
+        Args:
+            values: One value per column.
+
+        Returns:
+            None
+        """
+        if self.count < self.capacity:
+            slot = self.start + self.count
+            self.count += 1
+        else:
+            slot = self.start
+            self.start = (self.start + 1) % self.capacity
+        slot = slot % self.capacity
+        self.data[:, slot] = values
+        self.data[:, slot + self.capacity] = values
+
+    def column(self, idx):
+        """
+        Get the samples of one column, oldest first.
+
+        Args:
+            idx (int): Column index.
+
+        Returns:
+            numpy.ndarray:
+                Contiguous read-only view into the ring, valid until
+                the next append.
+        """
+        view = self.data[idx, self.start:self.start + self.count]
+        view.flags.writeable = False
+        return view
+
+    def columns(self):
+        """
+        Get the samples of all columns, oldest first.
+
+        Args:
+            None
+
+        Returns:
+            list:
+                A view as returned by column() for each column.
+        """
+        return [self.column(idx) for idx in range(self.data.shape[0])]
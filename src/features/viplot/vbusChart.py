@@ -15,6 +15,14 @@
 # Revision history:
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
+#
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Samples kept in a NumPy ring buffer, X width up to 10000 sec
+#         Live chart blits reused line artists, axes redrawn on range change
+#         Loaded data drawn from a min/max decimation pyramid
+#         Samples taken from the sampler queue with their sampling time
+#         Continuous recording to a .npy capture file, loaded by memmap
+#
 ##############################################################################
 # Built-in imports
 import time
@@ -33,10 +41,14 @@ import csv
 
 # Own modules
 from uiGlobals import *
+from . import sampleBuffer
+from . import plotDecimate
+from . import captureFile
 
 XLIMIT = 10
 XSPAN = 1
-MAX_SAMPLE = 1000
+# Maximum X width in sec
+MAX_SAMPLE = 10000
 DEFAULT_SAMPLE = 100
 DEFAULT_YLIMIT = 6
 DEFAULT_Y2LIMIT = 6
@@ -105,16 +117,14 @@ class VbusChart(wx.Frame):
                                             wx.TE_PROCESS_ENTER,
                                             validator=NumericValidator())
 
-        self.tc_xlim.SetMaxLength(3)
+        self.tc_xlim.SetMaxLength(len(str(MAX_SAMPLE)))
         self.btnSet = wx.Button(self.panel, -1, "Set", size =  (50,-1))
         self.btnPause = wx.Button(self.panel, -1, "Pause", size =  (70,-1))
         self.btnLoad = wx.Button(self.panel, -1, 'Load', size =  (50,-1))
         self.btnSave = wx.Button(self.panel, -1, 'Save', size =  (50,-1))
+        self.btnRecord = wx.Button(self.panel, -1, 'Record', size =  (70,-1))
 
         # Init variables for Chart
-        self.xd = []
-        self.yd = []
-        self.y2d = []
         self.ylim = DEFAULT_YLIMIT
         self.y2lim = DEFAULT_Y2LIMIT
 
@@ -127,6 +137,10 @@ class VbusChart(wx.Frame):
         self.shift_flg = False
         
         self.maxsamp = DEFAULT_SAMPLE
+        self.samples = self.new_sample_ring()
+        # Sampling time of the first sample, time 0 of the chart
+        self.t0 = None
+        self.top.va_samples.clear()
 
         self.ax2 = self.ax.twinx()
 
@@ -177,6 +191,8 @@ class VbusChart(wx.Frame):
                             wx.LEFT , border=5)
         self.hbox_btn.Add(self.btnSave, flag=wx.ALIGN_CENTER_VERTICAL | 
                             wx.LEFT , border=5)
+        self.hbox_btn.Add(self.btnRecord, flag=wx.ALIGN_CENTER_VERTICAL | 
+                            wx.LEFT , border=5)
 
         self.top_vbox.Add(self.graph_vbox,0, wx.ALL|wx.CENTER, 5)
         self.top_vbox.Add(self.hbox_btn, 0, wx.ALL|wx.CENTER, 10)
@@ -194,6 +210,7 @@ class VbusChart(wx.Frame):
         
         self.btnLoad.Bind(wx.EVT_BUTTON, self.OnLoad)
         self.btnSave.Bind(wx.EVT_BUTTON, self.OnSave)
+        self.btnRecord.Bind(wx.EVT_BUTTON, self.OnRecord)
         self.btnPause.Bind(wx.EVT_BUTTON, self.OnPause)
         self.btnSet.Bind(wx.EVT_BUTTON, self.OnSet)
         
@@ -218,9 +235,26 @@ class VbusChart(wx.Frame):
         self.voltdf = []
         self.ampdf = []
 
+        # Decimation pyramids and lines of the loaded data
+        self.vlod = None
+        self.alod = None
+        self.trange = (0, 0)
+        self.csv_lines = []
+
+        # Capture file writer while recording
+        self.recorder = None
+
         self.vchart = True
         self.achart = True
 
+        # Live chart artists, drawn over the saved background
+        self.lines = []
+        self.background = None
+        self.xhi = 0
+        self.vtop = 0
+        self.atop = 0
+        self.canvas.mpl_connect('draw_event', self.OnCanvasDraw)
+
         self.timer_ud.Start(98)
         self.timer_uc.Start(250)
 
@@ -497,11 +531,14 @@ class VbusChart(wx.Frame):
         del self.timedf[:]
         del self.voltdf[:]
         del self.ampdf[:]
+        self.vlod = None
+        self.alod = None
+        self.csv_lines = []
 
         self.xzval = 3
         self.xsindex = 0
         
-        self.ax.clear()
+        self.clearChart()
         self.print_chart_lables()
         self.load_file()
         self.btnPause.SetLabel("Resume")
@@ -520,6 +557,50 @@ class VbusChart(wx.Frame):
         """
         self.save_file()
         
+    def OnRecord(self, e):
+        """
+        Start or stop recording every sample to a capture file.
+        Args:
+            self: The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            event: event handling on Record button.
+        Returns:
+            None
+        """
+        if self.recorder is not None:
+            self.stop_record()
+            return
+        dlg = wx.FileDialog(self, "Record to", "", "", 
+                            "VBUS capture (*.npy)|*.npy", 
+                            wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT)
+        if dlg.ShowModal() == wx.ID_OK:
+            pathname = dlg.GetPath()
+            try:
+                self.recorder = captureFile.CaptureWriter(pathname)
+                self.btnRecord.SetLabel("Stop Rec")
+            except OSError:
+                wx.LogError("Can not create file '%s', " % pathname)
+        dlg.Destroy()
+
+    def stop_record(self):
+        """
+        Write the last samples and close the capture file.
+        Args:
+            self: The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+        Returns:
+            None
+        """
+        recorder = self.recorder
+        self.recorder = None
+        self.btnRecord.SetLabel("Record")
+        try:
+            recorder.close()
+        except OSError:
+            wx.LogError("Can not write file '%s', " % recorder.path)
+
     def OnPause(self, e):
         """
         The Running Plot activity will be paused for a moment.
@@ -557,13 +638,11 @@ class VbusChart(wx.Frame):
             self.tc_xlim.SetValue(str(MAX_SAMPLE))
 
         self.maxsamp = int(xmax) * 10
-        del self.xd[:]
-        del self.yd[:]
-        del self.y2d[:]
+        self.samples = self.new_sample_ring()
 
         self.cal_max_samp()
         
-        self.ax.clear()
+        self.clearChart()
         self.ax.grid(True, which='both')
         self.run_flg = True
 
@@ -584,6 +663,22 @@ class VbusChart(wx.Frame):
         else: # self.maxsamp < 100:
             self.xspan = 1
 
+    def new_sample_ring(self):
+        """
+        Create the sample ring for the X width.
+
+        Description:
+            self.maxsamp is the X width in 0.1 sec, the ring holds
+            one X width of samples at VA_STREAM_RATE.
+
+        Args:
+            self: Reference to the current instance of the class.
+
+        Returns:
+            SampleRing: empty sample ring
+        """
+        return sampleBuffer.SampleRing(self.maxsamp * VA_STREAM_RATE // 10)
+
     def DataThread(self):
         """
         Move the volt and current data to the buffer.
@@ -606,34 +701,37 @@ class VbusChart(wx.Frame):
         Returns: 
             None
         """    
-        voltin = self.top.vdata
-        ampsin = self.top.adata
-
-        if(voltin == None):
-            voltin = 0
-        if(ampsin == None):
-            ampsin = 0
-
-        xlen = len(self.xd)
-        if(xlen >= self.maxsamp):
-            self.xd.pop(0)
-            self.yd.pop(0)
-            self.y2d.pop(0)
-    
-        if(len(self.xd) == 0):
-            pd = 0
-        else:
-            pd = self.xd[-1] + 0.1
-
-        self.xd.append(round(pd, 2))
-        self.yd.append(voltin)
-        self.y2d.append(ampsin)
-
-        if voltin > self.vmax:
-            self.vmax = voltin
-
-        if ampsin > self.amax:
-            self.amax = ampsin
+        # Samples queued by the switch since the last call, the time
+        # is the monotonic sampling time
+        va_samples = self.top.va_samples
+        while va_samples:
+            tsamp, voltin, ampsin = va_samples.popleft()
+
+            if(voltin == None):
+                voltin = 0
+            if(ampsin == None):
+                ampsin = 0
+
+            if self.t0 is None:
+                self.t0 = tsamp
+
+            # The ring drops the oldest sample once it is full
+            tchart = round(tsamp - self.t0, 4)
+            self.samples.append(tchart, voltin, ampsin)
+
+            if self.recorder is not None:
+                try:
+                    self.recorder.append(tchart, voltin, ampsin)
+                except OSError:
+                    wx.LogError("Can not write file '%s', " %
+                                self.recorder.path)
+                    self.stop_record()
+
+            if voltin > self.vmax:
+                self.vmax = voltin
+
+            if ampsin > self.amax:
+                self.amax = ampsin
 
     def print_chart_lables(self):
         """
@@ -701,8 +799,8 @@ class VbusChart(wx.Frame):
             None
         """
         if self.run_flg:
-            if(len(self.xd) > 1):
-                self.update_chart()
+            if(len(self.samples) > 1):
+                self.refresh_chart()
 
     def checkAmps(self, evt):
         """
@@ -774,6 +872,129 @@ class VbusChart(wx.Frame):
         else:
             self.clearChart()
 
+    def refresh_chart(self):
+        """
+        Show the new samples in the running chart.
+
+        Description:
+            The line artists are updated in place and blitted over
+            the saved background of axes, ticks and labels. The
+            chart is drawn again only when the samples leave the
+            X or Y range, or when no lines are drawn yet.
+
+        Args:
+            self: Reference to the current instance of the class.
+
+        Returns:
+            None
+        """
+        xd, yd, y2d = self.samples.columns()
+        if (not self.lines or self.background is None or
+                xd[-1] > self.xhi or
+                (self.vchart and self.vmax >= self.vtop) or
+                (self.achart and self.amax >= self.atop)):
+            self.update_chart()
+            return
+
+        for line, ydata in zip(self.lines, self.get_line_data(yd, y2d)):
+            line.set_data(xd, ydata)
+        self.blit_lines()
+
+    def get_line_data(self, yd, y2d):
+        """
+        Get the Y data of each drawn line.
+
+        Args:
+            self: Reference to the current instance of the class.
+            yd: Volts samples.
+            y2d: Amps samples.
+
+        Returns:
+            list: Y data in the order of self.lines.
+        """
+        ydata = []
+        if self.vchart:
+            ydata.append(yd)
+        if self.achart:
+            ydata.append(y2d)
+        return ydata
+
+    def get_xrange(self, xd):
+        """
+        Get the X range of the running chart.
+
+        Description:
+            The range is one X width. Once the samples fill it,
+            it moves on by a quarter width at a time, so the axes
+            are drawn again only every few seconds.
+
+        Args:
+            self: Reference to the current instance of the class.
+            xd: Time samples.
+
+        Returns:
+            tuple: Lower and upper X limit.
+        """
+        width = self.maxsamp / 10
+        if len(xd) < self.samples.capacity and xd[-1] < xd[0] + width:
+            return xd[0], xd[0] + width
+        hrange = xd[-1] + width / 4
+        return hrange - width, hrange
+
+    def draw_background(self):
+        """
+        Draw the chart and save it as blitting background.
+
+        Description:
+            The line artists are animated, so the canvas draw
+            leaves them out; OnCanvasDraw saves the background and
+            draws them on top.
+
+        Args:
+            self: Reference to the current instance of the class.
+
+        Returns:
+            None
+        """
+        self.canvas.draw()
+
+    def OnCanvasDraw(self, event):
+        """
+        Save the blitting background after every full draw.
+
+        Description:
+            A full draw also happens when the window is resized or
+            exposed, the saved background and the lines are taken
+            from that draw so the next blit matches the canvas.
+
+        Args:
+            self: Reference to the current instance of the class.
+            event: matplotlib draw event
+
+        Returns:
+            None
+        """
+        if not self.lines:
+            return
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        for line in self.lines:
+            line.axes.draw_artist(line)
+
+    def blit_lines(self):
+        """
+        Draw the line artists over the saved background.
+
+        Args:
+            self: Reference to the current instance of the class.
+
+        Returns:
+            None
+        """
+        self.canvas.restore_region(self.background)
+        for line in self.lines:
+            line.axes.draw_artist(line)
+        self.canvas.blit(self.figure.bbox)
+
     def updateBoth(self):
         """
         Plot volt and amp data in the Chart
@@ -788,20 +1009,20 @@ class VbusChart(wx.Frame):
         self.ax2.clear()
 
         self.print_chart_lables()
-                
-        self.ax.set_xlim(self.xd[0], self.xd[-1])
+
+        xd, yd, y2d = self.samples.columns()
+        lrange, self.xhi = self.get_xrange(xd)
+        self.ax.set_xlim(lrange, self.xhi)
         self.ax.yaxis.set_visible(True)
         self.ax2.yaxis.set_visible(True)
 
-        if(len(self.xd) >= self.maxsamp):
-            major_xticks = np.arange(self.xd[0], self.xd[-1]+1, self.xspan/2)
-            minor_xticks = np.arange(self.xd[0], self.xd[-1]+1, self.xspan/2)
-        else:
-            major_xticks = np.arange(self.xd[0], (self.maxsamp+12)/10,self.xspan/2)
-            minor_xticks = np.arange(self.xd[0], (self.maxsamp+12)/10, self.xspan/2)
+        major_xticks = np.arange(lrange, self.xhi + 1, self.xspan/2)
+        minor_xticks = np.arange(lrange, self.xhi + 1, self.xspan/2)
 
         self.getvoltrange(self.vmax)
         self.getamprange(True, self.amax)
+        self.vtop = self.ax.get_ylim()[1]
+        self.atop = self.ax2.get_ylim()[1]
 
         self.ax.set_xticks(major_xticks)
         self.ax.set_xticks(minor_xticks, minor=True)
@@ -811,10 +1032,12 @@ class VbusChart(wx.Frame):
         self.ax2.grid(which='minor', linestyle = ':', 
                                     linewidth = '0.5', color = 'grey')
 
-        self.ax.plot(self.xd, self.yd, linewidth = '1.5', color = 'red')
-        self.ax2.plot(self.xd, self.y2d, linewidth = '1.5', color = 'green')
-        
-        self.canvas.draw()
+        self.lines = self.ax.plot(xd, yd, linewidth = '1.5', color = 'red',
+                                  animated = True)
+        self.lines += self.ax2.plot(xd, y2d, linewidth = '1.5',
+                                    color = 'green', animated = True)
+
+        self.draw_background()
 
     def getvoltrange(self, vmax):
         """
@@ -957,19 +1180,19 @@ class VbusChart(wx.Frame):
             self.ax2.clear()
             self.ax2.yaxis.set_visible(False)
         
-        self.ax.set_xlim(self.xd[0], self.xd[-1])
+        xd, yd, y2d = self.samples.columns()
+        lrange, self.xhi = self.get_xrange(xd)
+        self.ax.set_xlim(lrange, self.xhi)
 
-        if(len(self.xd) >= self.maxsamp):
-            major_xticks = np.arange(self.xd[0], self.xd[-1]+1, self.xspan/2) #MAIN
-            minor_xticks = np.arange(self.xd[0], self.xd[-1]+1, self.xspan/2) #MAIN
-        else:
-            major_xticks = np.arange(self.xd[0], (self.maxsamp+12)/10,self.xspan/2)
-            minor_xticks = np.arange(self.xd[0], (self.maxsamp+12)/10, self.xspan/2)
+        major_xticks = np.arange(lrange, self.xhi + 1, self.xspan/2) #MAIN
+        minor_xticks = np.arange(lrange, self.xhi + 1, self.xspan/2) #MAIN
                 
         if self.vchart:
             self.getvoltrange(self.vmax)
+            self.vtop = self.ax.get_ylim()[1]
         else:
             self.getamprange(False, self.amax)
+            self.atop = self.ax.get_ylim()[1]
             
         self.ax.set_xticks(major_xticks)
         self.ax.set_xticks(minor_xticks, minor=True)
@@ -979,11 +1202,13 @@ class VbusChart(wx.Frame):
                                     linewidth = '0.5', color = 'grey')
        
         if(param == "volt"):
-            self.ax.plot(self.xd, self.yd, linewidth = '1.5', color = 'red', label = 'line')
+            self.lines = self.ax.plot(xd, yd, linewidth = '1.5', color = 'red',
+                                      label = 'line', animated = True)
         else:
-            self.ax.plot(self.xd, self.y2d, linewidth = '1.5', color = 'green')
+            self.lines = self.ax.plot(xd, y2d, linewidth = '1.5',
+                                      color = 'green', animated = True)
 
-        self.canvas.draw() 
+        self.draw_background()
 
     def clearChart(self):
         """
@@ -996,7 +1221,9 @@ class VbusChart(wx.Frame):
             None
         """
         self.ax.clear()
-        self.ax2.clear()        
+        self.ax2.clear()
+        self.lines = []
+        self.background = None
 
     def OnClose(self, event):
         """
@@ -1013,6 +1240,8 @@ class VbusChart(wx.Frame):
         self.top.agraph = False
         self.timer_ud.Stop()
         self.timer_uc.Stop()
+        if self.recorder is not None:
+            self.stop_record()
         self.Destroy()
 
     def save_file(self):
@@ -1061,10 +1290,11 @@ class VbusChart(wx.Frame):
                                                     os.W_OK)):
                 self.dirname = dirname
                 rows = None
+                xd, yd, y2d = self.samples.columns()
                 if volt_flg:
-                    rows = zip(self.xd, self.yd)
+                    rows = zip(xd.tolist(), yd.tolist())
                 else:
-                    rows = zip(self.xd, self.y2d)
+                    rows = zip(xd.tolist(), y2d.tolist())
                 with open(filename, 'w', newline='') as csvfile:
                     csvwriter = csv.writer(csvfile)
                     fields = None
@@ -1106,7 +1336,8 @@ class VbusChart(wx.Frame):
             if (os.path.isdir(dirname) and os.access(dirname, os.X_OK | 
                                                     os.W_OK)):
                 self.dirname = dirname
-                rows = zip(self.xd, self.yd, self.y2d)
+                xd, yd, y2d = self.samples.columns()
+                rows = zip(xd.tolist(), yd.tolist(), y2d.tolist())
                 with open(filename, 'w', newline='') as csvfile:
                     csvwriter = csv.writer(csvfile)
                     fields = ['Time(Sec)', 'Volts', 'Amps']
@@ -1130,18 +1361,19 @@ class VbusChart(wx.Frame):
         Returns: 
         return- success for file save in directiry
         """
-        if 'Volts' in self.loadheaders and \
-            'Amps' in self.loadheaders:
+        # A pyramid is built for each column found in the file
+        if self.vlod is not None and \
+            self.alod is not None:
             if self.achart and self.vchart:
                 self.plot_csv_va()
             elif self.achart:
                 self.plot_csv_vora('Amps')
             elif self.vchart:
                 self.plot_csv_vora('Volts')
-        elif 'Volts' in self.loadheaders and \
+        elif self.vlod is not None and \
                self.vchart:
                 self.plot_csv_vora('Volts')
-        elif 'Amps' in self.loadheaders and \
+        elif self.alod is not None and \
                 self.achart:
                 self.plot_csv_vora('Amps')
                  
@@ -1157,18 +1389,16 @@ class VbusChart(wx.Frame):
         return- success for file save in directiry
         """
         self.ax.yaxis.set_visible(True)
+        self.remove_csv_lines()
        
         if param == 'Volts':
             self.ax2.yaxis.set_visible(False)
-            self.getvoltrange(max(self.voltdf))
+            self.getvoltrange(self.vlod.ymax)
         else:
             # convert negative values as positive
-            pamp = []
-            for i in range (0, len(self.ampdf)):
-                pamp.append(abs(self.ampdf[i]))
-
             self.ax2.yaxis.set_visible(False)
-            self.getamprange(False, max(pamp))
+            self.getamprange(False, max(abs(self.alod.ymin),
+                                        abs(self.alod.ymax)))
 
         self.calculatexticks()
 
@@ -1176,15 +1406,104 @@ class VbusChart(wx.Frame):
                                     linewidth = '0.5', color = 'grey')
         if param == 'Volts':
             self.ax2.yaxis.set_visible(False)
-            self.ax.plot(self.timedf, self.voltdf, linewidth = '1.5', color='red')
+            xd, yd = self.get_csv_view(self.vlod)
+            self.csv_lines = self.ax.plot(xd, yd, linewidth = '1.5', color='red')
             self.ax.plot(label = 'Volts',linewidth = '1.5', color='red')
             
         else:
             self.ax2.yaxis.set_visible(False)
-            self.ax.plot(self.timedf, self.ampdf, linewidth = '1.5', color='green')
+            xd, yd = self.get_csv_view(self.alod)
+            self.csv_lines = self.ax.plot(xd, yd, linewidth = '1.5', color='green')
             self.ax.plot(label = 'mA',linewidth = '1.5', color='green')
         self.canvas.draw()
 
+    def get_csv_view(self, lod):
+        """
+        Get the points of the loaded data in the visible X range.
+
+        Description:
+            The decimation pyramid gives about two points per pixel
+            column, however many samples the range covers, so zoom
+            and slide do not depend on the file size.
+
+        Args:
+            self: Reference to the current instance of the class.
+            lod (MinMaxPyramid): Pyramid of the volts or amps data.
+
+        Returns:
+            tuple: X and Y arrays to plot.
+        """
+        xlo, xhi = self.ax.get_xlim()
+        npix = max(int(self.ax.bbox.width), 1)
+        return lod.query(xlo, xhi, npix)
+
+    def remove_csv_lines(self):
+        """
+        Remove the lines of the previous view of the loaded data.
+
+        Args:
+            self: Reference to the current instance of the class.
+
+        Returns:
+            None
+        """
+        for line in self.csv_lines:
+            if line.axes is not None and line in line.axes.lines:
+                line.remove()
+        self.csv_lines = []
+
+    def build_lod(self, timedf, voltdf, ampdf):
+        """
+        Build the decimation pyramids of the loaded data.
+
+        Args:
+            self: Reference to the current instance of the class.
+            timedf: Time samples, list or array.
+            voltdf: Volts samples, empty if not loaded.
+            ampdf: Amps samples, empty if not loaded.
+
+        Returns:
+            None
+        """
+        self.vlod = None
+        self.alod = None
+        if len(timedf) == 0:
+            return
+        timedf = np.asarray(timedf)
+        self.trange = (timedf.min(), timedf.max())
+        if len(voltdf):
+            cnt = min(len(timedf), len(voltdf))
+            self.vlod = plotDecimate.MinMaxPyramid(timedf[:cnt],
+                                                   voltdf[:cnt])
+        if len(ampdf):
+            cnt = min(len(timedf), len(ampdf))
+            self.alod = plotDecimate.MinMaxPyramid(timedf[:cnt],
+                                                   ampdf[:cnt])
+
+    def load_capture(self, pathname):
+        """
+        Load a capture file recorded with the Record button.
+
+        Description:
+            The file is memory mapped, the decimation pyramids read
+            it once and the plot only touches the visible part.
+
+        Args:
+            self: Reference to the current instance of the class.
+            pathname: Capture file.
+
+        Returns:
+            None
+        """
+        try:
+            data = captureFile.load_capture(pathname)
+        except (OSError, ValueError):
+            wx.LogError("Can not open file '%s', " % pathname)
+            return
+        self.loadheaders = ['Time(Sec)', 'Volts', 'Amps']
+        self.build_lod(data[:, 0], data[:, 1], data[:, 2])
+        self.plot_csv()
+
     def calculatexticks(self):
         """
         Calculate and Configure X-Axis Tick Marks for Chart Visualization.
@@ -1208,8 +1527,7 @@ class VbusChart(wx.Frame):
         xzoom = [0.1, 0.25, 0.5, 1, 2, 4, 8, 10, 20, 30, 40]
         xunit = xzoom[self.xzval]
        
-        xmin = min(self.timedf)
-        xmax = max(self.timedf)
+        xmin, xmax = self.trange
         
         xmin = round(xmin)
         if xmin > 1:
@@ -1246,25 +1564,25 @@ class VbusChart(wx.Frame):
         """
         self.ax.yaxis.set_visible(True)
         self.ax2.yaxis.set_visible(True)
+        self.remove_csv_lines()
 
         self.calculatexticks()
 
-        self.getvoltrange(max(self.voltdf))
+        self.getvoltrange(self.vlod.ymax)
 
         # convert negative values 
-        pamp = []
-        for i in range (0, len(self.ampdf)):
-            pamp.append(abs(self.ampdf[i]))
-        self.getamprange(True, max(pamp))
+        self.getamprange(True, max(abs(self.alod.ymin), abs(self.alod.ymax)))
 
         self.ax.grid(which='major', linestyle = '-', 
                                     linewidth = '0.5', color = 'grey')
-        self.ax.plot(self.timedf, self.voltdf, linewidth = '1.5', color='red')
+        xd, yd = self.get_csv_view(self.vlod)
+        self.csv_lines = self.ax.plot(xd, yd, linewidth = '1.5', color='red')
         self.ax.plot(label = 'Volts',linewidth = '1.5', color='red')
 
         self.ax2.grid(which='minor', linestyle = ':', 
                                     linewidth = '0.5', color = 'grey')
-        self.ax2.plot(self.timedf, self.ampdf, linewidth = '1.5', color='green')
+        xd, y2d = self.get_csv_view(self.alod)
+        self.csv_lines += self.ax2.plot(xd, y2d, linewidth = '1.5', color='green')
         self.ax2.plot(label = 'Amps', linewidth = '1.5', color='green')
         self.canvas.draw()
     
@@ -1274,7 +1592,8 @@ class VbusChart(wx.Frame):
 
         This method opens a file selection dialog that allows the user
         to browse and select a CSV file containing Voltage and/or Current
-        time-series data for plotting in the VBUS chart.
+        time-series data for plotting in the VBUS chart, or a capture
+        file recorded with the Record button.
         Args:
             self: Reference to the current instance of the class.
                   Provides access to UI components, chart buffers,
@@ -1287,13 +1606,18 @@ class VbusChart(wx.Frame):
             None
         """
         self.dirname=""
-        dlg = wx.FileDialog(self, "Load File", self.dirname, "", "*.csv", 
+        dlg = wx.FileDialog(self, "Load File", self.dirname, "", 
+                            "CSV files (*.csv)|*.csv|"
+                            "VBUS capture (*.npy)|*.npy", 
                                 wx.FD_OPEN | wx.FD_FILE_MUST_EXIST)
         
         if dlg.ShowModal() == wx.ID_CANCEL:
             return
         
         pathname = dlg.GetPath()
+        if pathname.lower().endswith(".npy"):
+            self.load_capture(pathname)
+            return
         self.loadheaders = None
         try:
             with open(pathname, "r") as file:
@@ -1320,6 +1644,7 @@ class VbusChart(wx.Frame):
                             self.ampdf.append(float(row[idx]))
                     except:
                        pass
+            self.build_lod(self.timedf, self.voltdf, self.ampdf)
             self.plot_csv()
         except IOError:
             wx.LogError("Can not open file '%s', " % pathname)
\ No newline at end of file
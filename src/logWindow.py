@@ -12,6 +12,9 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Refresh scans on the USB scan worker
+#
 ##############################################################################
 # Lib imports
 import wx
@@ -21,7 +24,6 @@ from uiGlobals import *
 from datetime import datetime
 
 import wx
-import threading
 
 
 # Own modules
@@ -233,7 +235,7 @@ class LogWindow(wx.Window):
         if(self.wait_flg == False):
             self.btn_ref.Disable()
             self.wait_flg = True
-            threading.Thread(target=self.UsbThread).run()
+            thControl.request_tree_change(self.top, self.UsbScanDone)
 
     def disable_usb_scan(self):
         """
@@ -249,23 +251,23 @@ class LogWindow(wx.Window):
         """
         self.chk_usb.SetValue(False)
     
-    def UsbThread(self):
+    def UsbScanDone(self, err):
         """
-        Thread for USB tree view changes
-        Start the USB device scan and list the difference catagorized by 
-        Added and Removed
+        Called when the USB device scan started by the Refresh
+        button is done, the difference catagorized by Added and
+        Removed is already listed
 
         Args:
             self: The self parameter is a reference to the current 
             instance of the class,and is used to access variables
             that belongs to the class.
+            err: error of the scan, None on success
         Returns:
             None
         """
-        # thControl.get_tree_change(self.top)
-        try:
-            thControl.get_tree_change(self.top)
-        except Exception as err:
+        if not self:
+            return
+        if err is not None:
             # print message
             self.print_on_log("USB Read Error!")
             self.print_on_log("USB RE Msg: "+str(err))
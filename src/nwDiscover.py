@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+# Module: nwDiscover.py
+#
+# Description:
+#     Zero-configuration discovery of Control Computer and Test Host
+#     servers on the local network.
+#
+#     Every running server answers a UDP broadcast probe with a beacon
+#     holding its role, OS, port and attached switches. A client finds
+#     all servers with one broadcast instead of connecting to every host.
+#
+# Author:
+#     Vinay N, MCCI Corporation Feb 2026
+#
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import json
+import socket
+import sys
+import threading
+import time
+
+##############################################################################
+# Discovery Constants
+##############################################################################
+
+# UDP port all servers listen on for probes
+DISCOVERY_PORT = 2023
+
+# Seconds a client collects beacons after its probe
+DISCOVERY_WAIT = 0.5
+
+# Seconds between stop checks of a responder
+RESPONDER_POLL = 0.5
+
+# Server roles
+ROLE_CC = "cc"
+ROLE_THC = "thc"
+
+def probe_message(role=None):
+    """
+    Build a discovery probe.
+
+    Args:
+        role: Only servers of this role answer, None for all.
+
+    Returns:
+        dict: Probe message.
+    """
+    msgdict = {}
+    msgdict["ctype"] = "discover"
+    msgdict["cmd"] = "probe"
+    if role is not None:
+        msgdict["role"] = role
+    return msgdict
+
+##############################################################################
+# Server Side
+##############################################################################
+
+class BeaconResponder(threading.Thread):
+    """
+    Answers discovery probes for one server.
+
+    Several responders can share DISCOVERY_PORT on one computer, a
+    broadcast probe reaches all of them.
+    """
+
+    def __init__(self, role, port, get_info=None):
+        """
+        Initialize the responder.
+
+        Args:
+            self: Reference to current instance.
+            role: ROLE_CC or ROLE_THC.
+            port: TCP port of the server.
+            get_info: Returns a dict merged into every beacon,
+                called on each probe so the beacon stays current.
+
+        Returns:
+            None
+        """
+        super(BeaconResponder, self).__init__(name="BeaconResponder",
+                                              daemon=True)
+        self.role = role
+        self.port = port
+        self.get_info = get_info
+        self._running = True
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self.sock.settimeout(RESPONDER_POLL)
+        self.sock.bind(("", DISCOVERY_PORT))
+
+    def beacon(self):
+        """
+        Build the beacon describing this server.
+
+        Args:
+            self: Reference to current instance.
+
+        Returns:
+            dict: Beacon message.
+        """
+        msgdict = {}
+        msgdict["ctype"] = "discover"
+        msgdict["cmd"] = "beacon"
+        msgdict["role"] = self.role
+        msgdict["port"] = self.port
+        msgdict["os"] = sys.platform
+        msgdict["name"] = socket.gethostname()
+        if self.get_info is not None:
+            msgdict.update(self.get_info())
+        return msgdict
+
+    def run(self):
+        """
+        Answer probes until closed.
+
+        Args:
+            self: Reference to current instance.
+
+        Returns:
+            None
+        """
+        while self._running:
+            try:
+                data, addr = self.sock.recvfrom(1024)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            try:
+                msgdict = json.loads(data.decode("utf-8"))
+            except ValueError:
+                continue
+            if (not isinstance(msgdict, dict) or
+                    msgdict.get("ctype") != "discover" or
+                    msgdict.get("cmd") != "probe"):
+                continue
+            if msgdict.get("role", self.role) != self.role:
+                continue
+            try:
+                self.sock.sendto(json.dumps(self.beacon()).encode("utf-8"),
+                                 addr)
+            except OSError:
+                pass
+        self.sock.close()
+
+    def close(self):
+        """
+        Stop answering probes.
+
+        Args:
+            self: Reference to current instance.
+
+        Returns:
+            None
+        """
+        self._running = False
+
+def start_responder(role, port, get_info=None):
+    """
+    Start answering discovery probes for a server.
+
+    Args:
+        role: ROLE_CC or ROLE_THC.
+        port: TCP port of the server.
+        get_info: See BeaconResponder.
+
+    Returns:
+        BeaconResponder:
+            Running responder, None if the discovery
+            port is not available.
+    """
+    try:
+        responder = BeaconResponder(role, port, get_info)
+    except OSError:
+        return None
+    responder.start()
+    return responder
+
+##############################################################################
+# Client Side
+##############################################################################
+
+def discover_nodes(role=None, wait=DISCOVERY_WAIT, on_found=None,
+                   addrs=None):
+    """
+    Broadcast a probe and collect the beacons of all servers.
+
+    Args:
+        role: Only find servers of this role, None for all.
+        wait: Seconds to collect beacons.
+        on_found: Called with each beacon as it arrives.
+        addrs: Addresses to probe, the local broadcast
+            address by default.
+
+    Returns:
+        list:
+            Beacons, each with the server address in "ip".
+    """
+    if addrs is None:
+        addrs = [("<broadcast>", DISCOVERY_PORT)]
+    nodes = []
+    seen = set()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        probe = json.dumps(probe_message(role)).encode("utf-8")
+        for addr in addrs:
+            try:
+                sock.sendto(probe, addr)
+            except OSError:
+                pass
+        deadline = time.monotonic() + wait
+        while True:
+            remain = deadline - time.monotonic()
+            if remain <= 0:
+                break
+            sock.settimeout(remain)
+            try:
+                data, addr = sock.recvfrom(4096)
+            except socket.timeout:
+                break
+            except OSError:
+                continue
+            try:
+                node = json.loads(data.decode("utf-8"))
+            except ValueError:
+                continue
+            if (not isinstance(node, dict) or
+                    node.get("cmd") != "beacon" or
+                    (role is not None and node.get("role") != role)):
+                continue
+            node["ip"] = addr[0]
+            key = (node["ip"], node.get("role"), node.get("port"))
+            if key in seen:
+                continue
+            seen.add(key)
+            nodes.append(node)
+            if on_found is not None:
+                on_found(node)
+    finally:
+        sock.close()
+    return nodes
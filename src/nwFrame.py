@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+# Module: nwFrame.py
+#
+# Description:
+#     Message framing for the CC and TH socket protocols.
+#
+#     Every message on the wire is a 4 byte big-endian length header
+#     followed by that many bytes of UTF-8 JSON. This lets both sides
+#     keep one socket open for many requests and know exactly when a
+#     message is complete.
+#
+#     When msgpack is installed on both sides, a connection can agree
+#     on the compact msgpack encoding instead. The top bit of the
+#     header marks a msgpack payload, JSON stays the fallback.
+#
+# Author:
+#     Vinay N, MCCI Corporation Feb 2026
+#
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import json
+import socket
+import struct
+
+# Lib imports
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+##############################################################################
+# Frame Constants
+##############################################################################
+
+FRAME_HEADER = struct.Struct("!I")
+
+# Upper bound for a single message, guards against a corrupt header
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+# Header bit set on msgpack encoded frames
+FLAG_PACK = 0x80000000
+
+# Payload encodings
+ENC_JSON = "json"
+ENC_PACK = "pack"
+
+def get_encodings():
+    """
+    Encodings this side can use, most compact first.
+
+    Returns:
+        list: Encoding names.
+    """
+    if msgpack is not None:
+        return [ENC_PACK, ENC_JSON]
+    return [ENC_JSON]
+
+def choose_encoding(offered):
+    """
+    Pick the encoding for a connection from the peer's offer.
+
+    Args:
+        offered: Encoding names the peer can use.
+
+    Returns:
+        str: First of our encodings the peer also offered.
+    """
+    for enc in get_encodings():
+        if enc in offered:
+            return enc
+    return ENC_JSON
+
+def hello_request():
+    """
+    Build the request offering our encodings to a server.
+
+    Returns:
+        dict: Request dictionary.
+    """
+    reqdict = {}
+    reqdict["ctype"] = "session"
+    reqdict["cmd"] = "hello"
+    reqdict["enc"] = get_encodings()
+    return reqdict
+
+def hello_reply(reqdict):
+    """
+    Answer an encoding offer.
+
+    Args:
+        reqdict: Hello request from the client.
+
+    Returns:
+        dict: Reply dictionary, "enc" is the chosen encoding.
+    """
+    rdict = {}
+    rdict["data"] = "success"
+    rdict["enc"] = choose_encoding(reqdict.get("enc", []))
+    return rdict
+
+def get_reply_encoding(rdict):
+    """
+    Encoding agreed in a hello reply. A server that does not
+    know the hello request answers without one, so JSON is used.
+
+    Args:
+        rdict: Reply to the hello request.
+
+    Returns:
+        str: Encoding of the connection.
+    """
+    if rdict is None:
+        return ENC_JSON
+    return choose_encoding([rdict.get("enc", ENC_JSON)])
+
+##############################################################################
+# Frame Helpers
+##############################################################################
+
+def is_framed(sock):
+    """
+    Check whether the peer speaks the framed protocol.
+
+    Older clients send a bare JSON object, which always starts
+    with '{'. A framed message starts with the length header.
+
+    Args:
+        sock: Connected socket.
+
+    Returns:
+        bool:
+            False for a legacy bare JSON request, True otherwise.
+
+    Raises:
+        socket.timeout:
+            If the peer sends nothing within the socket timeout.
+    """
+    try:
+        first = sock.recv(1, socket.MSG_PEEK)
+    except socket.timeout:
+        raise
+    except OSError:
+        return True
+    return first != b"{"
+
+def recv_exact(sock, size):
+    """
+    Receive exactly size bytes from the socket.
+
+    Args:
+        sock: Connected socket.
+        size: Number of bytes to receive.
+
+    Returns:
+        bytearray:
+            Received bytes, or None if the peer closed
+            the connection before all bytes arrived.
+    """
+    buf = bytearray(size)
+    view = memoryview(buf)
+    got = 0
+    while got < size:
+        n = sock.recv_into(view[got:], size - got)
+        if n == 0:
+            return None
+        got += n
+    return buf
+
+def encode_frame(msgdict, enc=ENC_JSON):
+    """
+    Encode one message with its length header.
+
+    Args:
+        msgdict: Message dictionary.
+        enc: Payload encoding of the connection.
+
+    Returns:
+        bytes: Header and payload, ready to send.
+    """
+    if enc == ENC_PACK:
+        payload = msgpack.packb(msgdict, use_bin_type=True)
+        return FRAME_HEADER.pack(len(payload) | FLAG_PACK) + payload
+    payload = json.dumps(msgdict).encode("utf-8")
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+def decode_header(header):
+    """
+    Decode a length header.
+
+    Args:
+        header: FRAME_HEADER.size bytes.
+
+    Returns:
+        tuple: (payload size, True if the payload is msgpack)
+
+    Raises:
+        ValueError:
+            If the header announces an oversized frame or
+            a msgpack payload that cannot be decoded here.
+    """
+    (size,) = FRAME_HEADER.unpack(header)
+    packed = bool(size & FLAG_PACK)
+    size &= ~FLAG_PACK
+    if size > MAX_FRAME_SIZE:
+        raise ValueError("Frame too large: " + str(size))
+    if packed and msgpack is None:
+        raise ValueError("msgpack frame received without msgpack")
+    return size, packed
+
+def decode_payload(payload, packed):
+    """
+    Decode a frame payload.
+
+    Args:
+        payload: Payload bytes.
+        packed: True if the payload is msgpack.
+
+    Returns:
+        dict: Decoded message.
+    """
+    if packed:
+        return msgpack.unpackb(bytes(payload), raw=False)
+    return json.loads(payload.decode("utf-8"))
+
+def send_frame(sock, msgdict, enc=ENC_JSON):
+    """
+    Send one framed message.
+
+    Args:
+        sock: Connected socket.
+        msgdict: Message dictionary.
+        enc: Payload encoding of the connection.
+
+    Returns:
+        None
+    """
+    sock.sendall(encode_frame(msgdict, enc))
+
+def recv_frame(sock):
+    """
+    Receive one framed message in either encoding.
+
+    Args:
+        sock: Connected socket.
+
+    Returns:
+        dict:
+            Decoded message, or None if the peer closed
+            the connection.
+
+    Raises:
+        ValueError:
+            If the header announces an oversized frame.
+    """
+    header = recv_exact(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+    size, packed = decode_header(header)
+    payload = recv_exact(sock, size)
+    if payload is None:
+        return None
+    return decode_payload(payload, packed)
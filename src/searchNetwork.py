@@ -13,6 +13,10 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Concurrent subnet scan reporting every responding node
+#         Find servers from their UDP discovery beacons first
+#
 ##############################################################################
 
 # Lib imports
@@ -22,18 +26,112 @@ import wx
 from uiGlobals import *
 
 # Built-in imports
+import errno
+import selectors
 import threading
 import socket
+import time
 
 # Configuration imports
 import configdata
+import nwDiscover
 
 CC_PORT = 2021
 HC_PORT = 2022
 
+# Discovery role of each panel type
+NODE_ROLES = {"SCC": nwDiscover.ROLE_CC, "THC": nwDiscover.ROLE_THC}
+
+# Connect timeout of one probe, in seconds
+SCAN_TIMEOUT = 0.3
+
+# Probes in flight at once, a whole /24 fits in one timeout period
+SCAN_CONCURRENCY = 255
+
 ##############################################################################
 # Utilities
 ##############################################################################
+
+# Non-blocking connect still in progress
+CONNECT_PENDING = (0, errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY,
+                   getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK))
+
+def scan_hosts(hosts, port, timeout=SCAN_TIMEOUT,
+               concurrency=SCAN_CONCURRENCY, stop_event=None,
+               on_found=None, on_progress=None):
+    """
+    Probe hosts for a listening TCP port.
+
+    Up to concurrency non-blocking connects are in flight at once
+    and a selector waits for them to complete or time out.
+
+    Args:
+        hosts: IP addresses to probe.
+        port: Port number to connect to.
+        timeout: Connect timeout of one probe, in seconds.
+        concurrency: Most probes in flight at once.
+        stop_event: Ends the scan early when set.
+        on_found: Called with each responding host.
+        on_progress: Called with (probed, total) as probes finish.
+
+    Returns:
+        list:
+            Responding hosts, in the order they answered.
+    """
+    todo = list(hosts)
+    todo.reverse()
+    total = len(todo)
+    done = 0
+    found = []
+    sel = selectors.DefaultSelector()
+
+    def finish(sock, host, ok):
+        nonlocal done
+        sel.unregister(sock)
+        sock.close()
+        done += 1
+        if ok:
+            found.append(host)
+            if on_found is not None:
+                on_found(host)
+        if on_progress is not None:
+            on_progress(done, total)
+
+    try:
+        while todo or sel.get_map():
+            if stop_event is not None and stop_event.is_set():
+                break
+            while todo and len(sel.get_map()) < concurrency:
+                host = todo.pop()
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                err = sock.connect_ex((host, port))
+                if err not in CONNECT_PENDING:
+                    sock.close()
+                    done += 1
+                    if on_progress is not None:
+                        on_progress(done, total)
+                    continue
+                sel.register(sock, selectors.EVENT_WRITE,
+                             (host, time.monotonic() + timeout))
+            if not sel.get_map():
+                continue
+            now = time.monotonic()
+            deadline = min(key.data[1] for key in sel.get_map().values())
+            for key, events in sel.select(max(deadline - now, 0)):
+                err = key.fileobj.getsockopt(socket.SOL_SOCKET,
+                                             socket.SO_ERROR)
+                finish(key.fileobj, key.data[0], err == 0)
+            now = time.monotonic()
+            for key in list(sel.get_map().values()):
+                if key.data[1] <= now:
+                    finish(key.fileobj, key.data[0], False)
+    finally:
+        for key in list(sel.get_map().values()):
+            key.fileobj.close()
+        sel.close()
+    return found
+
 class ScanNwThread(threading.Thread):
     """
     Thread class used for scanning network nodes.
@@ -48,7 +146,8 @@ class ScanNwThread(threading.Thread):
         btnScan: Scan button reference.
         completed_event: Thread stop event flag.
     """
-    def __init__(self, port, txtsysip, txtctrl, btnScan, name="NwScanThread"):
+    def __init__(self, port, txtsysip, txtctrl, btnScan, name="NwScanThread",
+                 concurrency=SCAN_CONCURRENCY, role=None, on_beacon=None):
         """
         Initialize network scanning thread.
 
@@ -58,6 +157,9 @@ class ScanNwThread(threading.Thread):
             txtctrl: Network IP combo control.
             btnScan: Scan button reference.
             name: Thread name.
+            concurrency: Most probes in flight at once.
+            role: Discovery role of the servers to find.
+            on_beacon: Called with each discovery beacon.
 
         Returns:
             None
@@ -66,6 +168,10 @@ class ScanNwThread(threading.Thread):
         self.txtctrl = txtctrl
         self.txtsysip = txtsysip
         self.btnScan = btnScan
+        self.concurrency = concurrency
+        self.role = role
+        self.on_beacon = on_beacon
+        self.nodes = []
         
         self.completed_event = threading.Event()
         threading.Thread.__init__(self, name=name)
@@ -74,8 +180,10 @@ class ScanNwThread(threading.Thread):
         """
         Execute subnet scanning process.
 
-        Searches IP range and detects
-        available server nodes.
+        Servers answering the discovery probe are listed
+        first, then the rest of the IP range is probed
+        concurrently for servers without discovery. Every
+        node found is added to the IP combo right away.
 
         Args:
             self: Instance reference.
@@ -87,24 +195,65 @@ class ScanNwThread(threading.Thread):
         wx.CallAfter(self.txtsysip.SetLabel, str(subnet))
         ips = str(subnet).split(".")
         strsn = str(ips[0])+"."+str(ips[1])+"."+str(ips[2])
-        portip = "No Node found"
-        for ip in range(0, 255):
-            if self.completed_event.is_set():
-                break
-            host = strsn+"."+str(ip)
-            wx.CallAfter(print, f"Searching IP: {host}")
-            try:
-                s =  socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                s.settimeout(0.3)
-                result = s.connect((host, self.port))
-                portip = host
-                s.close()
-                break
-            except:
-                s.close()
+        wx.CallAfter(self.txtctrl.Clear)
+        beacons = nwDiscover.discover_nodes(self.role,
+                                            on_found=self.beacon_found)
+        self.nodes = [node["ip"] for node in beacons]
+        hosts = [strsn+"."+str(ip) for ip in range(0, 255)]
+        hosts = [host for host in hosts if host not in self.nodes]
+        self.nodes += scan_hosts(hosts, self.port,
+                                 concurrency=self.concurrency,
+                                 stop_event=self.completed_event,
+                                 on_found=self.node_found,
+                                 on_progress=self.scan_progress)
+        if self.nodes:
+            portip = self.nodes[0]
+        else:
+            portip = "No Node found"
         
         wx.CallAfter(self.txtctrl.SetValue, portip)
         wx.CallAfter(self.btnScan.SetLabel, "scan network")
+
+    def node_found(self, host):
+        """
+        Add a responding node to the IP combo.
+
+        Args:
+            host: IP address of the node.
+
+        Returns:
+            None
+        """
+        wx.CallAfter(self.txtctrl.Append, host)
+
+    def beacon_found(self, node):
+        """
+        Add a server found by its discovery beacon.
+
+        Args:
+            node: Beacon of the server.
+
+        Returns:
+            None
+        """
+        self.node_found(node["ip"])
+        if self.on_beacon is not None:
+            wx.CallAfter(self.on_beacon, node)
+
+    def scan_progress(self, probed, total):
+        """
+        Show scan progress in the IP combo.
+
+        Args:
+            probed: Probes finished so far.
+            total: Probes in the scan.
+
+        Returns:
+            None
+        """
+        if probed % 16 == 0 or probed == total:
+            wx.CallAfter(self.txtctrl.SetValue,
+                         f"searching {probed}/{total}")
     
     def join(self, timeout = None):
         """
@@ -170,8 +319,10 @@ class SearchNetwork(wx.Panel):
         self.scan_flg = False
         self.searchthread = None
         self.ostype = "win32"
+        self.beacons = {}
         # self.vboxParent = wx.BoxSizer(wx.VERTICAL)
         self.scan_network()
+        self.StartDiscovery()
         
     def scan_network(self):
         """
@@ -239,6 +390,7 @@ class SearchNetwork(wx.Panel):
                        wx.LEFT, border = 10)
         self.btn_scannwc.Bind(wx.EVT_BUTTON, self.ScanNetworkComp)
         self.btn_save.Bind(wx.EVT_BUTTON, self.SaveNetworkComp)
+        self.tc_nwcip.Bind(wx.EVT_COMBOBOX, self.NodeSelected)
 
         self.Bind(wx.EVT_RADIOBUTTON, self.SelectOsChanged)
       
@@ -254,6 +406,75 @@ class SearchNetwork(wx.Panel):
         self.Layout()
         self.set_param()
     
+    def StartDiscovery(self):
+        """
+        List the servers answering the discovery probe.
+
+        Runs in the background, the beacons arrive
+        within DISCOVERY_WAIT.
+
+        Args:
+            self: Instance reference.
+
+        Returns:
+            None
+        """
+        role = NODE_ROLES.get(self.ctype)
+        threading.Thread(target=nwDiscover.discover_nodes,
+                         kwargs={"role": role,
+                                 "on_found": self.DiscoveredNode},
+                         name="NwDiscoverThread", daemon=True).start()
+
+    def DiscoveredNode(self, node):
+        """
+        Called from the discovery thread with each beacon.
+
+        Args:
+            node: Beacon of the server.
+
+        Returns:
+            None
+        """
+        wx.CallAfter(self.add_beacon, node)
+
+    def add_beacon(self, node):
+        """
+        Remember a discovered server and offer it in the IP combo.
+
+        Args:
+            node: Beacon of the server.
+
+        Returns:
+            None
+        """
+        if not self:
+            return
+        self.beacons[node["ip"]] = node
+        if self.tc_nwcip.FindString(node["ip"]) == wx.NOT_FOUND:
+            self.tc_nwcip.Append(node["ip"])
+
+    def NodeSelected(self, e):
+        """
+        Fill in port and OS of a discovered server.
+
+        Args:
+            e: wx Event object.
+
+        Returns:
+            None
+        """
+        node = self.beacons.get(self.tc_nwcip.GetValue())
+        if node is None:
+            return
+        self.tc_port.SetValue(str(node["port"]))
+        self.ostype = node.get("os", self.ostype)
+        if self.ostype == "win32":
+            self.rb_win.SetValue(True)
+        elif self.ostype == "linux":
+            self.rb_linux.SetValue(True)
+        elif self.ostype == "darwin":
+            self.rb_mac.SetValue(True)
+
     def SaveNetworkComp(self, e):
         """
         Save scanned network configuration.
@@ -355,7 +576,9 @@ class SearchNetwork(wx.Panel):
 
         if self.searchthread != None:
             del self.searchthread
-        self.searchthread = ScanNwThread(port, self.st_sysip, self.tc_nwcip, self.btn_scannwc)
+        self.searchthread = ScanNwThread(port, self.st_sysip, self.tc_nwcip, self.btn_scannwc,
+                                         role=NODE_ROLES.get(self.ctype),
+                                         on_beacon=self.add_beacon)
 
         self.searchthread.start()
             
@@ -12,6 +12,9 @@
 # Revision history:
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
+#
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         USB tree scan on the background worker
 ##############################################################################
 # Lip imports
 import wx
@@ -373,11 +376,26 @@ class Dev2301Window(wx.Window):
             None
         """
         self.timer_usb.Stop()
-        try:
-            thControl.get_tree_change(self.top)
-        except:
+        thControl.request_tree_change(self.top, self.UsbScanDone)
+
+    def UsbScanDone(self, err):
+        """
+        Called on the UI thread when the USB tree scan started
+        by UsbTimer is done
+
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            err: error of the scan, None on success
+        Returns:
+            None
+        """
+        if not self:
+            return
+        if err is not None:
             # to print on usb tree view change "USB Read Error!"
-            self.top.print_on_usb("USB Read Error!")
+            self.top.print_on_log("USB Read Error!")
         self.usb_flg = False
     
     def VaTimer(self, e):
@@ -605,6 +623,21 @@ class Dev2301Window(wx.Window):
         """
         self.usb_flg = True
         self.timer_usb.Start(int(self.top.get_enum_delay()))
+        self.top.watch_usb_change(self.UsbChangeSeen)
+
+    def UsbChangeSeen(self):
+        """
+        USB devices settled before the delay timer ran out,
+        read the USB tree right away
+        Args:
+            self: The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+        Returns:
+            None
+        """
+        if self and self.timer_usb.IsRunning():
+            self.UsbTimer(None)
 
     def port_led_update(self, port, stat):
         """
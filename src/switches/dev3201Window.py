@@ -12,6 +12,10 @@
 # Revision history:
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
+#
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         USB tree scan on the background worker
+#         VBUS sampled by a sampler thread, samples timestamped
 ##############################################################################
 # Lip imports
 import wx
@@ -23,10 +27,45 @@ import time
 # Own modules
 import devControl as model
 import thControl
+import vaSampler
 from uiGlobals import *
 
 PORTS = 4
 
+def parse_volts(reply):
+    """
+    Volts of a 3201 volts reply
+
+    Args:
+        reply: (result, reply string) of the volts command
+    Returns:
+        float: volts, None when the reply has no value
+    """
+    res, outstr = reply
+    try:
+        if res >= 0 and outstr != "":
+            return int(outstr.split('\n')[0]) / 100
+    except ValueError:
+        pass
+    return None
+
+def parse_amps(reply):
+    """
+    Amps of a 3201 amps reply, the first digit is the sign
+
+    Args:
+        reply: (result, reply string) of the amps command
+    Returns:
+        float: amps without sign, None when the reply has no value
+    """
+    res, outstr = reply
+    try:
+        if res >= 0 and outstr != "":
+            return int(outstr.split('\n')[0][1:]) / 100
+    except ValueError:
+        pass
+    return None
+
 ##############################################################################
 # Utilities
 ##############################################################################
@@ -63,6 +102,11 @@ class Dev3201Window(wx.Window):
         self.fv = None
         self.fa = None
 
+        self.va_stream = None
+        self.va_poll = False
+        self.va_t0 = None
+        self.va_sampler = None
+
         self.con_flg = None
 
         self.pcnt = 0
@@ -211,6 +255,7 @@ class Dev3201Window(wx.Window):
         self.Bind(wx.EVT_TIMER, self.GraphTimer, self.timer_vu)
         self.Bind(wx.EVT_TIMER, self.SafeTimer, self.timer_safe)
         self.Bind(wx.EVT_TIMER, self.PortOnTimer, self.timer_port)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.OnDestroy)
         
         # Bind the button event to handler
         self.Bind(wx.EVT_RADIOBUTTON, self.PortSpeedChanged)
@@ -275,7 +320,7 @@ class Dev3201Window(wx.Window):
         """
         self.get_voltage()
 
-    def get_voltage(self):
+    def get_voltage(self, reply=None):
         """
         Get device voltage and display 
 
@@ -283,19 +328,20 @@ class Dev3201Window(wx.Window):
             self:The self parameter is a reference to the current 
             instance of the class,and is used to access variables
             that belongs to the class.
+            reply: volts reply already read in a batch, if any
         Returns:
             None
         """
         strin = "***"
-        res, outstr = model.send_volts_cmd(self.top, self.swid)
+        if reply is None:
+            reply = model.send_volts_cmd(self.top, self.swid)
+        res, outstr = reply
         if res < 0:
             outstr = "Comm Error\n"
         else:
             outstr.replace(' ', '')
             if outstr != "":
-                vstr = outstr.split('\n')
-                iv = int(vstr[0])
-                self.fv = iv/100
+                self.fv = parse_volts(reply)
                 outstr = str(self.fv) + "V"
                 self.update_volts(outstr)
         # self.top.print_on_log("Volts : "+outstr+"\n")
@@ -317,10 +363,12 @@ class Dev3201Window(wx.Window):
         """
         self.get_amps()
     
-    def get_amps(self):
+    def get_amps(self, reply=None):
         
         strin = "---"
-        res, outstr = model.send_amps_cmd(self.top, self.swid)
+        if reply is None:
+            reply = model.send_amps_cmd(self.top, self.swid)
+        res, outstr = reply
         if res < 0:
             outstr = "Comm Error\n"
         else:
@@ -328,9 +376,7 @@ class Dev3201Window(wx.Window):
             if outstr != "":
                 astr = outstr.split('\n')
                 sstr = astr[0][:1]
-                rstr = astr[0][1:]
-                ia = int(rstr) 
-                self.fa =  ia/100 
+                self.fa = parse_amps(reply)
                 ss = ""
                 if(sstr == '1'):
                     ss = "-"
@@ -381,20 +427,36 @@ class Dev3201Window(wx.Window):
             None
         """
         self.timer_usb.Stop()
-        try:
-            thControl.get_tree_change(self.top)
-        except:
+        thControl.request_tree_change(self.top, self.UsbScanDone)
+
+    def UsbScanDone(self, err):
+        """
+        Called on the UI thread when the USB tree scan started
+        by UsbTimer is done
+
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            err: error of the scan, None on success
+        Returns:
+            None
+        """
+        if not self:
+            return
+        if err is not None:
             # to print on usb tree view change "USB Read Error!"
-            self.top.print_on_usb("USB Read Error!")
+            self.top.print_on_log("USB Read Error!")
         self.usb_flg = False
     
     def VaTimer(self, e):
         
         self.timer_va.Stop()
-        # Check voltage
-        self.get_voltage()
-        # Check amps
-        self.get_amps()
+        # Check voltage and amps in one batch
+        vreply, areply = model.send_batch_cmd(self.top,
+                    [("volts", self.swid), ("amps", self.swid)])
+        self.get_voltage(vreply)
+        self.get_amps(areply)
 
     def GraphTimer(self, e):
         """
@@ -409,17 +471,189 @@ class Dev3201Window(wx.Window):
             None
        """
         self.timer_vu.Stop()
-        # Check voltage
-        if(self.top.vgraph):
-            self.get_voltage()
-            self.top.vdata = self.fv
-        
-        # Check amps
-        if(self.top.agraph):
-            self.get_amps()
-            self.top.adata = self.fa
+        stat = (self.top.vgraph or self.top.agraph) and self.top.con_flg
+        if self.top.devCtrl == "local":
+            # The sampler thread reads the switch
+            self.update_va_sampler(stat)
+        elif self.top.devCtrl == "tcp" and not self.va_poll:
+            # Remote switch, the Control Computer pushes the samples
+            self.update_va_stream(stat)
+        else:
+            # Control Computer without streams, poll volts and amps
+            if(self.top.vgraph or self.top.agraph):
+                tsamp = time.monotonic()
+                vreply, areply = model.send_batch_cmd(self.top,
+                            [("volts", self.swid), ("amps", self.swid)])
+                self.put_va_sample(tsamp, vreply, areply)
+                self.show_va_reply(vreply, areply)
+            else:
+                # Charts closed, the next chart tries a stream again
+                self.va_poll = False
         
         self.timer_vu.Start()
+
+    def update_va_stream(self, stat):
+        """
+        Start or stop the volts/amps stream from the Control Computer.
+        A server without streams or a stream that ends falls back
+        to polling until the charts close.
+
+        Args:
+            self: The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            stat: True while a chart needs volts or amps
+        Returns:
+            None
+        """
+        if stat and self.va_stream is None:
+            self.va_t0 = None
+            self.va_stream = model.start_va_stream(self.top, self.swid,
+                                        VA_STREAM_RATE, self.VaStreamData)
+            if self.va_stream is None:
+                self.va_poll = True
+        elif not stat and self.va_stream is not None:
+            model.stop_va_stream(self.top, self.va_stream)
+            self.va_stream = None
+
+    def update_va_sampler(self, stat):
+        """
+        Start or stop the volts/amps sampler thread of a local switch,
+        and show its newest sample. A sampler stopped by an error, e.g.
+        a disconnected switch, stays stopped until the chart closes.
+
+        Args:
+            self: The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            stat: True while a chart needs volts or amps
+        Returns:
+            None
+        """
+        if stat and self.va_sampler is None:
+            self.va_sampler = vaSampler.VaSampler(self.top, self.swid,
+                                VA_STREAM_RATE, parse_volts, parse_amps)
+            self.va_sampler.start()
+        elif not stat and self.va_sampler is not None:
+            self.va_sampler.stop()
+            self.va_sampler = None
+        if self.va_sampler is not None and self.va_sampler.reply is not None:
+            vreply, areply = self.va_sampler.reply
+            self.show_va_reply(vreply, areply)
+
+    def put_va_sample(self, tsamp, vreply, areply):
+        """
+        Put a volts and amps sample in the chart sample queue
+
+        Args:
+            self: The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            tsamp: monotonic time of the sample
+            vreply: volts reply
+            areply: amps reply
+        Returns:
+            None
+        """
+        self.top.va_samples.append((tsamp, parse_volts(vreply),
+                                    parse_amps(areply)))
+
+    def show_va_reply(self, vreply, areply):
+        """
+        Show volts and amps replies while a chart needs them
+
+        Args:
+            self: The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            vreply: volts reply
+            areply: amps reply
+        Returns:
+            None
+        """
+        if(self.top.vgraph):
+            self.get_voltage(vreply)
+        if(self.top.agraph):
+            self.get_amps(areply)
+
+    def stop_va_updates(self):
+        """
+        Stop the volts/amps stream or sampler of the switch
+
+        Args:
+            self: The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+        Returns:
+            None
+        """
+        self.update_va_stream(False)
+        self.update_va_sampler(False)
+        self.va_poll = False
+
+    def OnDestroy(self, e):
+        """
+        Window destroyed, stop the volts/amps updates so no sample
+        is posted to it any more
+
+        Args:
+            self: The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            e: window destroy event
+        Returns:
+            None
+        """
+        if e.GetEventObject() is self:
+            self.timer_vu.Stop()
+            self.stop_va_updates()
+        e.Skip()
+
+    def VaStreamData(self, frame):
+        """
+        Stream callback, runs on the client reader thread
+
+        Args:
+            self: The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            frame: frame pushed by the Control Computer
+        Returns:
+            None
+        """
+        wx.CallAfter(self.show_va_samples, frame)
+
+    def show_va_samples(self, frame):
+        """
+        Queue the streamed volts and amps samples for the chart and
+        show the newest
+
+        Args:
+            self: The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            frame: frame pushed by the Control Computer
+        Returns:
+            None
+        """
+        if not self:
+            return
+        if "error" in frame:
+            if self.va_stream is not None:
+                # Stream ended by the Control Computer, poll instead
+                self.va_stream = None
+                self.va_poll = True
+            return
+        if self.va_stream is None or not frame["samples"]:
+            return
+        if self.va_t0 is None:
+            # Stream times count from the subscription, map them
+            # to the monotonic clock of this computer
+            self.va_t0 = time.monotonic() - frame["samples"][-1][0]
+        for tsamp, vreply, areply in frame["samples"]:
+            self.put_va_sample(self.va_t0 + tsamp, vreply, areply)
+        tsamp, vreply, areply = frame["samples"][-1]
+        self.show_va_reply(vreply, areply)
       
     def port_on_manual(self, port):
         """
@@ -610,6 +844,21 @@ class Dev3201Window(wx.Window):
         """
         self.usb_flg = True
         self.timer_usb.Start(int(self.top.get_enum_delay()))
+        self.top.watch_usb_change(self.UsbChangeSeen)
+
+    def UsbChangeSeen(self):
+        """
+        USB devices settled before the delay timer ran out,
+        read the USB tree right away
+        Args:
+            self: The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+        Returns:
+            None
+        """
+        if self and self.timer_usb.IsRunning():
+            self.UsbTimer(None)
 
     def port_led_update(self, port, stat):
         """
@@ -844,6 +1093,7 @@ class Dev3201Window(wx.Window):
             self.auto_flg = False
             self.btn_auto.SetLabel("Start")
             self.timer.Stop()
+        self.stop_va_updates()
     
     def init_ports(self, port):
         """
@@ -17,11 +17,250 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Length-prefixed message framing
+#         Keep-alive connection pool with health check
+#         Negotiated msgpack/JSON message encoding
+#
 ##############################################################################
 
 # Built-in imports
+import select
 import socket
-import json
+import threading
+import time
+
+# Own modules
+import nwFrame
+
+##############################################################################
+# Connection Pool
+##############################################################################
+
+# Socket timeout for connect and for one request/response
+REQUEST_TIMEOUT = 6
+
+# Idle connections kept open per Test Host server
+POOL_SIZE = 2
+
+# Idle seconds after which a pooled connection is pinged before reuse
+PING_IDLE = 30
+
+class ThPool:
+    """
+    Keep-alive connections to one Test Host server.
+
+    Connections are reused across requests, a dead connection
+    is dropped and a new one opened on demand.
+    """
+
+    def __init__(self, host, port):
+        """
+        Initialize an empty pool.
+
+        Args:
+            self: Reference to current instance.
+            host: Server IP address.
+            port: Server port number.
+
+        Returns:
+            None
+        """
+        self.host = host
+        self.port = port
+        self.idle = []
+        self.lock = threading.Lock()
+        self.enc = {}
+
+    def connect(self):
+        """
+        Open a new connection to the server and agree on
+        the message encoding.
+
+        Args:
+            self: Reference to current instance.
+
+        Returns:
+            socket: Connected socket.
+        """
+        hs = socket.create_connection((self.host, self.port),
+                                      REQUEST_TIMEOUT)
+        hs.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        hs.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        try:
+            nwFrame.send_frame(hs, nwFrame.hello_request())
+            rdict = nwFrame.recv_frame(hs)
+            if rdict is None:
+                raise ConnectionError("TH server closed the connection")
+        except (OSError, ValueError):
+            hs.close()
+            raise
+        self.enc[hs] = nwFrame.get_reply_encoding(rdict)
+        return hs
+
+    def discard(self, hs):
+        """
+        Close a connection that is not returned to the pool.
+
+        Args:
+            self: Reference to current instance.
+            hs: Socket to close.
+
+        Returns:
+            None
+        """
+        self.enc.pop(hs, None)
+        hs.close()
+
+    def is_healthy(self, hs, last_used):
+        """
+        Check a pooled connection before reuse.
+
+        The server never sends unsolicited data, so a readable
+        idle socket means the peer closed it. A connection idle
+        for longer than PING_IDLE is pinged as well.
+
+        Args:
+            self: Reference to current instance.
+            hs: Pooled socket.
+            last_used: time.monotonic() of its last request.
+
+        Returns:
+            bool: True if the connection can be reused.
+        """
+        try:
+            readable, _, _ = select.select([hs], [], [], 0)
+            if readable:
+                return False
+            if time.monotonic() - last_used > PING_IDLE:
+                nwFrame.send_frame(hs, {"ctype": "session", "cmd": "ping"},
+                                   self.enc.get(hs, nwFrame.ENC_JSON))
+                return nwFrame.recv_frame(hs) is not None
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def acquire(self):
+        """
+        Take a healthy idle connection or open a new one.
+
+        Args:
+            self: Reference to current instance.
+
+        Returns:
+            tuple: (socket, True if the connection was reused)
+        """
+        while True:
+            with self.lock:
+                if not self.idle:
+                    break
+                hs, last_used = self.idle.pop()
+            if self.is_healthy(hs, last_used):
+                return hs, True
+            self.discard(hs)
+        return self.connect(), False
+
+    def release(self, hs):
+        """
+        Return a connection to the pool after a good request.
+
+        Args:
+            self: Reference to current instance.
+            hs: Socket to keep.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            if len(self.idle) < POOL_SIZE:
+                self.idle.append((hs, time.monotonic()))
+                return
+        self.discard(hs)
+
+    def request(self, reqdict):
+        """
+        Send one request and read its response. A failure on a
+        reused connection is retried once on a new connection.
+
+        Args:
+            self: Reference to current instance.
+            reqdict: Request dictionary.
+
+        Returns:
+            dict: Response from the server.
+
+        Raises:
+            OSError:
+                If the server cannot be reached.
+        """
+        while True:
+            hs, reused = self.acquire()
+            try:
+                nwFrame.send_frame(hs, reqdict,
+                                   self.enc.get(hs, nwFrame.ENC_JSON))
+                rcvd_obj = nwFrame.recv_frame(hs)
+                if rcvd_obj is None:
+                    raise ConnectionError("TH server closed the connection")
+            except (OSError, ValueError):
+                self.discard(hs)
+                if reused:
+                    continue
+                raise
+            self.release(hs)
+            return rcvd_obj
+
+    def close(self):
+        """
+        Close all idle connections.
+
+        Args:
+            self: Reference to current instance.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            idle = self.idle
+            self.idle = []
+        for hs, last_used in idle:
+            self.discard(hs)
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_pool(host, port):
+    """
+    Return the connection pool of a Test Host server.
+
+    Args:
+        host: Server IP address.
+        port: Server port number.
+
+    Returns:
+        ThPool: Pool for host/port.
+    """
+    with _pools_lock:
+        pool = _pools.get((host, port))
+        if pool is None:
+            pool = ThPool(host, port)
+            _pools[(host, port)] = pool
+        return pool
+
+def close_pools():
+    """
+    Close every pooled Test Host connection.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
 
 ##############################################################################
 # Client Request Handling
@@ -31,8 +270,9 @@ def send_request(host, port, reqdict):
     """
     Send request to Test Host Server.
 
-    Establishes socket connection with the server,
-    sends JSON request data, and waits for response.
+    Sends the framed request over a pooled keep-alive
+    connection and reads the framed response, which returns
+    as soon as its last byte arrives.
 
     Args:
         host: Server IP address.
@@ -46,39 +286,14 @@ def send_request(host, port, reqdict):
             - response data (if available)
 
     Raises:
-        socket.timeout:
-            If server response exceeds timeout duration.
-        Exception:
-            For any communication failure.
+        None
     """
-
-    # Create socket connection
-    hs = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    hs.connect((host, port))
-    hs.settimeout(6)
-
     rdict = {}
     rlist = []
     sdict = {}
 
     try:
-        # Convert request to JSON and send
-        data = json.dumps(reqdict)
-        hs.send(data.encode("utf-8"))
-
-        rcvd_data = b""  # Response buffer
-
-        while True:
-            rcvchunk = hs.recv(1024)
-            if not rcvchunk:
-                break
-            hs.settimeout(1)
-            rcvd_data += rcvchunk
-
-    except socket.timeout:
-        # Decode received response
-        rcvd_json = rcvd_data.decode("utf-8")
-        rcvd_obj = json.loads(rcvd_json)
+        rcvd_obj = get_pool(host, port).request(reqdict)
 
         sdict["status"] = "OK"
         rlist.append(sdict)
@@ -88,13 +303,10 @@ def send_request(host, port, reqdict):
         sdict["status"] = "fail"
         rlist.append(sdict)
 
-    finally:
-        hs.close()
-
     rdict["result"] = rlist
     return rdict
 
-def get_usb_tree(host, port):
+def get_usb_tree(host, port, thversion=None):
     """
     Retrieve USB tree information from Host Server.
 
@@ -104,6 +316,8 @@ def get_usb_tree(host, port):
     Args:
         host: Host computer IP address.
         port: Host server port number.
+        thversion: (epoch, version) of the last reply,
+            only changes since then are sent back.
 
     Returns:
         dict:
@@ -117,5 +331,7 @@ def get_usb_tree(host, port):
     reqdict = {}
     reqdict["ctype"] = "usb"
     reqdict["cmd"] = "lsusb"
+    if thversion is not None:
+        reqdict["epoch"], reqdict["since"] = thversion
 
     return send_request(host, port, reqdict)
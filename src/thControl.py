@@ -15,8 +15,18 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         USB tree scans on a background worker
+#
 ##############################################################################
 
+# Built-in imports
+import queue
+import threading
+
+# Lib imports
+import wx
+
 # Own modules
 import thClient as thnw
 import usbChange as thlocal
@@ -74,6 +84,8 @@ def ResetDeviceControl(top):
     Raises:
         None
     """
+    thnw.close_pools()
+    top.thversion = None
     if top.hcclient is not None:
         top.clienthc.close()
         top.hcclient.close()
@@ -88,6 +100,8 @@ def get_tree_change(top):
 
     Based on configured control mode, retrieves
     USB topology either locally or via network.
+    Blocks until the scan is done, UI windows use
+    request_tree_change() instead.
 
     Args:
         top: Reference to main application instance.
@@ -98,10 +112,23 @@ def get_tree_change(top):
     Raises:
         None
     """
+    apply_tree_change(top, scan_tree_change(top))
+
+def scan_tree_change(top):
+    """
+    Scan the USB tree, the slow part of a tree change.
+
+    Does not touch the UI, runs on the scan worker.
+
+    Args:
+        top: Reference to main application instance.
 
+    Returns:
+        tuple: (control mode, scan result) for apply_tree_change()
+    """
     # Local USB tree handling
     if top.thCtrl == "local":
-        thlocal.get_usb_change(top)
+        return (top.thCtrl, thlocal.scan_usb(top))
 
     # Network USB tree handling
     elif top.thCtrl == "tcp":
@@ -109,7 +136,34 @@ def get_tree_change(top):
         nwip = top.ucConfig["mynodes"]["mythc"]["tcp"]["ip"]
         nwport = top.ucConfig["mynodes"]["mythc"]["tcp"]["port"]
 
-        resdict = thnw.get_usb_tree(nwip, int(nwport))
+        return (top.thCtrl,
+                thnw.get_usb_tree(nwip, int(nwport), top.thversion))
+
+    return (top.thCtrl, None)
+
+def apply_tree_change(top, scan):
+    """
+    Show the changes of a USB tree scan.
+
+    Runs on the UI thread.
+
+    Args:
+        top: Reference to main application instance.
+        scan: Value of scan_tree_change()
+
+    Returns:
+        None
+    """
+    mode, data = scan
+
+    # Local USB tree handling
+    if mode == "local":
+        thlocal.apply_usb_change(top, data)
+
+    # Network USB tree handling
+    elif mode == "tcp":
+
+        resdict = data
 
         if len(resdict) > 0:
 
@@ -117,6 +171,10 @@ def get_tree_change(top):
 
                 findict = resdict["result"][1]["data"]
 
+                # Remember the topology version for the next delta
+                if "version" in findict:
+                    top.thversion = (findict["epoch"], findict["version"])
+
                 thlocal.prepare_tree_change(
                     top,
                     findict["usb3d"],
@@ -139,4 +197,114 @@ def get_tree_change(top):
             top.print_on_log(
                 "TH Computer Connection Fail!\n"
             )
-            top.device_no_response()
\ No newline at end of file
+            top.device_no_response()
+
+def request_tree_change(top, done=None):
+    """
+    Scan the USB tree in the background.
+
+    The scan runs on the USB scan worker of the application,
+    the changes are shown on the UI thread when it is done.
+
+    Args:
+        top: Reference to main application instance.
+        done: Called on the UI thread after the scan with the
+            error, None if the scan succeeded.
+
+    Returns:
+        None
+    """
+    if top.usb_scanner is None:
+        top.usb_scanner = UsbScanWorker(top)
+        top.usb_scanner.start()
+    top.usb_scanner.request(done)
+
+class UsbScanWorker(threading.Thread):
+    """
+    Runs USB tree scans off the UI thread.
+
+    Requests made while a scan is queued share that scan. A request
+    made while a scan runs gets the next scan, the running one may
+    have started before the change it is waiting for.
+    """
+
+    def __init__(self, top):
+        """
+        Initialize the worker.
+
+        Args:
+            self: Reference to current instance.
+            top: Reference to main application instance.
+
+        Returns:
+            None
+        """
+        super(UsbScanWorker, self).__init__(name="UsbScanWorker",
+                                            daemon=True)
+        self.top = top
+        self.requests = queue.Queue()
+        self.lock = threading.Lock()
+        self.queued = None
+
+    def request(self, done=None):
+        """
+        Ask for a scan.
+
+        Args:
+            self: Reference to current instance.
+            done: See request_tree_change()
+
+        Returns:
+            None
+        """
+        with self.lock:
+            if self.queued is None:
+                self.queued = []
+                self.requests.put(self.queued)
+            if done is not None:
+                self.queued.append(done)
+
+    def run(self):
+        """
+        Scan for every queued request.
+
+        Args:
+            self: Reference to current instance.
+
+        Returns:
+            None
+        """
+        while True:
+            callbacks = self.requests.get()
+            with self.lock:
+                if self.queued is callbacks:
+                    self.queued = None
+            try:
+                scan = scan_tree_change(self.top)
+                err = None
+            except Exception as exc:
+                scan = None
+                err = exc
+            wx.CallAfter(self.scan_done, scan, err, callbacks)
+
+    def scan_done(self, scan, err, callbacks):
+        """
+        Show a finished scan and notify its requesters,
+        runs on the UI thread.
+
+        Args:
+            self: Reference to current instance.
+            scan: Value of scan_tree_change(), None on error
+            err: Error of the scan
+            callbacks: done callbacks of the requests
+
+        Returns:
+            None
+        """
+        if err is None:
+            try:
+                apply_tree_change(self.top, scan)
+            except Exception as exc:
+                err = exc
+        for done in callbacks:
+            done(err)
@@ -14,6 +14,13 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Length-prefixed message framing
+#         Keep-alive client connections with ping
+#         Versioned delta USB tree replies
+#         Negotiated msgpack/JSON message encoding
+#         Answer UDP discovery probes
+#
 ##############################################################################
 
 # Built-in imports
@@ -26,6 +33,8 @@ import json
 import wx
 
 # Own modules
+import nwDiscover
+import nwFrame
 import usbChange
 from uiGlobals import *
 
@@ -102,6 +111,7 @@ class ServerHc:
         self.ADDR = (self.IP, self.PORT)
 
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
         try:
             self.socket.bind((host, port))
@@ -112,6 +122,8 @@ class ServerHc:
         self.bind_addr = host + ":" + str(port)
         self.conn_socket = None
         self.addr = None
+        self.scan_lock = threading.Lock()
+        self.history = usbChange.TopologyHistory()
 
     def close(self):
         """
@@ -126,6 +138,10 @@ class ServerHc:
         Raises:
             None
         """
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
         self.socket.close()
 
 ##############################################################################
@@ -155,6 +171,8 @@ class StayAccept(threading.Thread):
         self.window = parent
         self.wait = True
         self.rs = None
+        self.sessions = []
+        self.beacon = None
 
     def run(self) -> None:
         """
@@ -169,18 +187,19 @@ class StayAccept(threading.Thread):
         Raises:
             None
         """
+        self.beacon = nwDiscover.start_responder(nwDiscover.ROLE_THC,
+                                                 self.window.hcserver.PORT)
         while self.wait:
             try:
-                (
-                    self.window.hcserver.conn_socket,
-                    self.window.hcserver.addr,
-                ) = self.window.hcserver.socket.accept()
-
-                new_conn_info = "\nnew connection: " + str(
-                    self.window.hcserver.addr
-                )
-
-                self.rs = RequestSync(self.window)
+                conn, addr = self.window.hcserver.socket.accept()
+                self.window.hcserver.conn_socket = conn
+                self.window.hcserver.addr = addr
+
+                self.rs = RequestSync(self.window, conn, addr)
+                self.sessions = [
+                    rs for rs in self.sessions if rs.is_alive()
+                ]
+                self.sessions.append(self.rs)
                 self.rs.start()
 
             except Exception:
@@ -188,7 +207,8 @@ class StayAccept(threading.Thread):
 
     def close_connection(self):
         """
-        Stop accepting new connections.
+        Stop accepting new connections and close
+        the open client connections.
 
         Args:
             self: Reference to current instance.
@@ -200,6 +220,11 @@ class StayAccept(threading.Thread):
             None
         """
         self.wait = False
+        if self.beacon is not None:
+            self.beacon.close()
+        for rs in self.sessions:
+            rs.terminate()
+        self.sessions = []
 
 ##############################################################################
 # Request Sync Thread
@@ -210,21 +235,26 @@ class RequestSync(threading.Thread):
     Thread that processes client requests
     and sends responses.
     """
-    def __init__(self, parent):
+    def __init__(self, parent, conn, addr):
         """
         Initialize request handler thread.
 
         Args:
             self: Reference to current instance.
             parent: Parent UI window.
+            conn: Accepted client socket.
+            addr: Client address.
 
         Returns:
             None
         Raises:
             None
         """
-        super(RequestSync, self).__init__()
+        super(RequestSync, self).__init__(daemon=True)
         self.window = parent
+        self.conn = conn
+        self.addr = addr
+        self.enc = nwFrame.ENC_JSON
         self._running = True
 
     def terminate(self):
@@ -241,12 +271,20 @@ class RequestSync(threading.Thread):
             None
         """
         self._running = False
+        try:
+            self.conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
 
     def run(self) -> None:
         """
         Receive, process, and respond to
         client requests.
 
+        Each request and response is a length-prefixed
+        frame, a bare JSON request from an older client
+        is answered once in the old format.
+
         Args:
             self: Reference to current instance.
 
@@ -256,29 +294,32 @@ class RequestSync(threading.Thread):
         Raises:
             None
         """
-        while self._running:
-            try:
-                creq = self.window.hcserver.conn_socket.recv(1024)
-                data = json.loads(creq.decode())
-
-            except ConnectionResetError:
-                self.window.hcserver.conn_socket.close()
-                disconnect_info = (
-                    str(self.window.hcserver.addr) + " socket\n"
-                )
-
-                wx.CallAfter(
-                    self.window.panel.PrintLog,
-                    "\n P2: " + disconnect_info,
-                )
-                break
-            if data:
-                result = self.verify_command(data)
-                data = json.dumps(result)
-                self.window.hcserver.conn_socket.sendall(
-                    data.encode("utf-8")
-                )
-                self.terminate()
+        try:
+            if nwFrame.is_framed(self.conn):
+                while self._running:
+                    reqdict = nwFrame.recv_frame(self.conn)
+                    if reqdict is None:
+                        break
+                    # A hello reply still goes out in the old encoding
+                    enc = self.enc
+                    result = self.verify_command(reqdict)
+                    nwFrame.send_frame(self.conn, result, enc)
+            else:
+                creq = self.conn.recv(1024)
+                if creq:
+                    result = self.verify_command(json.loads(creq.decode()))
+                    self.conn.sendall(json.dumps(result).encode("utf-8"))
+
+        except (OSError, ValueError):
+            disconnect_info = str(self.addr) + " socket\n"
+
+            wx.CallAfter(
+                self.window.panel.PrintLog,
+                "\n P2: " + disconnect_info,
+            )
+
+        finally:
+            self.conn.close()
 
     def verify_command(self, reqdict):
         """
@@ -300,7 +341,23 @@ class RequestSync(threading.Thread):
                     self.window.panel.PrintLog, "Read USB"
                 )
 
-                result = usbChange.get_usb_change(self.window)
+                hcserver = self.window.hcserver
+                with hcserver.scan_lock:
+                    result = usbChange.get_host_change(self.window)
+                    hcserver.history.record(
+                        self.window.get_usb_list(),
+                        self.window.get_tb_list(),
+                        result["tbjson"],
+                    )
+                    # Only the changes since the version the client
+                    # saw, full result if that version is unknown
+                    delta = hcserver.history.get_delta(
+                        reqdict.get("epoch"), reqdict.get("since")
+                    )
+                    if delta is None:
+                        result.update(hcserver.history.get_version())
+                    else:
+                        result = delta
 
                 wx.CallAfter(
                     self.window.panel.PrintLog, "USB Result "
@@ -309,6 +366,18 @@ class RequestSync(threading.Thread):
                 rdict["data"] = result
                 return rdict
 
+        elif ctype == "session" and cmd == "hello":
+            # Encoding for the rest of this connection
+            rdict = nwFrame.hello_reply(reqdict)
+            self.enc = rdict["enc"]
+            return rdict
+
+        elif ctype == "session" and cmd == "ping":
+            # Health check of a pooled client connection
+            rdict = {}
+            rdict["data"] = "pong"
+            return rdict
+
         else:
             rdict = {}
             rdict["data"] = "Invalid command"
@@ -113,6 +113,9 @@ ID_TC_INTERVAL = 1042
 ID_BTN_VOLTS = 1043
 ID_BTN_AMPS = 1044
 
+# Volts/Amps sampling rate of a remote VBUS stream, in Hz
+VA_STREAM_RATE = 20
+
 # About Dialog
 ID_ABOUT_IMAGE = 1045
 
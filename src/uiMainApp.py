@@ -22,6 +22,13 @@
 # Revision history:
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
+#
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Finish the USB enumeration delay early on a hotplug event
+#         USB enumerator backend from the configuration, unknown
+#         backends fall back to the default
+#         USB tree scans on a background worker
+#         VBUS samples queued with their sampling time
 ##############################################################################
 # Lib imports
 import wx
@@ -31,6 +38,8 @@ import webbrowser
 # Built-in imports
 import os
 import sys
+import threading
+import time
 from sys import platform
 from pathlib import Path
 from os import getenv
@@ -65,6 +74,7 @@ import devServer
 
 import thControl
 import thServer
+import vaSampler
 
 import configdata
 
@@ -184,7 +194,18 @@ class UiMainFrame (wx.Frame):
         self.init_connect()
 
         # Targetting for new release
-        self.usbenum = usbenumall.create_usb_device_enumerator()
+        if "usbenum" not in self.config_data:
+            self.config_data["usbenum"] = {"backend": usbenumall.BACKEND_DEFAULT}
+        try:
+            self.usbenum = usbenumall.create_usb_device_enumerator(
+                self.config_data["usbenum"].get("backend"))
+        except ValueError as err:
+            # Unknown backend in the config, e.g. from a newer release
+            self.print_on_log("Warning: " + str(err) + ", using " +
+                              usbenumall.BACKEND_DEFAULT + "\n")
+            self.config_data["usbenum"]["backend"] = usbenumall.BACKEND_DEFAULT
+            self.usbenum = usbenumall.create_usb_device_enumerator(
+                usbenumall.BACKEND_DEFAULT)
         if "msudp" not in self.config_data:
             self.config_data["msudp"] = {"uname": None, "pwd": None}
         mslogin = self.config_data["msudp"]
@@ -367,6 +388,9 @@ class UiMainFrame (wx.Frame):
         self.hcserver = None
         self.hcclient = None
         self.listenhc = None
+        self.thversion = None
+        self.hotplug_wait = 0
+        self.usb_scanner = None
 
         self.logserver = None
         self.logclient = None
@@ -376,8 +400,8 @@ class UiMainFrame (wx.Frame):
 
         self.con_flg = False
         self.fault_flg = False
-        self.vdata = None
-        self.adata = None
+        # (time, volts, amps) samples for the VBUS chart
+        self.va_samples = vaSampler.create_va_queue()
         self.vgraph = False
         self.agraph = False
 
@@ -386,7 +410,6 @@ class UiMainFrame (wx.Frame):
         self.dev_list = []
         self.switch_list = []
         self.sw_versions = {}
-        self.ucbusy = True
 
         self.masterList = None
         self.tbMasterList = None
@@ -467,9 +490,15 @@ class UiMainFrame (wx.Frame):
         else:
             if event.data == "search":
                 self.print_on_log("\nUser Computer Searching The Devices")
-                self.dev_list.clear()
-                self.dev_list = searchswitch.get_switches()
-                self.ucbusy = False
+                try:
+                    self.dev_list.clear()
+                    self.dev_list = searchswitch.get_switches()
+                except Exception as err:
+                    if event.future is not None:
+                        event.future.set_exception(err)
+                    return
+                if event.future is not None:
+                    event.future.set_result(copy.deepcopy(self.dev_list))
             else:
                 self.print_on_log("\nUnknown Server Event")
 
@@ -1633,6 +1662,69 @@ class UiMainFrame (wx.Frame):
             Boolean: True - if Checked, False - if unchecked
         """
         return self.panel.get_delay_status()
+
+    def watch_usb_change(self, callback):
+        """
+        Watch for the USB tree of this computer to change during
+        the enumeration delay. The callback runs on the UI thread
+        as soon as the devices have settled, the delay timer of the
+        caller stays the fallback. The measured latency is logged.
+
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            callback: called without arguments once the change is seen
+        Returns:
+            Boolean: True - if a hotplug watch was started
+        """
+        if self.thCtrl != "local":
+            return False
+        watcher = self.usbenum.get_hotplug_watcher()
+        if watcher is None:
+            return False
+        self.hotplug_wait += 1
+        token = self.hotplug_wait
+        since = watcher.mark()
+        delay = int(self.get_enum_delay())
+        tstart = time.monotonic()
+
+        def wait_change():
+            events = watcher.wait_for_change(since, delay / 1000)
+            wx.CallAfter(self.usb_change_seen, token, events, tstart,
+                         delay, callback)
+
+        threading.Thread(target=wait_change, name="HotplugWait",
+                         daemon=True).start()
+        return True
+
+    def usb_change_seen(self, token, events, tstart, delay, callback):
+        """
+        Log the enumeration latency of a hotplug watch and hand
+        the change to the waiting window.
+
+        Args:
+            self:The self parameter is a reference to the current 
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            token: watch number, a newer watch supersedes this one
+            events: hotplug events seen, None on timeout
+            tstart: time.monotonic() the watch started
+            delay: enumeration delay in ms
+            callback: called without arguments if the change was seen
+        Returns:
+            None
+        """
+        if token != self.hotplug_wait:
+            return
+        if events is None:
+            self.print_on_log("No USB hotplug event within "+
+                              str(delay)+" ms\n")
+            return
+        latency = max(int((events[-1][1] - tstart) * 1000), 0)
+        self.print_on_log("USB enumeration: "+str(len(events))+
+                          " event(s) in "+str(latency)+" ms\n")
+        callback()
     
     def get_loop_param(self):
         """
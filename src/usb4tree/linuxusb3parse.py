@@ -13,7 +13,13 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Devices keyed by topology path
+#
 ##############################################################################
+# Own modules
+from . import usb3parse
+
 ##############################################################################
 # Utilities
 ##############################################################################
@@ -75,9 +81,9 @@ class LinuxUsb3TreeParse():
             Converts a list of USB3 device dictionaries into a
             structured mapping indexed by composite keys.
 
-            Key format:
+            Key format, see usb3parse.get_item_key():
 
-                vid,pid,bus,speed
+                bus-port.port (topology path)
 
         Args:
             msg (list):
@@ -106,9 +112,10 @@ class LinuxUsb3TreeParse():
                 port = item.get('port')
 
                 if vid is not None and pid is not None and bus is not None and speed is not None and ifc is not None:
-                    key = f"{vid},{pid},{bus},{speed}"
+                    key = usb3parse.get_item_key(item)
                     parsed_item = {
                         'type': 'usb3',
+                        'path': key,
                         'vid': vid,
                         'pid': pid,
                         'bus': bus,
@@ -132,7 +139,7 @@ class LinuxUsb3TreeParse():
 
         Description:
             Groups USB3 devices into levels based on the
-            number of comma separators in their keys.
+            depth of their topology path.
 
             This enables Tree View hierarchical rendering.
 
@@ -153,7 +160,7 @@ class LinuxUsb3TreeParse():
 
         pdict = {}
         for rkitem in u3tbuf.keys():
-            lcnt = rkitem.count(',')
+            lcnt = usb3parse.path_level(rkitem)
             kl = list(pdict.keys())
             if 'level'+str(lcnt) in kl:
                 pdict['level'+str(lcnt)].append(rkitem)
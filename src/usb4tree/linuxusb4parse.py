@@ -18,6 +18,9 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Devices keyed by uuid
+#
 ##############################################################################
 ##############################################################################
 # Utilities
@@ -63,14 +66,13 @@ class LinuxUsb4TreeParse():
         self.idata = {}
         self.ldata = {}
 
-        cnt = 0
         level0 = []
+        # Keyed by uuid, a device keeps its tree node between scans
         for dev in usb4data:
             usb4data[dev]["mname"] = usb4data[dev]["name"]
             usb4data[dev]["vname"] = usb4data[dev]["vendor"]
             usb4data[dev]["ports"] = []
-            self.idata[str(cnt)] = usb4data[dev]
-            level0.append(str(cnt))
-            cnt = cnt + 1
+            self.idata[dev] = usb4data[dev]
+            level0.append(dev)
 
         self.ldata["level0"] = level0
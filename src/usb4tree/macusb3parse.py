@@ -18,7 +18,13 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Devices keyed by topology path
+#
 ##############################################################################
+# Own modules
+from . import usb3parse
+
 ##############################################################################
 # Utilities
 ##############################################################################
@@ -80,9 +86,10 @@ class MacUsb3TreeParse():
             Parses a list of USB3 device dictionaries and
             converts them into indexed device records.
 
-            Each device key is generated using:
+            Each device is keyed by its topology path,
+            see usb3parse.get_item_key():
 
-                vid,pid,bus,speed
+                bus-port.port
 
         Args:
             msg (list):
@@ -114,9 +121,10 @@ class MacUsb3TreeParse():
                 # print("---- pid", pid)
 
                 if vid is not None and pid is not None and bus is not None and speed is not None and ifc is not None:
-                    key = f"{vid},{pid},{bus},{speed}"
+                    key = usb3parse.get_item_key(item)
                     parsed_item = {
                         'type': 'usb3',
+                        'path': key,
                         'vid': vid,
                         'pid': pid,
                         'bus': bus,
@@ -140,13 +148,13 @@ class MacUsb3TreeParse():
 
         Description:
             Organizes USB3 device keys into hierarchy levels
-            based on comma depth in index keys.
+            based on the depth of their topology path.
 
             Example key:
 
-                "32903,2880,2,5"
+                "2-1.4"
 
-            Comma count determines level grouping.
+            The number of ports in the path determines the level.
 
         Args:
             u3tbuf (dict):
@@ -165,7 +173,7 @@ class MacUsb3TreeParse():
 
         pdict = {}
         for rkitem in u3tbuf.keys():
-            lcnt = rkitem.count(',')
+            lcnt = usb3parse.path_level(rkitem)
             kl = list(pdict.keys())
             if 'level'+str(lcnt) in kl:
                 pdict['level'+str(lcnt)].append(rkitem)
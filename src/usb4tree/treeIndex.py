@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+# Module: treeIndex.py
+#
+# Description:
+#     Incremental update of a wx.TreeCtrl from keyed nodes.
+#
+#     The tree windows describe the whole topology on every scan;
+#     only the nodes that were added, removed or changed are applied
+#     to the tree, so unchanged items keep their expansion and
+#     selection and the tree does not flicker.
+#
+# Author:
+#     Vinay N, MCCI Corporation Feb 2026
+#
+# Revision history:
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+##############################################################################
+# Utilities
+##############################################################################
+class TreeIndex():
+    """
+    Key to tree item index of a wx.TreeCtrl.
+
+    Description:
+        Every node has a key, the key of its parent node (None for
+        a node under the root), a label and optional item data.
+        Parents are found in the index in O(1), the tree is never
+        searched or cleared.
+
+    Attributes:
+        tree (wx.TreeCtrl):
+            Tree control to update.
+
+        root (wx.TreeItemId):
+            Root item, parent of the top level nodes.
+
+        items (dict):
+            Node key to wx.TreeItemId.
+
+        nodes (dict):
+            Node key to (parent key, label, data) as drawn.
+
+        children (dict):
+            Node key to the keys of its child nodes.
+    """
+    def __init__(self, tree, root):
+        self.tree = tree
+        self.root = root
+        self.items = {}
+        self.nodes = {}
+        self.children = {}
+
+    def update(self, nodes):
+        """
+        Bring the tree in line with the given nodes.
+
+        Description:
+            Removed nodes are deleted with their subtree, nodes
+            moved to another parent are drawn again, changed labels
+            and data are set in place and new nodes are appended.
+            New nodes with children are expanded, the expansion of
+            existing nodes is left as the user set it.
+
+        Args:
+            nodes (dict):
+                Node key to (parent key, label, data), a parent
+                before its children. A node whose parent is not
+                in nodes goes under the root.
+
+        Returns:
+            None
+        """
+        nodes = {key: (parent if parent in nodes else None, text, data)
+                 for key, (parent, text, data) in nodes.items()}
+
+        for key in list(self.nodes.keys()):
+            if key not in self.nodes:
+                # Deleted with an ancestor
+                continue
+            if key not in nodes or nodes[key][0] != self.nodes[key][0]:
+                self.tree.Delete(self.items[key])
+                self.forget(key)
+
+        added = []
+        for key, node in nodes.items():
+            parent, text, data = node
+            old = self.nodes.get(key)
+            if old is None:
+                pitem = self.items.get(parent, self.root)
+                item = self.tree.AppendItem(pitem, text)
+                if data is not None:
+                    self.tree.SetItemPyData(item, data)
+                self.items[key] = item
+                self.children.setdefault(parent, []).append(key)
+                added.append(key)
+            else:
+                if old[1] != text:
+                    self.tree.SetItemText(self.items[key], text)
+                if old[2] != data:
+                    self.tree.SetItemPyData(self.items[key], data)
+            self.nodes[key] = node
+
+        for key in added:
+            if self.children.get(key):
+                self.tree.Expand(self.items[key])
+
+    def forget(self, key):
+        """
+        Drop a deleted node and its subtree from the index.
+
+        Args:
+            key: Node key.
+
+        Returns:
+            None
+        """
+        parent = self.nodes[key][0]
+        siblings = self.children.get(parent)
+        if siblings is not None and key in siblings:
+            siblings.remove(key)
+        stack = [key]
+        while stack:
+            ckey = stack.pop()
+            self.items.pop(ckey, None)
+            self.nodes.pop(ckey, None)
+            stack.extend(self.children.pop(ckey, []))
+
+    def clear(self):
+        """
+        Delete all nodes below the root.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.root.IsOk():
+            self.tree.DeleteChildren(self.root)
+        self.items = {}
+        self.nodes = {}
+        self.children = {}
@@ -17,6 +17,10 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Devices keyed by topology path
+#         Incremental tree updates, devices nested under their hubs
+#
 ##############################################################################
 import wx
 import sys
@@ -25,6 +29,7 @@ import sys
 from uiGlobals import *
 from datetime import datetime
 from usb4tree import usb3parse
+from usb4tree import treeIndex
 
 MAX_LEVEL = 7
 
@@ -85,6 +90,9 @@ class Usb3TreeWindow(wx.Window):
 
         usb3parse (object):
             Platform-specific USB3 parser instance.
+
+        index (TreeIndex):
+            Topology path to tree item index.
     """
 
     def __init__(self, parent, top):
@@ -101,6 +109,7 @@ class Usb3TreeWindow(wx.Window):
         # Create the tree control
         self.tree = wx.TreeCtrl(self, wx.TR_DEFAULT_STYLE)
         self.root = self.tree.AddRoot("MY COMPUTER USB Tree View")
+        self.index = treeIndex.TreeIndex(self.tree, self.root)
 
         # Bind events
         self.Bind(wx.EVT_TREE_SEL_CHANGED, self.OnItemSelect, self.tree)
@@ -150,8 +159,10 @@ class Usb3TreeWindow(wx.Window):
         Redraw the USB3 topology tree.
 
         Description:
-            Clears the existing Tree View and reconstructs
-            it using parsed USB3 hierarchy data.
+            Applies the parsed USB3 hierarchy to the Tree View.
+            Each device is placed under the node of its hub, only
+            added, removed or changed devices touch the tree, so
+            the expansion and selection of the others stay.
 
             Devices are rendered level-wise based on their
             topology depth.
@@ -166,20 +177,15 @@ class Usb3TreeWindow(wx.Window):
         Returns:
             None
         """
-        self.delete_all_items()
-        lkeys = list(ldata.keys())
-        if 'level0' in lkeys:  # Check for USB3 devices under the correct key
-            self.draw_level0_data(idata, ldata['level0'])  # Call draw_level0_data with USB3 devices
-        elif 'level1' in lkeys:  # Check for USB3 devices under the correct key
-            self.draw_level0_data(idata, ldata['level1'])
-        elif 'level2' in lkeys:  # Check for USB3 devices under the correct key
-            self.draw_level0_data(idata, ldata['level2'])
-        elif 'level3' in lkeys:  # Check for USB3 devices under the correct key
-            self.draw_level0_data(idata, ldata['level3'])
-        elif 'level4' in lkeys:  # Check for USB3 devices under the correct key
-            self.draw_level0_data(idata, ldata['level4'])
-        else:
+        if not ldata:
             print("No USB3 devices found in ldata")
+        nodes = {}
+        # Levels are topology depths, hubs come before their devices
+        for lkey in sorted(ldata.keys(), key=lambda k: int(k[5:])):
+            for item in ldata[lkey]:
+                nodes[item] = (usb3parse.parent_path(item),
+                               self.get_node_text(idata[item]), None)
+        self.index.update(nodes)
 
     def OnItemSelect(self, event):
         """
@@ -203,14 +209,11 @@ class Usb3TreeWindow(wx.Window):
         item = event.GetItem()
         text = self.tree.GetItemText(item)
     
-    def draw_level0_data(self, ddict, dlist):
+    def get_node_text(self, ddict):
         """
-        Draw Level-0 USB3 devices in Tree View.
+        Get the Tree View label of a USB3 device.
 
         Description:
-            Renders top-level USB3 devices including
-            Host Controllers, Hubs, and Peripherals.
-
             Each node displays:
 
                 • Port Number
@@ -218,106 +221,29 @@ class Usb3TreeWindow(wx.Window):
                 • VID / PID
                 • Device Speed
 
-            Child port nodes are created for hub devices.
-
         Args:
             ddict (dict):
-                Parsed USB3 device dictionary.
-
-            dlist (list):
-                List of Level-0 topology keys.
-
-        Returns:
-            None
-        """
-
-        for item in dlist:
-            vid = hex(int(ddict[item]['vid']))  # Convert VID to hexadecimal
-            pid = hex(int(ddict[item]['pid']))  # Convert PID to hexadecimal
-            speed = usbSpeed.get(ddict[item]['speed'], "Unknown")  # Get speed from usbSpeed dictionary
-            ifc = ddict[item]['ifc']  # Get the interface code(s)
-            class_name = "Unknown"  # Default USB class name
-            port_no = ddict[item].get('port', 'Unknown')  # Get port number or default to 'Unknown' if not present
-            # Iterate over interface codes to find the USB class
-            for ifc_code in ifc:
-                if ifc_code in usbClass:
-                    class_name = usbClass[ifc_code]
-                    break  # Stop searching if USB class is found
-            node_text = f"[port {port_no}] {class_name} (VID: {vid}, PID: {pid}, Speed: {speed})"
-            hub_node = self.tree.AppendItem(self.root, node_text)  # Add hub node
-            # Check if the device is a hub and has ports
-            if 'ports' in ddict[item]:
-                for port in ddict[item]['ports']:
-                    port_no = port.get('port', 'Unknown')  # Get port number or default to 'Unknown' if not present
-                    port_vid = hex(int(port['vid']))
-                    port_pid = hex(int(port['pid']))
-                    port_speed = usbSpeed.get(port['speed'], "Unknown")
-                    port_text = f"[port {port_no}] {class_name} (VID: {port_vid}, PID: {port_pid}, Speed: {port_speed})"
-                    self.tree.AppendItem(hub_node, port_text)  # Add port node as child of the hub
-
-    def draw_leveln_data(self, ddict, dlist, lidx):
-        """
-        Draw deeper USB3 topology levels.
-
-        Description:
-            Adds child device nodes under their
-            respective parent hubs based on topology
-            depth.
-
-        Args:
-            ddict (dict):
-                Parsed USB3 device data.
-
-            dlist (list):
-                Device keys at the specified level.
-
-            lidx (int):
-                Current topology level index.
-
-        Returns:
-            None
-        """
-        for item in dlist:
-            cidx = item.split(',')[lidx]
-            vid = ddict[item]['vid']
-            pid = ddict[item]['pid']
-            node_text = f"{item} (VID: {vid}, PID: {pid})"
-            parent_item = self.get_parent_item(self.root, item, lidx)
-            self.tree.AppendItem(parent_item, node_text)
-
-    def get_parent_item(self, parent, item, level):
-        """
-        Locate parent node for a USB3 device.
-
-        Description:
-            Traverses the Tree View hierarchy to
-            identify the correct parent node where
-            the device should be attached.
-
-        Args:
-            parent (wx.TreeItemId):
-                Starting parent node.
-
-            item (str):
-                Device topology key.
-
-            level (int):
-                Current topology depth.
+                Parsed USB3 device.
 
         Returns:
-            wx.TreeItemId:
-                Matching parent tree node.
+            str:
+                Node label.
         """
-        if level == 0:
-            return parent
-        else:
-            parent_text = item.split(',')[level-1]
-            children, cookie = self.tree.GetFirstChild(parent)
-            while children.IsOk():
-                if self.tree.GetItemText(children).split(',')[level-1] == parent_text:
-                    return children
-                children, cookie = self.tree.GetNextChild(parent, cookie)
-            return self.get_parent_item(parent, item, level-1)
+        vid = hex(int(ddict['vid']))  # Convert VID to hexadecimal
+        pid = hex(int(ddict['pid']))  # Convert PID to hexadecimal
+        speed = usbSpeed.get(ddict['speed'], "Unknown")  # Get speed from usbSpeed dictionary
+        ifc = ddict['ifc']  # Get the interface code(s)
+        class_name = "Unknown"  # Default USB class name
+        port_no = ddict.get('port', 'Unknown')  # Get port number or default to 'Unknown' if not present
+        if 'port' not in ddict and '-' in ddict.get('path', ''):
+            # Hubs have no port field, take it from the topology path
+            port_no = ddict['path'].split('-')[1].split('.')[-1]
+        # Iterate over interface codes to find the USB class
+        for ifc_code in ifc:
+            if ifc_code in usbClass:
+                class_name = usbClass[ifc_code]
+                break  # Stop searching if USB class is found
+        return f"[port {port_no}] {class_name} (VID: {vid}, PID: {pid}, Speed: {speed})"
 
     def delete_all_items(self):
         """
@@ -336,6 +262,4 @@ class Usb3TreeWindow(wx.Window):
         Returns:
             None
         """
-        root = self.tree.GetRootItem()
-        if root.IsOk():
-            self.tree.DeleteChildren(root)
+        self.index.clear()
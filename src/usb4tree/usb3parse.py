@@ -20,11 +20,78 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Topology path helpers
+#
 ##############################################################################
 import sys
 ##############################################################################
 # Utilities
 ##############################################################################
+def get_item_key(item):
+    """
+    Tree key of a USB3 device.
+
+    Description:
+        The topology path of the device, e.g. "1-2.3". Records of
+        older Test Hosts without a path are keyed by
+
+            vid,pid,bus,speed
+
+    Args:
+        item (dict):
+            USB3 device dictionary.
+
+    Returns:
+        str:
+            Tree key of the device.
+    """
+    path = item.get('path')
+    if path is not None:
+        return path
+    return f"{item.get('vid')},{item.get('pid')},{item.get('bus')},{item.get('speed')}"
+
+def parent_path(path):
+    """
+    Topology path of the hub a device is attached to.
+
+    Args:
+        path (str):
+            Topology path, e.g. "1-2.3".
+
+    Returns:
+        str:
+            Path of the parent, "1-2" for "1-2.3" and the root
+            hub "1" for "1-2".
+
+        None:
+            For a root hub or a key without a path.
+    """
+    head, sep, ports = path.partition('-')
+    if not sep or ',' in path:
+        return None
+    if '.' in ports:
+        return path.rsplit('.', 1)[0]
+    return head
+
+def path_level(path):
+    """
+    Depth of a device in the topology.
+
+    Args:
+        path (str):
+            Topology path, e.g. "1-2.3".
+
+    Returns:
+        int:
+            0 for a root hub, 1 for a device on a root port and so
+            on. Keys without a path are all on level 0.
+    """
+    head, sep, ports = path.partition('-')
+    if not sep or ',' in path:
+        return 0
+    return ports.count('.') + 1
+
 class USB3Parser:
     """
     Base USB3 Parser Class.
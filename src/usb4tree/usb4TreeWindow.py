@@ -24,6 +24,9 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Incremental tree updates
+#
 ##############################################################################
 
 # Lib imports
@@ -36,6 +39,7 @@ from datetime import datetime
 from uiGlobals import *
 from .wdpLogin import LoginFrame
 from usb4tree import usb4parse
+from usb4tree import treeIndex
 
 ##############################################################################
 # USB4 / Thunderbolt Constants
@@ -113,6 +117,9 @@ class Usb4TreeWindow(wx.Window):
 
         btn_config (wx.Button):
             Credential configuration button (Windows only).
+
+        index (TreeIndex):
+            Topology key to tree item index.
     """
     def __init__(self, parent, top):
         """
@@ -157,6 +164,7 @@ class Usb4TreeWindow(wx.Window):
         self.tree = wx.TreeCtrl(self,wx.TR_DEFAULT_STYLE)
         
         self.root = self.tree.AddRoot("MY COMPUTER USB4 Tree View")
+        self.index = treeIndex.TreeIndex(self.tree, self.root)
 
         self.Bind(wx.EVT_TREE_SEL_CHANGED, self.OnItemSelect, self.tree)
 
@@ -266,9 +274,7 @@ class Usb4TreeWindow(wx.Window):
             • Root label (e.g., "MY COMPUTER USB4 Tree View")
             is preserved.
         """
-        root = self.tree.GetRootItem()
-        if root.IsOk():
-            self.tree.DeleteChildren(root)
+        self.index.clear()
 
     def OnItemSelect(self, event):
         """
@@ -308,22 +314,24 @@ class Usb4TreeWindow(wx.Window):
 
     def redrawu4tree(self, idata, ldata):
         """
-        Redraw the complete USB4 / Thunderbolt Tree View hierarchy.
+        Redraw the USB4 / Thunderbolt Tree View hierarchy.
 
         Description:
-            This method reconstructs the entire USB4 / Thunderbolt routing
-            tree in the UI based on parsed topology data.
+            This method applies the parsed topology to the USB4 /
+            Thunderbolt routing tree in the UI.
 
             The function performs the following steps:
 
-                1. Clears all existing tree nodes except the root.
-                2. Identifies available topology levels from parsed data.
-                3. Draws Level-0 (Root / Host Routers).
-                4. Iteratively renders deeper routing levels (Level-1 → N).
-                5. Links child routers/devices to their parent ports.
+                1. Identifies available topology levels from parsed data.
+                2. Describes Level-0 (Root / Host Routers).
+                3. Iteratively describes deeper routing levels (Level-1 → N).
+                4. Links child routers/devices to their parent ports.
+                5. Applies only the added, removed or changed nodes
+                   to the tree.
 
             This ensures the tree view always reflects the latest
-            USB4 / Thunderbolt topology after a scan/update.
+            USB4 / Thunderbolt topology after a scan/update, while
+            the expansion and selection of unchanged nodes stay.
 
         Args:
             idata (dict):
@@ -343,33 +351,34 @@ class Usb4TreeWindow(wx.Window):
 
         Notes:
             • MAX_LEVEL controls the deepest routing level rendered.
-            • draw_level0_data() handles root rendering.
-            • draw_leveln_data() handles deeper hierarchy rendering.
+            • draw_level0_data() describes the root nodes.
+            • draw_leveln_data() describes the deeper hierarchy.
         """
-        self.DeleteAllItems()
+        nodes = {}
         lkeys = list(ldata.keys())
         if 'level0' in lkeys:
-            lobjdict = self.draw_level0_data(idata, ldata['level0'])
+            self.draw_level0_data(idata, ldata['level0'], nodes)
             for level in range(1,MAX_LEVEL):
                 if 'level'+str(level) in lkeys:
-                    lobjdict = self.draw_leveln_data(idata, ldata['level'+str(level)], lobjdict, level)
+                    self.draw_leveln_data(idata, ldata['level'+str(level)], nodes, level)
+        self.index.update(nodes)
 
     # # Draw level 0 data
-    def draw_level0_data(self, ddict, dlist):
+    def draw_level0_data(self, ddict, dlist, nodes):
         """
-        Draw the Tree view for Level-0 and Level-1 USB4 / Thunderbolt devices.
+        Describe the Tree view for Level-0 and Level-1 USB4 / Thunderbolt devices.
 
         Description:
-            This method renders the top hierarchy of the USB4 / Thunderbolt
-            routing tree.
+            This method describes the top hierarchy of the USB4 /
+            Thunderbolt routing tree.
 
             • Level-0 represents Root / Host routers.
             • Level-1 represents directly connected downstream ports.
 
             The function:
 
-                - Creates root child nodes for each detected router/device
-                - Displays Model Name and Vendor Name
+                - Adds a root child node for each detected router/device
+                - Labels it with Model Name and Vendor Name
                 - Attaches VID & PID as tooltip metadata
                 - Adds child port nodes under each router
 
@@ -384,35 +393,31 @@ class Usb4TreeWindow(wx.Window):
                 List of topology index keys representing
                 Level-0 routing devices.
 
-        Returns:
-            dict:
-                Dictionary mapping topology keys to
-                wx.TreeCtrl item object references.
+            nodes (dict):
+                Topology key to (parent key, label, data) of the
+                tree nodes, filled in by this method.
 
-                This object map is later used to attach
-                deeper routing levels.
+        Returns:
+            None
         """
-        objdict = {}
         for l0item in dlist:
-            objdict[l0item] = self.tree.AppendItem(self.root, ""+ddict[l0item]["mname"]+" ("+ddict[l0item]["vname"]+")")
+            device_data = None
             if 'vid' in ddict[l0item] and 'pid' in ddict[l0item]:
                 device_data = f"VID: {ddict[l0item]['vid']}, PID: {ddict[l0item]['pid']}"
-                self.tree.SetItemPyData(objdict[l0item], device_data)
-            if len(ddict[l0item]["ports"]) > 0:
-                for pno in ddict[l0item]["ports"]:
-                    objdict[l0item+","+str(pno)] = self.tree.AppendItem(objdict[l0item], "Port-"+str(pno))
-        return objdict
+            nodes[l0item] = (None, ""+ddict[l0item]["mname"]+" ("+ddict[l0item]["vname"]+")", device_data)
+            for pno in ddict[l0item]["ports"]:
+                nodes[l0item+","+str(pno)] = (l0item, "Port-"+str(pno), None)
     
     ## Draw level 1 to 6 data
-    def draw_leveln_data(self, ddict, dlist, riobj, lidx):
+    def draw_leveln_data(self, ddict, dlist, nodes, lidx):
         """
-        Draw the Tree view for deeper USB4 routing levels.
+        Describe the Tree view for deeper USB4 routing levels.
 
         Description:
-            This method renders hierarchical USB4 / Thunderbolt routing
-            devices beyond Level-0 in the tree structure.
+            This method describes hierarchical USB4 / Thunderbolt
+            routing devices beyond Level-0 in the tree structure.
 
-            It updates:
+            It sets:
 
                 • Port routing labels
                 • Device names
@@ -428,27 +433,21 @@ class Usb4TreeWindow(wx.Window):
             dlist (list):
                 List of routing topology keys for the level.
 
-            riobj (dict):
-                Previously created tree node object references.
+            nodes (dict):
+                Tree nodes described so far, updated in place.
 
             lidx (int):
                 Current hierarchy level index.
 
         Returns:
-            dict:
-                Updated tree object reference dictionary.
+            None
         """
-        
-        objlist = list(riobj.keys())
         for item in dlist:
-            if item in objlist:
+            if item in nodes:
                 cidx = item.split(',')[lidx]
-                self.tree.SetItemText(riobj[item], "Port-"+cidx+", "+ddict[item]["mname"]+" ("+ddict[item]["vname"]+")")
+                device_data = None
                 if 'vid' in ddict[item] and 'pid' in ddict[item]:
                     device_data = f"VID: {ddict[item]['vid']}, PID: {ddict[item]['pid']}"
-                    print("device_data:", device_data)
-                    self.tree.SetItemPyData(riobj[item], device_data)
-                if len(ddict[item]["ports"]) > 0:
-                    for pno in ddict[item]["ports"]:
-                        riobj[item+","+str(pno)] = self.tree.AppendItem(riobj[item], "Port-"+str(pno))
-        return riobj
\ No newline at end of file
+                nodes[item] = (nodes[item][0], "Port-"+cidx+", "+ddict[item]["mname"]+" ("+ddict[item]["vname"]+")", device_data)
+                for pno in ddict[item]["ports"]:
+                    nodes[item+","+str(pno)] = (item, "Port-"+str(pno), None)
@@ -15,7 +15,13 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Devices keyed by topology path
+#
 ##############################################################################
+# Own modules
+from . import usb3parse
+
 ##############################################################################
 # Utilities
 ##############################################################################
@@ -89,7 +95,7 @@ class WinUsb3TreeParse():
 
         Returns:
             dict:
-                Dictionary mapping unique keys to parsed USB3 items.
+                Dictionary mapping topology paths to parsed USB3 items.
                 Returns None if input format is invalid.
         """
 
@@ -112,9 +118,10 @@ class WinUsb3TreeParse():
                 # print("---- pid", pid)
 
                 if vid is not None and pid is not None and bus is not None and speed is not None and ifc is not None:
-                    key = f"{vid},{pid},{bus},{speed}"
+                    key = usb3parse.get_item_key(item)
                     parsed_item = {
                         'type': 'usb3',
+                        'path': key,
                         'vid': vid,
                         'pid': pid,
                         'bus': bus,
@@ -138,7 +145,8 @@ class WinUsb3TreeParse():
 
         Description:
             Groups parsed USB3 devices based on topology depth
-            by counting key delimiters. Used for UI tree generation.
+            by the depth of their topology path. Used for UI
+            tree generation.
 
         Args:
             u3tbuf (dict):
@@ -162,7 +170,7 @@ class WinUsb3TreeParse():
 
         pdict = {}
         for rkitem in u3tbuf.keys():
-            lcnt = rkitem.count(',')
+            lcnt = usb3parse.path_level(rkitem)
             kl = list(pdict.keys())
             if 'level'+str(lcnt) in kl:
                 pdict['level'+str(lcnt)].append(rkitem)
@@ -13,11 +13,19 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Versioned topology history for delta tree requests
+#         Linear time multiset diff of device lists
+#         Devices identified by topology path
+#         Enumeration split from showing the change
+#         Test Host reply built from the scan
+#
 ##############################################################################
 
 # Built-in imports
 import sys
-import copy
+import uuid
+from collections import Counter, OrderedDict
 
 # Own modules
 from uiGlobals import *
@@ -32,9 +40,66 @@ def get_usb_change(top):
     Returns:
         dict | None: USB change details if applicable.
     """
+    return apply_usb_change(top, scan_usb(top))
+
+def get_host_change(top):
+    """
+    Scan the USB devices and get the change for a Test Host reply.
+
+    Description:
+        The reply is built from the scan. apply_usb_change() still
+        updates the views of this computer, but its value is None
+        when this computer is also a User Computer.
+
+    Args:
+        top: Top-level UI object.
+
+    Returns:
+        dict: Added and removed USB3 and USB4 devices and the
+        USB4 tree.
+    """
+    old3 = top.get_usb_list()
+    old4 = top.get_tb_list()
+    result = scan_usb(top)
+    apply_usb_change(top, result)
+
+    new3 = result["usb3list"]
+    new4 = result["usb4tblist"]
+    tbjson = result["usb4tbjson"] or []
+    resdict = {
+        "usb3d": get_list_change(new3 if old3 is None else old3, new3),
+        "usb4d": [],
+        "tbjson": tbjson,
+    }
+    if len(tbjson) > 0:
+        resdict["usb4d"] = get_list_change(new4 if old4 is None else old4,
+                                           new4)
+    return resdict
+
+def scan_usb(top):
+    """
+    Enumerate the USB devices, the slow part of a change.
+
+    Args:
+        top: Top-level UI object.
+
+    Returns:
+        dict: Result of the USB device enumerator.
+    """
     top.usbenum.enumerate_usb_devices()
-    result = top.usbenum.get_result()
+    return top.usbenum.get_result()
+
+def apply_usb_change(top, result):
+    """
+    Compare an enumeration with the last one and show the changes.
 
+    Args:
+        top: Top-level UI object.
+        result: Value of scan_usb().
+
+    Returns:
+        dict | None: USB change details if applicable.
+    """
     usb3tree = result["usb3list"]
     usb3diff = get_usb3_change(top, result["usb3list"])
     usb4diff = get_usb4_change(top, result["usb4tblist"])
@@ -74,38 +139,7 @@ def get_usb3_change(top, newlist):
     Returns:
         dict: Added and removed USB3 devices.
     """
-    oldlist = top.get_usb_list()
-    if oldlist is None:
-        oldlist = newlist
-
-    top.save_usb_list(newlist)
-
-    newset = [i for n, i in enumerate(newlist) if i not in newlist[n + 1:]]
-    unewlist = copy.deepcopy(newlist)
-
-    for i in newset:
-        rcnt = 0
-        for j in unewlist:
-            if i == j:
-                rcnt += 1
-                if "count" in j:
-                    j["count"] = rcnt
-
-    oldset = [i for n, i in enumerate(oldlist) if i not in oldlist[n + 1:]]
-    uoldlist = copy.deepcopy(oldlist)
-
-    for i in oldset:
-        rcnt = 0
-        for j in uoldlist:
-            if i == j:
-                rcnt += 1
-                if "count" in j:
-                    j["count"] = rcnt
-
-    adlist = [i for i in unewlist if i not in uoldlist]
-    rmlist = [i for i in uoldlist if i not in unewlist]
-
-    return {"added": adlist, "removed": rmlist}
+    return get_saved_change(top.get_usb_list, top.save_usb_list, newlist)
 
 def get_usb4_change(top, newlist):
     """
@@ -118,38 +152,201 @@ def get_usb4_change(top, newlist):
     Returns:
         dict: Added and removed USB4 devices.
     """
-    oldlist = top.get_tb_list()
+    return get_saved_change(top.get_tb_list, top.save_tb_list, newlist)
+
+def get_saved_change(get_saved, save, newlist):
+    """
+    Compare a device list with the one saved by the last scan,
+    then save it.
+
+    Args:
+        get_saved: Returns the saved device list, None before
+            the first scan.
+        save: Saves the device list.
+        newlist: Current device list.
+
+    Returns:
+        dict: Added and removed devices.
+    """
+    oldlist = get_saved()
     if oldlist is None:
         oldlist = newlist
 
-    top.save_tb_list(newlist)
+    save(newlist)
+
+    return get_list_change(oldlist, newlist)
+
+def device_key(dev):
+    """
+    Hashable key of a device.
+
+    Description:
+        Devices are identified by their topology path and their
+        VID/PID or name, so identical devices on different ports
+        stay apart and a device swapped on the same port is seen.
+        USB4 devices also by their uuid/hwid, which tells two docks
+        of the same model apart, USB3 devices also by their speed,
+        so a re-enumeration at another speed is seen. Records of
+        older Test Hosts without a path are compared by all their
+        fields.
+
+    Args:
+        dev: Device dict, or any value nested in it.
+
+    Returns:
+        Hashable copy of the value.
+    """
+    if isinstance(dev, dict):
+        if "path" in dev:
+            if dev.get("type") == "usb4":
+                extra = (dev.get("uuid"), dev.get("hwid"))
+            else:
+                extra = (dev.get("speed"),)
+            return (dev.get("type"), dev["path"], dev.get("vid"),
+                    dev.get("pid"), dev.get("name")) + extra
+        return tuple(sorted((k, device_key(v)) for k, v in dev.items()))
+    if isinstance(dev, (list, tuple)):
+        return tuple(device_key(v) for v in dev)
+    return dev
+
+def get_list_change(oldlist, newlist):
+    """
+    Compare two device lists.
+
+    Description:
+        Lists are compared as multisets, with two identical devices
+        attached and one of them removed, one device is reported as
+        removed. Runs in linear time of the list lengths.
+
+    Args:
+        oldlist: Previous device list.
+        newlist: Current device list.
+
+    Returns:
+        dict: Added and removed devices.
+    """
+    oldkeys = [device_key(dev) for dev in oldlist]
+    newkeys = [device_key(dev) for dev in newlist]
 
-    newset = [i for n, i in enumerate(newlist) if i not in newlist[n + 1:]]
-    unewlist = copy.deepcopy(newlist)
+    return {"added": get_extra_devices(newlist, newkeys, Counter(oldkeys)),
+            "removed": get_extra_devices(oldlist, oldkeys, Counter(newkeys))}
 
-    for i in newset:
-        rcnt = 0
-        for j in unewlist:
-            if i == j:
-                rcnt += 1
-                if "count" in j:
-                    j["count"] = rcnt
+def get_extra_devices(devlist, keys, others):
+    """
+    Devices of a list beyond the count of equal devices in the
+    other list.
 
-    oldset = [i for n, i in enumerate(oldlist) if i not in oldlist[n + 1:]]
-    uoldlist = copy.deepcopy(oldlist)
+    Args:
+        devlist: Device list.
+        keys: device_key() of each device in devlist.
+        others: Counter of device keys in the other list.
 
-    for i in oldset:
-        rcnt = 0
-        for j in uoldlist:
-            if i == j:
-                rcnt += 1
-                if "count" in j:
-                    j["count"] = rcnt
+    Returns:
+        list: Extra devices, in the order of devlist.
+    """
+    seen = Counter()
+    extra = []
+    for dev, key in zip(devlist, keys):
+        seen[key] += 1
+        if seen[key] > others[key]:
+            extra.append(dev)
+    return extra
+
+# Topology snapshots kept for delta requests
+HISTORY_DEPTH = 16
+
+class TopologyHistory:
+    """
+    Versioned USB topology snapshots of a Test Host.
 
-    adlist = [i for i in unewlist if i not in uoldlist]
-    rmlist = [i for i in uoldlist if i not in unewlist]
+    Every scan that changes the topology gets a new version. A client
+    that saw an older version of the same epoch is sent only the
+    changes since then; the epoch changes whenever the server
+    restarts, so stale versions are never matched.
+    """
 
-    return {"added": adlist, "removed": rmlist}
+    def __init__(self):
+        """
+        Initialize an empty history.
+
+        Args:
+            self: Reference to current instance.
+
+        Returns:
+            None
+        """
+        self.epoch = uuid.uuid4().hex[:8]
+        self.version = 0
+        self.snapshots = OrderedDict()
+        self.tbjson = None
+        self.tb_version = 0
+
+    def record(self, usb3list, usb4list, tbjson):
+        """
+        Record the result of a scan.
+
+        Args:
+            self: Reference to current instance.
+            usb3list: USB3 device list of the scan.
+            usb4list: USB4 device list of the scan.
+            tbjson: USB4 tree of the scan.
+
+        Returns:
+            None
+        """
+        if self.snapshots:
+            last3, last4 = self.snapshots[self.version]
+            if (last3 == usb3list and last4 == usb4list and
+                    tbjson == self.tbjson):
+                return
+        self.version += 1
+        self.snapshots[self.version] = (usb3list, usb4list)
+        if len(self.snapshots) > HISTORY_DEPTH:
+            self.snapshots.popitem(last=False)
+        if tbjson != self.tbjson:
+            self.tbjson = tbjson
+            self.tb_version = self.version
+
+    def get_version(self):
+        """
+        Current epoch and version.
+
+        Args:
+            self: Reference to current instance.
+
+        Returns:
+            dict: epoch and version.
+        """
+        return {"epoch": self.epoch, "version": self.version}
+
+    def get_delta(self, epoch, since):
+        """
+        Changes since a version the client has seen.
+
+        Args:
+            self: Reference to current instance.
+            epoch: Epoch the client saw.
+            since: Version the client saw.
+
+        Returns:
+            dict | None: Changes since that version, or None when
+            the version is unknown and a full result is needed.
+        """
+        if epoch != self.epoch or since not in self.snapshots:
+            return None
+        old3, old4 = self.snapshots[since]
+        cur3, cur4 = self.snapshots[self.version]
+        resdict = self.get_version()
+        resdict["usb3d"] = get_list_change(old3, cur3)
+        if self.tbjson:
+            resdict["usb4d"] = get_list_change(old4, cur4)
+        else:
+            resdict["usb4d"] = []
+        if self.tb_version > since:
+            resdict["tbjson"] = self.tbjson
+        else:
+            resdict["tbjson"] = None
+        return resdict
 
 def prepare_tree_change(top, usb3dict, usb4dict):
     """
@@ -225,13 +422,13 @@ def convert_usb_info(top, udlist):
             )
 
             usb_class = get_usb_class([dev3])
-            strdev += f"{cnt + 1}. {', '.join(usb_class[0])}({vpid}) \n"
+            strdev += f"{cnt + 1}. {', '.join(usb_class[0])}({vpid}){get_path_info(dev3)} \n"
             cnt += 1
 
         except Exception:
             hvid = ("%X" % int(dev3.get('vid'))).zfill(4)
             hpid = ("%X" % int(dev3.get('pid'))).zfill(4)
-            vpid = f" (VID_{hvid}; PID_{hpid}) USB3 Device Error\n"
+            vpid = f" (VID_{hvid}; PID_{hpid}){get_path_info(dev3)} USB3 Device Error\n"
             strdev += f"{cnt + 1}. {vpid}\n"
             cnt += 1
 
@@ -308,4 +505,18 @@ def get_usb_class(clist):
         except Exception:
             flist.append("Class Error")
 
-    return flist
\ No newline at end of file
+    return flist
+
+def get_path_info(dev):
+    """
+    Topology path of a device for the log.
+
+    Args:
+        dev: USB device dict.
+
+    Returns:
+        str: " at <path>", empty for devices without a path.
+    """
+    if "path" in dev:
+        return " at " + str(dev["path"])
+    return ""
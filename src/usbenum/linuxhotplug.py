@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+# Module: linuxhotplug.py
+#
+# Description:
+#     Linux USB hotplug watcher.
+#     Listens to the kernel uevents on a netlink socket and records
+#     every USB device add/remove with its time, so a caller can scan
+#     the bus as soon as a device has enumerated instead of waiting
+#     a fixed delay.
+#
+# Author:
+#     Vinay N, MCCI Corporation Feb 2026
+#
+# Revision history:
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import socket
+import threading
+import time
+
+# Lib imports
+# None
+
+# Own modules
+# None
+
+##############################################################################
+# Utilities
+##############################################################################
+
+# Netlink protocol and multicast group of kernel uevents
+NETLINK_KOBJECT_UEVENT = 15
+UEVENT_KERNEL_GROUP = 1
+
+# Quiet time after the last event before a change counts as complete,
+# a hub brings up its downstream devices in a burst of events
+HOTPLUG_SETTLE = 0.2
+
+# Uevents that change the USB tree, interface and bind events of the
+# same device are not kept, so one device is one event
+HOTPLUG_ACTIONS = (b"add", b"remove")
+HOTPLUG_DEVTYPE = b"usb_device"
+
+# Events kept for callers that arm late
+MAX_EVENTS = 256
+
+# Events this much older than mark() still count, a port switched off
+# can drop its device before the switch command has returned
+HOTPLUG_LOOKBACK = 0.25
+
+class HotplugWatcher(threading.Thread):
+    """
+    Summary:
+        Kernel uevent listener for USB devices.
+
+    Longer Description:
+        Runs as a daemon thread once started. Only whole USB device
+        add/remove events are kept, interface events are ignored.
+
+    Attributes:
+        events: List of (seq, monotonic time, action, devpath).
+        seq: Sequence number of the last recorded event.
+    """
+    def __init__(self):
+        """
+        Open the uevent socket.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If netlink is not available, e.g. in a container.
+        """
+        super(HotplugWatcher, self).__init__(name="HotplugWatcher",
+                                             daemon=True)
+        self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM,
+                                  NETLINK_KOBJECT_UEVENT)
+        self.sock.bind((0, UEVENT_KERNEL_GROUP))
+        self.events = []
+        self.seq = 0
+        self.cond = threading.Condition()
+
+    def run(self):
+        """
+        Record USB device events until the socket is closed.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        while True:
+            try:
+                data = self.sock.recv(8192)
+            except OSError:
+                break
+            event = self.parse_uevent(data)
+            if event is None:
+                continue
+            with self.cond:
+                self.seq += 1
+                self.events.append((self.seq, time.monotonic()) + event)
+                del self.events[:-MAX_EVENTS]
+                self.cond.notify_all()
+
+    def parse_uevent(self, data):
+        """
+        Parse one kernel uevent.
+
+        Args:
+            data (bytes): "action@devpath" header followed by
+                NUL separated KEY=value fields.
+
+        Returns:
+            tuple | None:
+                (action, devpath) of a USB device add/remove,
+                otherwise None.
+        """
+        items = data.split(b"\0")
+        if items[0].partition(b"@")[0] not in HOTPLUG_ACTIONS:
+            # change, bind, unbind... of any subsystem
+            return None
+        fields = {}
+        for item in items[1:]:
+            key, sep, value = item.partition(b"=")
+            if sep:
+                fields[key] = value
+        if fields.get(b"SUBSYSTEM") != b"usb":
+            return None
+        if fields.get(b"DEVTYPE") != HOTPLUG_DEVTYPE:
+            return None
+        action = fields.get(b"ACTION", b"")
+        if action not in HOTPLUG_ACTIONS:
+            return None
+        return action.decode(), fields.get(b"DEVPATH", b"").decode()
+
+    def mark(self, lookback=HOTPLUG_LOOKBACK):
+        """
+        Get the position to wait from, taken right after a port
+        was switched.
+
+        Args:
+            lookback (float): Seconds of earlier events to include.
+
+        Returns:
+            int: Sequence number to pass to wait_for_change().
+        """
+        since = time.monotonic() - lookback
+        with self.cond:
+            seq = self.seq
+            for ev in reversed(self.events):
+                if ev[1] < since:
+                    break
+                seq = ev[0] - 1
+            return seq
+
+    def wait_for_change(self, since, timeout, settle=HOTPLUG_SETTLE):
+        """
+        Wait for USB devices to be added or removed.
+
+        Description:
+            Returns once an event newer than since was seen and no
+            further event arrived for settle seconds.
+
+        Args:
+            since (int): Value of mark().
+            timeout (float): Seconds to wait at most.
+            settle (float): Quiet seconds that end a change.
+
+        Returns:
+            list | None:
+                Events of the change as (seq, time, action, devpath),
+                None if nothing changed before the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            while True:
+                new = [ev for ev in self.events if ev[0] > since]
+                now = time.monotonic()
+                if new and now - new[-1][1] >= settle:
+                    return new
+                if now >= deadline:
+                    return new or None
+                if new:
+                    wait = min(new[-1][1] + settle, deadline) - now
+                else:
+                    wait = deadline - now
+                self.cond.wait(wait)
+
+    def close(self):
+        """
+        Stop listening.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
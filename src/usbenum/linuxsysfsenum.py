@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+# Module: linuxsysfsenum.py
+#
+# Description:
+#     Linux sysfs USB Enumeration module.
+#     Reads the USB topology from /sys/bus/usb/devices instead of
+#     opening the devices through libusb, so a scan needs no device
+#     permissions and no libusb calls. The result has the same shape
+#     as LinuxUSBDeviceEnumerator.
+#
+#     Run "python -m usbenum.linuxsysfsenum" from src to compare the
+#     scan time with the pyusb enumerator.
+#
+# Author:
+#     Vinay N, MCCI Corporation Feb 2026
+#
+# Revision history:
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Module created
+#         Topology path of every device
+#
+##############################################################################
+
+# Built-in imports
+import os
+import time
+
+# Lib imports
+# None
+
+# Own modules
+from . import linuxusbenum
+from . import usbenumall
+
+##############################################################################
+# Utilities
+##############################################################################
+
+SYSFS_USB_DEVICES = "/sys/bus/usb/devices"
+
+# sysfs speed in Mbps to the libusb speed code pyusb reports
+SYSFS_SPEED = {"1.5": 1, "12": 2, "480": 3, "5000": 4,
+               "10000": 5, "20000": 5}
+
+def read_attr(path, name):
+    """
+    Read one sysfs attribute.
+
+    Args:
+        path (str): Device directory.
+        name (str): Attribute file name.
+
+    Returns:
+        str | None:
+            Attribute value, None if it does not exist, e.g. the
+            device was removed during the scan.
+    """
+    try:
+        with open(os.path.join(path, name)) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+class LinuxSysfsUSBDeviceEnumerator(linuxusbenum.LinuxUSBDeviceEnumerator):
+    """
+    Summary:
+        Linux USB Device Enumerator reading sysfs.
+
+    Longer Description:
+        Replaces the libusb scan of USB3 devices with a read of
+        the sysfs device directories. USB4/Thunderbolt scanning and
+        the hotplug watcher are shared with LinuxUSBDeviceEnumerator.
+
+    Attributes:
+        root: sysfs USB devices directory.
+    """
+    def __init__(self, root=SYSFS_USB_DEVICES):
+        """
+        Initialize sysfs USB Device Enumerator.
+
+        Args:
+            root (str): sysfs USB devices directory.
+
+        Returns:
+            None
+        """
+        super(LinuxSysfsUSBDeviceEnumerator, self).__init__()
+        self.root = root
+
+    @staticmethod
+    def is_available(root=SYSFS_USB_DEVICES):
+        """
+        Check for the sysfs USB devices directory.
+
+        Args:
+            root (str): sysfs USB devices directory.
+
+        Returns:
+            bool: True if sysfs can be scanned.
+        """
+        return os.path.isdir(root)
+
+    def enumerate_usb3_devices(self):
+        """
+        Enumerate USB3 devices.
+
+        Description:
+            Scans and categorizes USB3 devices into:
+            - Host Controllers (root hubs "usbN")
+            - Hubs
+            - Peripherals
+
+            Every device dict matches the one built by the pyusb
+            enumerator, numbers are converted from the sysfs hex
+            and Mbps formats.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        hc_list = []
+        hub_list = []
+        per_list = []
+
+        devices = []
+        interfaces = {}
+        try:
+            names = sorted(os.listdir(self.root))
+        except OSError:
+            names = []
+        for name in names:
+            if ":" in name:
+                # Interface "<device>:<config>.<interface>"
+                interfaces.setdefault(name.split(":")[0], []).append(name)
+            else:
+                devices.append(name)
+
+        for name in devices:
+            path = os.path.join(self.root, name)
+            vid = read_attr(path, "idVendor")
+            pid = read_attr(path, "idProduct")
+            bus = read_attr(path, "busnum")
+            dclass = read_attr(path, "bDeviceClass")
+            if None in (vid, pid, bus, dclass):
+                continue
+            tempDict = {}
+            tempDict["type"] = "usb3"
+            tempDict["vid"] = str(int(vid, 16))
+            tempDict["pid"] = str(int(pid, 16))
+            tempDict["bus"] = str(int(bus))
+            speed = SYSFS_SPEED.get(read_attr(path, "speed"), 0)
+            if name.startswith("usb"):
+                tempDict["path"] = usbenumall.topology_path(int(bus))
+                tempDict["speed"] = speed
+                tempDict["ifc"] = ""
+                hc_list.append(tempDict)
+                continue
+            ports = tuple(int(p) for p in name.split("-", 1)[1].split("."))
+            tempDict["path"] = usbenumall.topology_path(int(bus), ports)
+            if int(dclass, 16) == 9:
+                tempDict["speed"] = speed
+                hub_list.append(tempDict)
+            else:
+                tempDict["mport"] = str(ports)
+                tempDict["port"] = str(ports[-1])
+                tempDict["speed"] = speed
+                per_list.append(tempDict)
+            try:
+                tempDict["ifc"] = self.get_interface_classes(
+                    path, interfaces.get(name, []))
+            except (TypeError, ValueError):
+                print("Error")
+
+        self.usb_type_dict["host"] = len(hc_list)
+        self.usb_type_dict["hub"] = len(hub_list)
+        self.usb_type_dict["peri"] = len(per_list)
+
+        self.usb_list = self.intern_devices(hc_list + hub_list + per_list)
+
+    def get_interface_classes(self, path, ifnames):
+        """
+        Read the interface classes of a device.
+
+        Description:
+            sysfs lists the interfaces of the active configuration.
+
+        Args:
+            path (str): Device directory.
+            ifnames (list): Interface directory names of the device.
+
+        Returns:
+            list:
+                Class of each interface, indexed by interface number.
+        """
+        sclist = list(range(int(read_attr(path, "bNumInterfaces"))))
+        for ifname in ifnames:
+            ifpath = os.path.join(self.root, ifname)
+            ifno = int(read_attr(ifpath, "bInterfaceNumber"), 16)
+            if ifno < len(sclist):
+                sclist[ifno] = int(read_attr(ifpath, "bInterfaceClass"), 16)
+        return sclist
+
+def benchmark(rounds=20):
+    """
+    Compare the USB3 scan time of the sysfs and pyusb enumerators.
+
+    Args:
+        rounds (int): Scans per enumerator.
+
+    Returns:
+        dict:
+            Average seconds per scan of each enumerator,
+            and whether both found the same devices.
+    """
+    results = {}
+    lists = {}
+    for name, enum in (("sysfs", LinuxSysfsUSBDeviceEnumerator()),
+                       ("pyusb", linuxusbenum.LinuxUSBDeviceEnumerator())):
+        tstart = time.perf_counter()
+        for _ in range(rounds):
+            enum.enumerate_usb3_devices()
+        results[name] = (time.perf_counter() - tstart) / rounds
+        lists[name] = sorted(repr(sorted(d.items()))
+                             for d in enum.usb_list)
+    results["match"] = lists["sysfs"] == lists["pyusb"]
+    return results
+
+if __name__ == "__main__":
+    res = benchmark()
+    print("sysfs: %.2f ms per scan" % (res["sysfs"] * 1000))
+    print("pyusb: %.2f ms per scan" % (res["pyusb"] * 1000))
+    print("Same devices" if res["match"] else "Device lists differ")
@@ -16,12 +16,19 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Kernel uevent hotplug watcher
+#         Single-pass libusb enumeration
+#         USB4 devices from sysfs, boltctl parsed without jq
+#         Topology path of every device
+#
 ##############################################################################
 
 # Built-in imports
 import os
 import re
 import copy
+import subprocess
 
 # Lib imports
 import usb.util
@@ -29,10 +36,23 @@ from usb.backend import libusb1
 
 # Own modules
 from . import usbenumall
+from . import linuxhotplug
 
 ##############################################################################
 # Utilities
 ##############################################################################
+
+SYSFS_THUNDERBOLT_DEVICES = "/sys/bus/thunderbolt/devices"
+
+# sysfs generation to the name `boltctl` prints
+TB_GENERATION = {"1": "Thunderbolt 1", "2": "Thunderbolt 2",
+                 "3": "Thunderbolt 3", "4": "USB4"}
+
+# Tree drawing of `boltctl` output, UTF-8 or ASCII
+TREE_GLYPHS = " \u2502\u251c\u2514\u2500\u25cf|`-*"
+
+BOLTCTL_TIMEOUT = 5
+
 class LinuxUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
     """
     Summary:
@@ -69,6 +89,10 @@ class LinuxUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
         self.pwd = None
         self.usb4tb_json = None
         self.usb4tb_list = []
+        self.hotplug = None
+        self.hotplug_failed = False
+        self.usb4tb_cache = None
+        self.device_records = {}
         
     def set_login_credentials(self, uname, pwd):
         """
@@ -87,6 +111,28 @@ class LinuxUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
         """
         pass
 
+    def get_hotplug_watcher(self):
+        """
+        Get the USB hotplug watcher.
+
+        Description:
+            Starts the kernel uevent watcher on first use.
+
+        Args:
+            None
+
+        Returns:
+            HotplugWatcher | None:
+                Running watcher, None if netlink is not available.
+        """
+        if self.hotplug is None and not self.hotplug_failed:
+            try:
+                self.hotplug = linuxhotplug.HotplugWatcher()
+                self.hotplug.start()
+            except OSError:
+                self.hotplug_failed = True
+        return self.hotplug
+
     def enumerate_usb_devices(self):
         """
         Enumerate USB devices.
@@ -115,6 +161,11 @@ class LinuxUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
             - Hubs
             - Peripherals
 
+            The bus is walked once, interface classes are read
+            from the descriptors of each device object instead of
+            looking the device up again by VID/PID, so identical
+            devices keep their own interface classes.
+
         Args:
             None
 
@@ -127,100 +178,76 @@ class LinuxUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
         hub_list = []
         #List connected peripheral
         per_list = []
-        master_list = []
-        masterDict = {}
         backend = None
         
         usb_devices = usb.core.find(find_all=True, backend=backend) 
 
         # Here attached a list of Host controlloers, list of Hub,
-        # List of periperals info with specific vid, pid.
+        # List of periperals info, keyed by bus and port path.
         for d in usb_devices:  # Device object
+            tempDict = {}
+            tempDict["type"] = "usb3"
+            tempDict["vid"] = str(d.idVendor)
+            tempDict["pid"] = str(d.idProduct)
+            tempDict["bus"] = str(d.bus)
+            tempDict["path"] = usbenumall.topology_path(d.bus, d.port_numbers)
             if(d.bDeviceClass == 9 and d.port_number == 0):
-                tempDict = {}
-                tempDict["type"] = "usb3"
-                tempDict["vid"] = str(d.idVendor)
-                tempDict["pid"] = str(d.idProduct)
-                tempDict["bus"] = str(d.bus)
                 tempDict["speed"]= d.speed
                 tempDict["ifc"]= ""
                 hc_list.append(tempDict)
-            elif(d.bDeviceClass == 9 and d.port_number != 0):
-                tempDict = {}
-                tempDict["type"] = "usb3"
-                tempDict["vid"] = str(d.idVendor)
-                tempDict["pid"] = str(d.idProduct)
-                tempDict["bus"] = str(d.bus)
+                continue
+            if(d.bDeviceClass == 9):
                 tempDict["speed"]= d.speed
                 hub_list.append(tempDict)
             else:
-                tempDict = {}
-                tempDict["type"] = "usb3"
-                tempDict["vid"] = str(d.idVendor)
-                tempDict["pid"] = str(d.idProduct)
-                tempDict["bus"] = str(d.bus)
                 tempDict["mport"] = str(d.port_numbers)
                 tempDict["port"] = str(d.port_number)
                 tempDict["speed"]= d.speed
                 per_list.append(tempDict)
-                    
-        masterDict["host"] = hc_list
-        masterDict["hub"] = hub_list
-        masterDict["peri"] = per_list
-
-        hdata = masterDict.get("hub")
-
-        for items in hdata:
             try:
-                # Find our device 
-                dl = usb.core.find(idVendor=int(items.get("vid")), 
-                                idProduct=int(items.get("pid")), 
-                                backend=backend)
-                for cfg in dl:
-                    sclist = list(range(cfg.bNumInterfaces))
-                    for i in cfg:
-                        sclist[i.bInterfaceNumber] = i.bInterfaceClass
-                    items["ifc"] = sclist
-            except:
+                tempDict["ifc"] = self.get_interface_classes(d)
+            except Exception:
                 # Print message
                 print("Error")
-
-        pdata = masterDict.get("peri")
-        
-        for items in pdata:
-            try:
-                # Find our device 
-                dl = usb.core.find(idVendor=int(items.get("vid")), 
-                                idProduct=int(items.get("pid")), 
-                                backend=backend)
-                for cfg in dl:
-                    sclist = list(range(cfg.bNumInterfaces))
-                    for i in cfg:
-                        sclist[i.bInterfaceNumber] = i.bInterfaceClass
-                    items["ifc"] = sclist
-            except:
-                # Print message
-                print("Error")
-        for i in range(len(hc_list)):
-            master_list.append(hc_list[i])
-        for i in range(len(hub_list)):
-            master_list.append(hub_list[i])
-        for i in range(len(per_list)):
-            master_list.append(per_list[i])
         
         self.usb_type_dict["host"] = len(hc_list)
         self.usb_type_dict["hub"] = len(hub_list)
         self.usb_type_dict["peri"] = len(per_list)
 
-        self.usb_list = copy.deepcopy(master_list)
+        self.usb_list = self.intern_devices(hc_list + hub_list + per_list)
+
+    def get_interface_classes(self, dev):
+        """
+        Read the interface classes of a device.
+
+        Description:
+            Uses the configuration descriptors libusb already
+            holds for the device, the device is not opened.
+
+        Args:
+            dev: pyusb Device object.
+
+        Returns:
+            list:
+                Class of each interface, indexed by interface
+                number, of the last configuration.
+        """
+        sclist = []
+        for cfg in dev:
+            sclist = list(range(cfg.bNumInterfaces))
+            for i in cfg:
+                sclist[i.bInterfaceNumber] = i.bInterfaceClass
+        return sclist
     
     def enumerate_usb4tb_devices(self):
         """
         Enumerate USB4 / Thunderbolt devices.
 
         Description:
-            Uses `boltctl` command-line utility to gather
-            Thunderbolt device topology and speed details.
+            Reads the Thunderbolt devices from sysfs, the parsed
+            list is cached and only read again when devices were
+            added or removed. Without sysfs the `boltctl` output
+            is parsed in-process.
 
         Args:
             None
@@ -228,29 +255,110 @@ class LinuxUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
         Returns:
             None
         """
-        usb4tb_data = self.run_boltctl_command()
-
-        mydata = usb4tb_data.replace('"','')
-        mydata = mydata.replace('|','')
-
-        entries = mydata.split("\\n\\n")
-
-        dev_list = []
-
-        for entry in entries:
-            # dev_list.append(self.find_device(entry))
-            res = self.find_device(entry)
-            if res != None:
-                dev_list.append(res)
+        if os.path.isdir(SYSFS_THUNDERBOLT_DEVICES):
+            dev_list = self.read_thunderbolt_sysfs()
+        else:
+            dev_list = self.read_boltctl_devices()
 
-        self.usb4tb_list = copy.deepcopy(dev_list)
+        self.usb4tb_list = self.intern_devices(copy.deepcopy(dev_list),
+                                                "usb4")
 
         self.usb4tb_json = {}
         
-        for dev in dev_list:
+        for dev in copy.deepcopy(dev_list):
             if 'uuid' in dev:
                 self.usb4tb_json[dev['uuid']] = dev
 
+    def read_thunderbolt_sysfs(self):
+        """
+        Read Thunderbolt devices from sysfs.
+
+        Description:
+            Lists the same devices as `boltctl`, the host
+            routers are left out.
+
+        Args:
+            None
+
+        Returns:
+            list:
+                USB4 device dictionaries, see extract_json().
+        """
+        try:
+            names = sorted(os.listdir(SYSFS_THUNDERBOLT_DEVICES))
+        except OSError:
+            names = []
+        # A router name stays when the device behind a port is swapped,
+        # the unique_id changes
+        ids = []
+        for name in names:
+            try:
+                with open(os.path.join(SYSFS_THUNDERBOLT_DEVICES, name,
+                                       "unique_id")) as f:
+                    ids.append((name, f.read().strip()))
+            except OSError:
+                ids.append((name, None))
+        if self.usb4tb_cache is not None and self.usb4tb_cache[0] == ids:
+            return self.usb4tb_cache[1]
+
+        dev_list = []
+        for name in names:
+            # Routers are "<domain>-<route>", route 0 is the host
+            if name.endswith("-0"):
+                continue
+            path = os.path.join(SYSFS_THUNDERBOLT_DEVICES, name)
+            try:
+                with open(os.path.join(path, "uevent")) as f:
+                    if "DEVTYPE=thunderbolt_device" not in f.read():
+                        continue
+            except OSError:
+                continue
+            attrs = {}
+            for attr in ("device_name", "vendor_name", "unique_id",
+                         "generation", "rx_speed", "rx_lanes",
+                         "tx_speed", "tx_lanes"):
+                try:
+                    with open(os.path.join(path, attr)) as f:
+                        attrs[attr] = f.read().strip()
+                except OSError:
+                    attrs[attr] = ""
+            if not attrs["unique_id"]:
+                continue
+            key_value_pairs = {}
+            key_value_pairs['name'] = attrs["device_name"]
+            key_value_pairs['uuid'] = attrs["unique_id"]
+            key_value_pairs['type'] = "peripheral"
+            key_value_pairs['vendor'] = attrs["vendor_name"]
+            key_value_pairs['generation'] = TB_GENERATION.get(
+                attrs["generation"], attrs["generation"])
+            key_value_pairs['rx speed'] = self.format_link_speed(
+                attrs["rx_speed"], attrs["rx_lanes"])
+            key_value_pairs['tx speed'] = self.format_link_speed(
+                attrs["tx_speed"], attrs["tx_lanes"])
+            dev_list.append(self.extract_json(key_value_pairs, name))
+
+        self.usb4tb_cache = (ids, dev_list)
+        return dev_list
+
+    def format_link_speed(self, speed, lanes):
+        """
+        Format a link speed the way `boltctl` prints it.
+
+        Args:
+            speed (str): Lane speed from sysfs, e.g. "20.0 Gb/s".
+            lanes (str): Number of lanes from sysfs.
+
+        Returns:
+            str:
+                e.g. "40 Gb/s = 2 lanes * 20 Gb/s", empty if
+                the kernel does not report the speed.
+        """
+        try:
+            gbps = int(float(speed.split()[0]))
+            nlanes = int(lanes)
+        except (IndexError, ValueError):
+            return ""
+        return "%d Gb/s = %d lanes * %d Gb/s" % (gbps * nlanes, nlanes, gbps)
 
     def get_result(self):
         """
@@ -269,14 +377,32 @@ class LinuxUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
         """
         return {"usb3type": self.usb_type_dict, "usb3list": self.usb_list, "usb4tbjson": self.usb4tb_json, "usb4tblist": self.usb4tb_list}
 
+    def read_boltctl_devices(self):
+        """
+        Read Thunderbolt devices from `boltctl`.
+
+        Args:
+            None
+
+        Returns:
+            list:
+                USB4 device dictionaries, empty if `boltctl`
+                is not available.
+        """
+        dev_list = []
+        for entry in re.split(r'\n\s*\n', self.run_boltctl_command()):
+            res = self.find_device(entry)
+            if res != None:
+                dev_list.append(res)
+        return dev_list
 
     def find_device(self, gistr):
         """
         Parse device entry.
 
         Description:
-            Extracts Thunderbolt device details from
-            formatted command output string.
+            Extracts Thunderbolt device details from one
+            device entry of the `boltctl` output.
 
         Args:
             gistr (str):
@@ -287,57 +413,42 @@ class LinuxUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
                 Parsed device dictionary if found,
                 otherwise None.
         """
-        
-        pattern = re.compile(r'\*\s(.*?)(?=\\n)')
+        # Create a dictionary to store key-value pairs
+        key_value_pairs = {}
 
-        matches = pattern.findall(gistr)
+        # Process each line, tree glyphs are stripped from the key
+        for line in gistr.splitlines():
+            key, sep, value = line.partition(':')
+            if sep:
+                key_value_pairs[key.strip(TREE_GLYPHS)] = value.strip()
 
-        if matches:
-            desc = matches[0].strip()
-            return self.extract_json(desc, gistr)
- 
-        else:
-            print("Pattern not found.")
+        try:
+            return self.extract_json(key_value_pairs)
+        except KeyError:
             return None
 
-   
-    def extract_json(self, desc, gistr):
+    def extract_json(self, key_value_pairs, path=None):
         """
         Extract structured device data.
 
         Description:
-            Converts parsed string data into structured
+            Converts device properties into structured
             dictionary format containing device metadata.
 
         Args:
-            desc (str):
-                Device description.
-            gistr (str):
-                Raw key-value formatted string.
+            key_value_pairs (dict):
+                Device properties named as `boltctl` prints them.
+            path (str):
+                sysfs device name, the uuid is used without it.
 
         Returns:
             dict:
                 Structured USB4 device information.
-        """
-        lines = gistr.split('\\n')
-
-        # Create a dictionary to store key-value pairs
-        key_value_pairs = {}
-
-        # Process each line
-        for line in lines:
-            # Split each line into key and value
-            parts = line.split(':')
-
-            # Ensure there are at least two parts (key and value)
-            if len(parts) >= 2:
-                # Strip leading and trailing spaces from key and value
-                key = parts[0].strip()
-                value = ':'.join(parts[1:]).strip()
-
-                # Add to the dictionary
-                key_value_pairs[key] = value
 
+        Raises:
+            KeyError:
+                If a property is missing.
+        """
         uuid = key_value_pairs['uuid'].split('-', 3)[:-1]
 
         final_dict = {}
@@ -349,24 +460,24 @@ class LinuxUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
         final_dict['generation'] = key_value_pairs['generation']
         final_dict['rx speed'] = key_value_pairs['rx speed']
         final_dict['tx speed'] = key_value_pairs['tx speed']
+        final_dict['path'] = path or key_value_pairs['uuid']
 
         return final_dict
     
     def run_boltctl_command(self):
         """
-        Execute boltctl scan command.
-
-        Description:
-            Runs system command to retrieve formatted
-            Thunderbolt device information.
+        Execute boltctl list command.
 
         Args:
             None
 
         Returns:
             str:
-                Formatted command output string.
+                Command output, empty if `boltctl` failed.
         """
-        # Run the boltctl command and capture the output
-        with os.popen('boltctl | jq -R -s -c \'split("\\n\n")[:-1] | map(gsub("^\\\\s*[-|]+\\\\s*"; "") | gsub("\\\\|-"; "")) | join("\\n\\n")\'') as pipe:
-            return pipe.read()
+        try:
+            res = subprocess.run(["boltctl", "list"], capture_output=True,
+                                 text=True, timeout=BOLTCTL_TIMEOUT)
+        except (OSError, subprocess.SubprocessError):
+            return ""
+        return res.stdout
@@ -16,6 +16,9 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Topology path of every device
+#
 ##############################################################################
 
 # Built-in imports
@@ -66,6 +69,7 @@ class MacOSUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
             None
         """
         self.usb_type_dict = {}
+        self.device_records = {}
         self.usb_list = []
 
         self.usb4tb_json = None
@@ -165,6 +169,7 @@ class MacOSUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
                 tempDict["vid"] = str(d.idVendor)
                 tempDict["pid"] = str(d.idProduct)
                 tempDict["bus"] = str(d.bus)
+                tempDict["path"] = usbenumall.topology_path(d.bus, d.port_numbers)
                 tempDict["speed"]= d.speed
                 tempDict["ifc"]= ""
                 hc_list.append(tempDict)
@@ -174,6 +179,7 @@ class MacOSUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
                 tempDict["vid"] = str(d.idVendor)
                 tempDict["pid"] = str(d.idProduct)
                 tempDict["bus"] = str(d.bus)
+                tempDict["path"] = usbenumall.topology_path(d.bus, d.port_numbers)
                 tempDict["speed"]= d.speed
                 hub_list.append(tempDict)
             else:
@@ -182,6 +188,7 @@ class MacOSUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
                 tempDict["vid"] = str(d.idVendor)
                 tempDict["pid"] = str(d.idProduct)
                 tempDict["bus"] = str(d.bus)
+                tempDict["path"] = usbenumall.topology_path(d.bus, d.port_numbers)
                 tempDict["mport"] = str(d.port_numbers)
                 tempDict["port"] = str(d.port_number)
                 tempDict["speed"]= d.speed
@@ -249,7 +256,7 @@ class MacOSUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
         self.usb_type_dict["hub"] = len(hub_list)
         self.usb_type_dict["peri"] = len(per_list)
 
-        self.usb_list = copy.deepcopy(master_list)
+        self.usb_list = self.intern_devices(copy.deepcopy(master_list))
 
     # Enumerate USB4 TB devices
     def enumerate_usb4tb_devices(self):
@@ -285,7 +292,7 @@ class MacOSUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
             for i in range(len(tbbus)):
                 self.handleBusTree(tbbus[i], tblist)
         
-        self.usb4tb_dict = copy.deepcopy(tblist)
+        self.usb4tb_dict = self.intern_devices(copy.deepcopy(tblist), "usb4")
         
 
     def handleBusTree(self, gbus, tblist):
@@ -343,6 +350,7 @@ class MacOSUSBDeviceEnumerator(usbenumall.USBDeviceEnumerator):
             bdict['deviceName'] = gbus['device_name_key']
             bdict['vendorName'] = gbus['vendor_name_key']
             bdict['tid'] = gbus['route_string_key']
+            bdict['path'] = bdict['tid']
 
             for stag in speed_tag:
                 if stag in gbus:
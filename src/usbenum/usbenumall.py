@@ -16,6 +16,11 @@
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Optional hotplug watcher per OS enumerator
+#         Selectable enumerator backend, sysfs on Linux
+#         Topology path of every device, records reused across scans
+#
 ##############################################################################
 # Built-in imports
 import sys
@@ -74,6 +79,75 @@ class USBDeviceEnumerator:
         """
         raise NotImplementedError("Subclasses must implement enumerate_usb_devices")
 
+    def intern_devices(self, devlist, dtype="usb3"):
+        """
+        Reuse the device records of the last scan.
+
+        Description:
+            A device found at the same topology path with the same
+            details gets the record object of the last scan, so
+            unchanged devices compare by identity. The records are
+            kept per device type in self.device_records, which
+            subclasses create.
+
+        Args:
+            devlist (list): Device dicts with a "path" key.
+            dtype (str): "usb3" or "usb4".
+
+        Returns:
+            list: devlist, with unchanged records replaced.
+        """
+        last = self.device_records.get(dtype, {})
+        records = {}
+        for i, dev in enumerate(devlist):
+            old = last.get(dev.get("path"))
+            if old == dev:
+                devlist[i] = old
+            records[dev.get("path")] = devlist[i]
+        self.device_records[dtype] = records
+        return devlist
+
+    def get_hotplug_watcher(self):
+        """
+        Get the USB hotplug watcher.
+
+        Description:
+            Subclasses return a running watcher if the operating
+            system reports USB add/remove events, callers fall
+            back to a fixed enumeration delay otherwise.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        return None
+
+
+def topology_path(bus, ports=None):
+    """
+    Stable topology path of a USB device.
+
+    Description:
+        The bus number and the chain of hub ports to the device,
+        e.g. "1-2.3" for port 3 of the hub on root port 2 of bus 1,
+        the bus number alone for the root hub. The path does not
+        change between scans, identical devices on different ports
+        get different paths.
+
+    Args:
+        bus (int): Bus number.
+        ports (tuple): Port numbers from the root hub, None or
+            empty for the root hub.
+
+    Returns:
+        str: Topology path.
+    """
+    if not ports:
+        return sys.intern(str(bus))
+    return sys.intern(str(bus) + "-" + ".".join(str(p) for p in ports))
+
 
 # Import OS-dependent classes
 if sys.platform == 'win32':
@@ -85,16 +159,23 @@ elif sys.platform == 'darwin':
 else:
     raise NotImplementedError(f"Platform '{sys.platform}' not supported")
 
-def create_usb_device_enumerator():
+# Enumerator backends, None or BACKEND_DEFAULT selects the OS enumerator
+BACKEND_DEFAULT = "default"
+BACKEND_SYSFS = "sysfs"
+
+def create_usb_device_enumerator(backend=None):
     """
     Create USB Device Enumerator instance.
 
     Description:
         Creates and returns an OS-specific USB device enumerator
         instance based on the current platform.
+        BACKEND_SYSFS selects the Linux enumerator reading sysfs
+        instead of libusb, other platforms or a system without
+        sysfs get the OS enumerator.
 
     Args:
-        None
+        backend (str): BACKEND_DEFAULT or BACKEND_SYSFS.
 
     Returns:
         OS_USBDeviceEnumerator:
@@ -103,8 +184,16 @@ def create_usb_device_enumerator():
     Raises:
         NotImplementedError:
             If the current platform is not supported.
+        ValueError:
+            If the backend is unknown.
     """
+    if backend not in (None, BACKEND_DEFAULT, BACKEND_SYSFS):
+        raise ValueError(f"Unknown USB enumerator backend '{backend}'")
     if sys.platform == 'win32' or sys.platform == 'linux' or sys.platform == 'darwin':
+        if backend == BACKEND_SYSFS and sys.platform == 'linux':
+            from .linuxsysfsenum import LinuxSysfsUSBDeviceEnumerator
+            if LinuxSysfsUSBDeviceEnumerator.is_available():
+                return LinuxSysfsUSBDeviceEnumerator()
         return OS_USBDeviceEnumerator()
     else:
-        raise NotImplementedError(f"Platform '{sys.platform}' not supported")
\ No newline at end of file
+        raise NotImplementedError(f"Platform '{sys.platform}' not supported")
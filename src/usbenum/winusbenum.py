@@ -13,6 +13,9 @@
 # Revision history:
 #     V4.7.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
+#
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Topology path of every device
 ##############################################################################
 
 # Built-in imports
@@ -28,7 +31,7 @@ from usb.backend import libusb1
 import websocket
 
 # Own modules
-from .usbenumall import USBDeviceEnumerator
+from .usbenumall import USBDeviceEnumerator, topology_path
 
 EADR = 'EvtAddDeviceRouter'
 ERDR = 'EvtRemoveDeviceRouter'
@@ -94,6 +97,7 @@ class WindowsUSBDeviceEnumerator(USBDeviceEnumerator):
             None
         """
         self.usb_type_dict = {}
+        self.device_records = {}
         self.usb_list = []
         self.start_time = None
         self.end_time = None
@@ -345,6 +349,7 @@ class WindowsUSBDeviceEnumerator(USBDeviceEnumerator):
                         mydict["pid"] = str(usb4e[i][PID])
                         mydict["mname"] = usb4e[i][MODEL]
                         mydict["tid"] = usb4e[i][TID]
+                        mydict["path"] = str(usb4e[i][TID])
                         # mydict["ufp"] = usb4e[i]["ufp"]
                         ufpdict = usb4e[i]['ufp']
                         
@@ -417,6 +422,7 @@ class WindowsUSBDeviceEnumerator(USBDeviceEnumerator):
                 tempDict["vid"] = str(d.idVendor)
                 tempDict["pid"] = str(d.idProduct)
                 tempDict["bus"] = str(d.bus)
+                tempDict["path"] = topology_path(d.bus, d.port_numbers)
                 tempDict["speed"]= d.speed
                 tempDict["ifc"]= ""
                 hc_list.append(tempDict)
@@ -426,6 +432,7 @@ class WindowsUSBDeviceEnumerator(USBDeviceEnumerator):
                 tempDict["vid"] = str(d.idVendor)
                 tempDict["pid"] = str(d.idProduct)
                 tempDict["bus"] = str(d.bus)
+                tempDict["path"] = topology_path(d.bus, d.port_numbers)
                 tempDict["speed"]= d.speed
                 hub_list.append(tempDict)
             else:
@@ -434,6 +441,7 @@ class WindowsUSBDeviceEnumerator(USBDeviceEnumerator):
                 tempDict["vid"] = str(d.idVendor)
                 tempDict["pid"] = str(d.idProduct)
                 tempDict["bus"] = str(d.bus)
+                tempDict["path"] = topology_path(d.bus, d.port_numbers)
                 tempDict["mport"] = str(d.port_numbers)
                 tempDict["port"] = str(d.port_number)
                 tempDict["speed"]= d.speed
@@ -486,4 +494,4 @@ class WindowsUSBDeviceEnumerator(USBDeviceEnumerator):
         self.usb_type_dict["hub"] = len(hub_list)
         self.usb_type_dict["peri"] = len(per_list)
 
-        self.usb_list = copy.deepcopy(master_list)
\ No newline at end of file
+        self.usb_list = self.intern_devices(copy.deepcopy(master_list))
\ No newline at end of file
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+# Module: vaSampler.py
+#
+# Description:
+#     VBUS volts/amps sampling of a local switch off the UI thread.
+#
+#     A sampler thread per switch reads volts and amps back to back
+#     and records every sample with its monotonic time. The VBUS chart
+#     takes the samples from the queue, so its time axis is the real
+#     sampling time and the UI thread never waits for the serial port.
+#
+# Author:
+#     Vinay N, MCCI Corporation Feb 2026
+#
+# Revision history:
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+# Built-in imports
+import collections
+import threading
+import time
+
+# Own modules
+import devControl as model
+
+# Samples kept for the chart, about 100 sec at VA_STREAM_RATE
+VA_QUEUE_SIZE = 2000
+
+##############################################################################
+# Utilities
+##############################################################################
+def create_va_queue():
+    """
+    Create the queue the samplers put their samples in.
+
+    Description:
+        A deque appends and pops atomically, so the samplers and
+        the chart share it without a lock. When the chart does not
+        take the samples the oldest are dropped.
+
+    Args:
+        None
+
+    Returns:
+        collections.deque: empty sample queue
+    """
+    return collections.deque(maxlen=VA_QUEUE_SIZE)
+
+class VaSampler(threading.Thread):
+    """Samples volts and amps of one local switch"""
+    def __init__(self, top, swid, rate, parse_volts, parse_amps):
+        """
+        VaSampler with init method
+        Args:
+            self:The self parameter is a reference to the current
+            instance of the class,and is used to access variables
+            that belongs to the class.
+            top: main application, top.va_samples is the sample queue
+            swid: Switch ID of the switch
+            rate: sampling rate in Hz
+            parse_volts: volts reply to float or None, for the model
+            parse_amps: amps reply to float or None, for the model
+        Returns:
+            None
+        """
+        super(VaSampler, self).__init__(name="VaSampler-" + str(swid),
+                                        daemon=True)
+        self.top = top
+        self.swid = swid
+        self.period = 1.0 / rate
+        self.parse_volts = parse_volts
+        self.parse_amps = parse_amps
+        self.reply = None
+        self.error = None
+        self._running = True
+
+    def stop(self):
+        """
+        stop the sampler
+        Args:
+            self:The self parameter is a reference to the current
+            instance of the class,and is used to access variables
+            that belongs to the class.
+        Returns:
+            None
+        """
+        self._running = False
+
+    def run(self) -> None:
+        """
+        Sample back to back at the requested rate. Every sample is
+        (monotonic seconds, volts, amps), a value that can not be
+        read is None. The newest replies are kept in self.reply for
+        the switch window labels.
+        Args:
+            self:The self parameter is a reference to the current
+            instance of the class,and is used to access variables
+            that belongs to the class.
+        Returns:
+            None
+        """
+        tnext = time.monotonic()
+        while self._running:
+            try:
+                with model.switch_lock(self.swid):
+                    handler = self.top.handlers[self.swid]
+                    tsamp = time.monotonic()
+                    vreply = handler.get_volts()
+                    areply = handler.get_amps()
+            except Exception as err:
+                # Switch disconnected or not responding
+                self.error = err
+                break
+            self.reply = (vreply, areply)
+            self.top.va_samples.append((tsamp,
+                                        self.parse_volts(vreply),
+                                        self.parse_amps(areply)))
+            now = time.monotonic()
+            tnext += self.period
+            if tnext > now:
+                time.sleep(tnext - now)
+            else:
+                tnext = now
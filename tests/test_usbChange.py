@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+# Module: test_usbChange.py
+#
+# Description:
+#     Tests of the device list comparison of usbChange.
+#
+# Author:
+#     Vinay N, MCCI Corporation Feb 2026
+#
+# Revision history:
+#     V4.9.0 Sun Oct 18 2026 17:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+# Built-in imports
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir, "src"))
+
+# Own modules
+import usbChange
+
+def usb3_dev(path, speed="super"):
+    """Device record of a Test Host with topology paths"""
+    return {"type": "usb3", "path": path, "vid": "040e", "pid": "f413",
+            "name": "MCCI Model 3141", "speed": speed}
+
+def legacy_dev(name):
+    """Device record of an older Test Host, without a path"""
+    return {"vid": "040e", "pid": "f413", "name": name}
+
+class TestGetListChange(unittest.TestCase):
+    """get_list_change() on lists with duplicate devices"""
+    def test_one_of_two_identical_removed(self):
+        olddev = [legacy_dev("Hub"), legacy_dev("Hub")]
+        change = usbChange.get_list_change(olddev, [legacy_dev("Hub")])
+        self.assertEqual(change["added"], [])
+        self.assertEqual(change["removed"], [legacy_dev("Hub")])
+
+    def test_one_of_two_identical_added(self):
+        change = usbChange.get_list_change([legacy_dev("Hub")],
+                                           [legacy_dev("Hub")] * 2)
+        self.assertEqual(change["added"], [legacy_dev("Hub")])
+        self.assertEqual(change["removed"], [])
+
+    def test_identical_devices_on_two_ports(self):
+        olddev = [usb3_dev("1-1"), usb3_dev("1-2")]
+        change = usbChange.get_list_change(olddev, [usb3_dev("1-1")])
+        self.assertEqual(change["added"], [])
+        self.assertEqual(change["removed"], [usb3_dev("1-2")])
+
+    def test_device_moved_to_other_port(self):
+        change = usbChange.get_list_change([usb3_dev("1-1")],
+                                           [usb3_dev("1-2")])
+        self.assertEqual(change["added"], [usb3_dev("1-2")])
+        self.assertEqual(change["removed"], [usb3_dev("1-1")])
+
+    def test_speed_change_seen(self):
+        change = usbChange.get_list_change([usb3_dev("1-1")],
+                                           [usb3_dev("1-1", "high")])
+        self.assertEqual(change["added"], [usb3_dev("1-1", "high")])
+        self.assertEqual(change["removed"], [usb3_dev("1-1")])
+
+    def test_unchanged(self):
+        devs = [usb3_dev("1-1"), legacy_dev("Hub"), legacy_dev("Hub")]
+        change = usbChange.get_list_change(devs, list(reversed(devs)))
+        self.assertEqual(change, {"added": [], "removed": []})
+
+class TestDeviceKey(unittest.TestCase):
+    """device_key() of records with and without a path"""
+    def test_without_path_uses_all_fields(self):
+        self.assertEqual(usbChange.device_key(legacy_dev("Hub")),
+                         usbChange.device_key(dict(legacy_dev("Hub"))))
+        self.assertNotEqual(usbChange.device_key(legacy_dev("Hub")),
+                            usbChange.device_key(legacy_dev("Dock")))
+
+    def test_without_path_nested_values(self):
+        dev = legacy_dev("Hub")
+        dev["ports"] = [{"no": 1}, {"no": 2}]
+        hash(usbChange.device_key(dev))
+
+    def test_usb4_by_uuid(self):
+        dock = {"type": "usb4", "path": "0-1", "vid": "8087",
+                "pid": "0b26", "name": "Dock", "uuid": "a", "hwid": "1"}
+        other = dict(dock, uuid="b")
+        self.assertNotEqual(usbChange.device_key(dock),
+                            usbChange.device_key(other))
+
+if __name__ == '__main__':
+    unittest.main()